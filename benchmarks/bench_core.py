@@ -0,0 +1,141 @@
+import argparse
+import gc
+import sys
+import tempfile
+from pathlib import Path
+from typing import List
+
+from benchmarks.bench_report import BenchReport
+from benchmarks.project_generator import ProjectGenerator
+from core.managers.bug_manager import BugManager
+from core.managers.task_manager import TaskManager
+from core.models.bug import Bug, BugPriority, BugStatus
+from core.models.project import Project
+from core.models.task import Task
+from core.utils.project_file_handler import ProjectFileHandler
+
+
+class CoreBenchmark:
+
+    def __init__(self, report: BenchReport, runs: int = 3, query_runs: int = 20, suffix: str = ".bugtracker.json"):
+        self.report = report
+        self.runs = runs
+        self.query_runs = query_runs
+        self.suffix = suffix
+
+    @staticmethod
+    def parse_size(text: str) -> int:
+        text = text.strip().lower().replace("_", "")
+        multipliers = {"k": 1_000, "m": 1_000_000}
+        if text and text[-1] in multipliers:
+            return int(float(text[:-1]) * multipliers[text[-1]])
+        return int(text)
+
+    def _time(self, name: str, records: int, action, runs: int = None, setup=None):
+        gc.collect()
+        samples = BenchReport.measure(action, runs or self.runs, setup)
+        return self.report.add(name, records, samples)
+
+    def run_size(self, records: int, workdir: Path, **generator_options):
+        source = workdir / f"source_{records}{self.suffix}"
+        target = workdir / f"target_{records}{self.suffix}"
+
+        generator = ProjectGenerator.for_records(records, **generator_options)
+        if generator.write(str(source)) is None:
+            print(f"Error generating project with {records} records", file=sys.stderr)
+            return
+
+        version = generator.version_names[-1]
+
+        self._time("load_project_full", records, lambda: ProjectFileHandler.load_project_full(str(source)))
+        project_data = ProjectFileHandler.load_project_full(str(source))
+        project = Project.from_dict(project_data["meta"])
+
+        self._time("task_manager_init", records, lambda: TaskManager(project_data, version))
+        self._time("bug_manager_init", records, lambda: BugManager(project_data, version))
+        task_manager = TaskManager(project_data, version)
+        bug_manager = BugManager(project_data, version)
+
+        def reset_search_index():
+            bug_manager._search_index = None
+
+        self._time("search_index_build", records, lambda _: bug_manager.search_index, setup=reset_search_index)
+
+        task_id = next(iter(task_manager.tasks))
+        queries = {
+            "all": {},
+            "status": {"status_filter": BugStatus.OPEN},
+            "priority_status": {"priority_filter": BugPriority.CRITICAL, "status_filter": BugStatus.OPEN},
+            "task": {"task_id_filter": task_id},
+            "search": {"search_text": "crash"},
+            "search_status": {"search_text": "login button", "status_filter": BugStatus.FIXED},
+        }
+        for query_name, query in queries.items():
+            self._time(
+                f"filter_bugs[{query_name}]", records,
+                lambda: bug_manager.filter_bugs(**query), self.query_runs
+            )
+
+        self._time("get_bug_statistics", records, bug_manager.get_bug_statistics, self.query_runs)
+        self._time("get_task_statistics", records, task_manager.get_task_statistics, self.query_runs)
+
+        bugs = bug_manager.get_all_bugs()
+        tasks = task_manager.get_all_tasks()
+        self._time("bug_to_dict", records, lambda: [bug.to_dict() for bug in bugs])
+        bug_dicts = [bug.to_dict() for bug in bugs]
+        self._time("bug_from_dict", records, lambda: [Bug.from_dict(data) for data in bug_dicts])
+        self._time(
+            "to_dict_round_trip", records,
+            lambda: ([Bug.from_dict(bug.to_dict()) for bug in bugs], [Task.from_dict(task.to_dict()) for task in tasks])
+        )
+
+        self._time(
+            "save_project", records,
+            lambda: ProjectFileHandler.save_project(project, str(target), project_data["versions"])
+        )
+
+    def run(self, sizes: List[int], **generator_options):
+        with tempfile.TemporaryDirectory(prefix="bugtracker_bench_") as workdir:
+            for records in sizes:
+                self.run_size(records, Path(workdir), **generator_options)
+                gc.collect()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.bench_core",
+        description="Time loading, indexing, filtering and saving on generated projects"
+    )
+    parser.add_argument("--sizes", default="1k,10k,100k,1m", help="Comma separated record counts, e.g. 1k,10k")
+    parser.add_argument("--runs", type=int, default=3, help="Repetitions for load, save and serialization")
+    parser.add_argument("--query-runs", type=int, default=20, help="Repetitions for filters and statistics")
+    parser.add_argument("--format", choices=("json", "db", "dir"), default="json", help="Storage format to benchmark")
+    parser.add_argument("--versions", type=int, default=1)
+    parser.add_argument("--comments", type=int, default=2)
+    parser.add_argument("--text-words", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", "-o", help="Write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    try:
+        sizes = [CoreBenchmark.parse_size(size) for size in args.sizes.split(",") if size.strip()]
+    except ValueError:
+        parser.error(f"invalid --sizes: {args.sizes}")
+
+    suffix = {"json": ".bugtracker.json", "db": ".bugtracker.db", "dir": ".bugtracker"}[args.format]
+    generator_options = {
+        "versions": args.versions,
+        "comments": args.comments,
+        "text_words": args.text_words,
+        "seed": args.seed
+    }
+
+    report = BenchReport("core", {"sizes": sizes, "runs": args.runs, "query_runs": args.query_runs,
+                                  "format": args.format, **generator_options})
+    CoreBenchmark(report, args.runs, args.query_runs, suffix).run(sizes, **generator_options)
+    report.write(args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import qInstallMessageHandler
+from PyQt5.QtWidgets import QApplication
+
+from benchmarks.bench_core import CoreBenchmark
+from benchmarks.bench_report import BenchReport
+from benchmarks.project_generator import ProjectGenerator
+from core.managers.project_session import ProjectSession
+from core.models.bug import BugStatus
+from core.ui.windows.developer_window import DeveloperWindow
+from core.ui.windows.tester_window import TesterWindow
+from core.utils.dark_theme import ModernDarkTheme
+
+
+class GuiBenchmark:
+
+    WINDOWS = {"developer": DeveloperWindow, "tester": TesterWindow}
+
+    def __init__(self, app: QApplication, report: BenchReport, runs: int = 5, interaction_runs: int = 20):
+        self.app = app
+        self.report = report
+        self.runs = runs
+        self.interaction_runs = interaction_runs
+
+    def _settle(self):
+        self.app.processEvents()
+
+    def _time(self, name: str, records: int, action, runs: int, setup=None):
+        gc.collect()
+
+        def settled(*args):
+            action(*args)
+            self._settle()
+
+        samples = BenchReport.measure(settled, runs, setup)
+        return self.report.add(name, records, samples)
+
+    @staticmethod
+    def _release(window):
+        window._handed_off = True
+        window.close()
+        window.deleteLater()
+
+    def _wait_for_search(self, window, timeout: float = 30.0):
+        finished = []
+        window.bug_search.results_ready.connect(finished.append)
+        try:
+            window.bug_search.run_now()
+            deadline = time.perf_counter() + timeout
+            while not finished and time.perf_counter() < deadline:
+                window.bug_search.wait_idle()
+                self._settle()
+        finally:
+            window.bug_search.results_ready.disconnect(finished.append)
+
+    def _construct(self, name: str, window_class, session: ProjectSession, records: int):
+        windows = []
+
+        def construct():
+            windows.append(window_class(session))
+
+        self._time(f"{name}.construct", records, construct, self.runs)
+        for window in windows:
+            self._release(window)
+        self._settle()
+
+    def _version_switch(self, name: str, window, session: ProjectSession, versions: List[str], records: int):
+        def reload_session():
+            window.version_combo.setCurrentText(versions[-1])
+            window._set_managers(None, None)
+            session.reload()
+
+        self._time(
+            f"{name}.version_switch_cold", records,
+            lambda _: window.version_combo.setCurrentText(versions[0]), self.runs,
+            setup=reload_session
+        )
+
+        switches = iter((versions[1:] + versions[:1]) * self.interaction_runs)
+        self._time(
+            f"{name}.version_switch", records,
+            lambda: window.version_combo.setCurrentText(next(switches)), self.interaction_runs
+        )
+        window.version_combo.setCurrentText(versions[0])
+        self._settle()
+
+    def _filters(self, name: str, window, records: int):
+        statuses = iter(["Open", "All Statuses"] * self.interaction_runs)
+        self._time(
+            f"{name}.filter_status", records,
+            lambda: window.bug_filter_status.setCurrentText(next(statuses)), self.interaction_runs
+        )
+
+        priorities = iter(["Critical", "All Priorities"] * self.interaction_runs)
+        self._time(
+            f"{name}.filter_priority", records,
+            lambda: window.bug_filter_priority.setCurrentText(next(priorities)), self.interaction_runs
+        )
+
+        searches = iter(["crash", "login button"] * self.interaction_runs)
+
+        def search():
+            window.bug_search_input.setText(next(searches))
+            self._wait_for_search(window)
+
+        self._time(f"{name}.filter_search", records, search, self.interaction_runs)
+        window._clear_bug_filters()
+        self._settle()
+
+    def _status_change(self, name: str, window, records: int):
+        bug = next(iter(window.bug_manager.bugs.values()), None)
+        if bug is None:
+            return
+
+        statuses = iter([BugStatus.FIXED, BugStatus.OPEN] * self.interaction_runs)
+        self._time(
+            f"{name}.status_change", records,
+            lambda: window._mark_bug_status(bug, next(statuses)), self.interaction_runs
+        )
+        self._time(f"{name}.refresh_bugs_table", records, window._refresh_bugs_table, self.interaction_runs)
+        self._time(f"{name}.update_statistics", records, window._update_statistics, self.interaction_runs)
+
+    def run_size(self, records: int, workdir: Path, **generator_options):
+        source = workdir / f"gui_{records}.bugtracker.json"
+        generator = ProjectGenerator.for_records(records, versions=2, **generator_options)
+        if generator.write(str(source)) is None:
+            print(f"Error generating project with {records} records", file=sys.stderr)
+            return
+
+        versions = generator.version_names
+        session = ProjectSession.open(str(source))
+        if session is None:
+            print(f"Error opening generated project: {source}", file=sys.stderr)
+            return
+
+        try:
+            for name, window_class in self.WINDOWS.items():
+                self._construct(name, window_class, session, records)
+
+                window = window_class(session)
+                window.version_combo.setCurrentText(versions[0])
+                self._settle()
+                try:
+                    self._version_switch(name, window, session, versions, records)
+                    self._filters(name, window, records)
+                    self._status_change(name, window, records)
+                finally:
+                    window.save_service.flush(session.project, session.project_data)
+                    self._release(window)
+                    self._settle()
+        finally:
+            session.close()
+
+    def run(self, sizes: List[int], **generator_options):
+        with tempfile.TemporaryDirectory(prefix="bugtracker_gui_bench_") as workdir:
+            for records in sizes:
+                self.run_size(records, Path(workdir), **generator_options)
+                gc.collect()
+
+
+def _filter_qt_messages(mode, context, message):
+    if "propagateSizeHints" not in message:
+        print(message, file=sys.stderr)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.bench_gui",
+        description="Time window construction, version switches, filters and status changes offscreen"
+    )
+    parser.add_argument("--sizes", default="1k,10k,100k", help="Comma separated record counts, e.g. 1k,10k")
+    parser.add_argument("--runs", type=int, default=5, help="Repetitions for window construction and cold switches")
+    parser.add_argument("--interaction-runs", type=int, default=20, help="Repetitions for filters and status changes")
+    parser.add_argument("--comments", type=int, default=2)
+    parser.add_argument("--text-words", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", "-o", help="Write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    try:
+        sizes = [CoreBenchmark.parse_size(size) for size in args.sizes.split(",") if size.strip()]
+    except ValueError:
+        parser.error(f"invalid --sizes: {args.sizes}")
+
+    qInstallMessageHandler(_filter_qt_messages)
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    ModernDarkTheme.apply(app)
+
+    generator_options = {"comments": args.comments, "text_words": args.text_words, "seed": args.seed}
+    report = BenchReport("gui", {
+        "sizes": sizes, "runs": args.runs, "interaction_runs": args.interaction_runs,
+        "platform": app.platformName(), **generator_options
+    })
+    GuiBenchmark(app, report, args.runs, args.interaction_runs).run(sizes, **generator_options)
+    report.write(args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
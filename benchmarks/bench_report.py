@@ -0,0 +1,151 @@
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+
+class BenchReport:
+
+    def __init__(self, suite: str, config: Optional[Dict] = None):
+        self.suite = suite
+        self.config = config or {}
+        self.results: List[Dict] = []
+
+    @staticmethod
+    def percentile(samples: List[float], fraction: float) -> float:
+        ordered = sorted(samples)
+        if not ordered:
+            return 0.0
+        position = (len(ordered) - 1) * fraction
+        lower = int(position)
+        upper = min(lower + 1, len(ordered) - 1)
+        return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+    @staticmethod
+    def summarize(samples: List[float]) -> Dict:
+        return {
+            "runs": len(samples),
+            "min": min(samples),
+            "p50": BenchReport.percentile(samples, 0.5),
+            "p90": BenchReport.percentile(samples, 0.9),
+            "p99": BenchReport.percentile(samples, 0.99),
+            "max": max(samples),
+            "mean": statistics.fmean(samples)
+        }
+
+    @staticmethod
+    def measure(action: Callable, runs: int, setup: Optional[Callable] = None) -> List[float]:
+        samples = []
+        for _ in range(runs):
+            if setup:
+                state = setup()
+                started = time.perf_counter()
+                action(state)
+            else:
+                started = time.perf_counter()
+                action()
+            samples.append(time.perf_counter() - started)
+        return samples
+
+    def add(self, name: str, records: int, samples: List[float], **extra) -> Dict:
+        result = {"name": name, "records": records, **BenchReport.summarize(samples), **extra}
+        self.results.append(result)
+        print(
+            f"{name:<32} {records:>9} records  "
+            f"p50 {result['p50'] * 1000:10.2f} ms  p90 {result['p90'] * 1000:10.2f} ms  ({len(samples)} runs)",
+            file=sys.stderr
+        )
+        return result
+
+    @staticmethod
+    def commit() -> Optional[str]:
+        try:
+            return subprocess.run(
+                ["git", "rev-parse", "HEAD"],
+                cwd=Path(__file__).resolve().parent.parent,
+                capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except Exception:
+            return None
+
+    def to_dict(self) -> Dict:
+        return {
+            "suite": self.suite,
+            "created_at": datetime.now().isoformat(),
+            "environment": {
+                "commit": BenchReport.commit(),
+                "python": platform.python_version(),
+                "implementation": platform.python_implementation(),
+                "platform": platform.platform(),
+                "machine": platform.machine()
+            },
+            "config": self.config,
+            "unit": "seconds",
+            "results": self.results
+        }
+
+    def write(self, filepath: Optional[str] = None):
+        text = json.dumps(self.to_dict(), indent=4)
+        if filepath:
+            Path(filepath).write_text(text + "\n", encoding="utf-8")
+        else:
+            print(text)
+
+    @staticmethod
+    def load(filepath: str) -> Dict:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    @staticmethod
+    def compare(baseline: Dict, current: Dict, metric: str = "p50") -> List[Dict]:
+        previous = {(r["name"], r["records"]): r for r in baseline.get("results", [])}
+        rows = []
+        for result in current.get("results", []):
+            before = previous.get((result["name"], result["records"]))
+            if before is None or not before.get(metric):
+                continue
+            rows.append({
+                "name": result["name"],
+                "records": result["records"],
+                "baseline": before[metric],
+                "current": result[metric],
+                "ratio": result[metric] / before[metric]
+            })
+        return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.bench_report",
+        description="Compare two benchmark reports"
+    )
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--metric", default="p50", choices=("min", "p50", "p90", "p99", "max", "mean"))
+    parser.add_argument("--threshold", type=float, default=1.2, help="Ratio above which a result counts as a regression")
+    args = parser.parse_args(argv)
+
+    rows = BenchReport.compare(BenchReport.load(args.baseline), BenchReport.load(args.current), args.metric)
+    regressions = 0
+    for row in rows:
+        marker = ""
+        if row["ratio"] > args.threshold:
+            marker = "  REGRESSION"
+            regressions += 1
+        print(
+            f"{row['name']:<32} {row['records']:>9}  "
+            f"{row['baseline'] * 1000:10.2f} ms -> {row['current'] * 1000:10.2f} ms  x{row['ratio']:.2f}{marker}"
+        )
+
+    print(f"{len(rows)} compared, {regressions} regression(s) above x{args.threshold:.2f}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+from benchmarks.bench_report import BenchReport
+
+
+class ImportBudget:
+
+    ROOT = Path(__file__).resolve().parent.parent
+    STARTUP_MODULE = "app"
+    DEFERRED_MODULES = (
+        "core.ui.windows.developer_window",
+        "core.ui.windows.tester_window",
+        "core.ui.dialogs.bugs",
+        "core.ui.dialogs.tasks",
+        "core.ui.dialogs.projects",
+        "core.ui.dialogs.roles",
+        "core.managers",
+        "core.utils.project_file_handler",
+    )
+
+    @staticmethod
+    def parse(output: str) -> List[Dict]:
+        modules = []
+        for line in output.splitlines():
+            if not line.startswith("import time:"):
+                continue
+
+            parts = line[len("import time:"):].split("|")
+            if len(parts) != 3 or not parts[0].strip().isdigit():
+                continue
+
+            name = parts[2][1:]
+            modules.append({
+                "name": name.strip(),
+                "depth": (len(name) - len(name.lstrip())) // 2,
+                "self": int(parts[0]) / 1_000_000,
+                "cumulative": int(parts[1]) / 1_000_000
+            })
+        return modules
+
+    @staticmethod
+    def measure(module: str = STARTUP_MODULE) -> List[Dict]:
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=ImportBudget.ROOT, capture_output=True, text=True
+        )
+        if completed.returncode != 0:
+            raise RuntimeError(completed.stderr.strip().splitlines()[-1] if completed.stderr else "import failed")
+        return ImportBudget.parse(completed.stderr)
+
+    @staticmethod
+    def total(modules: List[Dict]) -> float:
+        return sum(module["cumulative"] for module in modules if module["depth"] == 0)
+
+    @staticmethod
+    def own(modules: List[Dict]) -> float:
+        return sum(
+            module["self"] for module in modules
+            if module["name"] == ImportBudget.STARTUP_MODULE or module["name"].startswith("core.")
+        )
+
+    @staticmethod
+    def deferred_violations(modules: List[Dict]) -> List[str]:
+        return sorted({
+            module["name"] for module in modules
+            if any(module["name"] == deferred or module["name"].startswith(deferred + ".")
+                   for deferred in ImportBudget.DEFERRED_MODULES)
+        })
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.import_budget",
+        description="Check cold-start import time of the application against a budget"
+    )
+    parser.add_argument("--budget-ms", type=float, default=250.0, help="Median total import time allowed")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="Slowest modules to list")
+    parser.add_argument("--output", "-o", help="Also write a JSON report")
+    args = parser.parse_args(argv)
+
+    runs = [ImportBudget.measure() for _ in range(max(1, args.runs))]
+    totals = [ImportBudget.total(modules) for modules in runs]
+    median_run = runs[totals.index(sorted(totals)[len(totals) // 2])]
+
+    report = BenchReport("startup", {"budget_ms": args.budget_ms, "runs": len(runs)})
+    report.add("import.app", 1, totals)
+    report.add("import.app_own", 1, [ImportBudget.own(modules) for modules in runs])
+    if args.output:
+        report.write(args.output)
+
+    print("Slowest modules (self time, median run):")
+    for module in sorted(median_run, key=lambda m: m["self"], reverse=True)[:args.top]:
+        print(f"  {module['self'] * 1000:8.2f} ms  {module['name']}")
+
+    failed = False
+    median = statistics.median(totals) * 1000
+    print(f"Startup imports: median {median:.1f} ms, budget {args.budget_ms:.1f} ms")
+    if median > args.budget_ms:
+        print("FAIL: startup import time is over budget")
+        failed = True
+
+    violations = ImportBudget.deferred_violations(median_run)
+    if violations:
+        print("FAIL: modules that should load after startup were imported:")
+        for name in violations:
+            print(f"  {name}")
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,214 @@
+import argparse
+import random
+import sys
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from core.models.bug import BugPriority, BugStatus
+from core.models.project import Project
+from core.models.task import TaskPriority, TaskStatus
+from core.utils.project_file_handler import ProjectFileHandler
+
+
+class ProjectGenerator:
+
+    WORDS = (
+        "login", "button", "crash", "save", "dialog", "window", "export", "import",
+        "filter", "table", "version", "screenshot", "theme", "shortcut", "search",
+        "status", "priority", "comment", "project", "report", "layout", "scroll",
+        "freeze", "timeout", "cursor", "menu", "toolbar", "statistics", "column",
+        "error", "warning", "invalid", "missing", "slow", "wrong", "empty", "broken",
+        "after", "before", "when", "while", "user", "tester", "developer", "click",
+        "open", "close", "reload", "switch", "update", "delete", "create", "field"
+    )
+    PEOPLE = ("alice", "bob", "carol", "dave", "erin", "frank", "grace", "heidi")
+
+    BUG_STATUS_WEIGHTS = {
+        BugStatus.OPEN: 35, BugStatus.IN_PROGRESS: 15, BugStatus.FIXED: 35,
+        BugStatus.WONT_FIX: 5, BugStatus.DUPLICATE: 5, BugStatus.INVALID: 5
+    }
+    BUG_PRIORITY_WEIGHTS = {
+        BugPriority.CRITICAL: 5, BugPriority.HIGH: 20, BugPriority.MEDIUM: 50, BugPriority.LOW: 25
+    }
+    TASK_STATUS_WEIGHTS = {
+        TaskStatus.TODO: 25, TaskStatus.IN_PROGRESS: 20, TaskStatus.READY_FOR_TEST: 15,
+        TaskStatus.TESTING: 10, TaskStatus.DONE: 25, TaskStatus.BLOCKED: 5
+    }
+    TASK_PRIORITY_WEIGHTS = {
+        TaskPriority.CRITICAL: 5, TaskPriority.HIGH: 25, TaskPriority.MEDIUM: 50, TaskPriority.LOW: 20
+    }
+
+    def __init__(self,
+                 versions: int = 1,
+                 tasks: int = 100,
+                 bugs: int = 900,
+                 comments: int = 2,
+                 title_words: int = 6,
+                 text_words: int = 40,
+                 seed: int = 0):
+        self.versions = max(1, versions)
+        self.tasks = max(1, tasks)
+        self.bugs = max(0, bugs)
+        self.comments = max(0, comments)
+        self.title_words = max(1, title_words)
+        self.text_words = max(0, text_words)
+        self.seed = seed
+
+        self._random = random.Random(seed)
+        self._start = datetime(2024, 1, 1)
+
+    @staticmethod
+    def for_records(records: int, versions: int = 1, **kwargs) -> 'ProjectGenerator':
+        tasks = max(1, records // 10)
+        bugs = max(0, records - tasks)
+        return ProjectGenerator(
+            versions=versions,
+            tasks=max(1, tasks // versions),
+            bugs=bugs // versions,
+            **kwargs
+        )
+
+    @property
+    def version_names(self) -> List[str]:
+        return [f"v1.{minor}.0" for minor in range(self.versions)]
+
+    def _text(self, words: int) -> str:
+        return " ".join(self._random.choices(self.WORDS, k=words))
+
+    def _weighted(self, weights: Dict):
+        return self._random.choices(list(weights), weights=list(weights.values()))[0]
+
+    def _timestamp(self) -> str:
+        offset = timedelta(seconds=self._random.randrange(365 * 24 * 3600), microseconds=self._random.randrange(1, 10 ** 6))
+        return (self._start + offset).isoformat()
+
+    def _record_id(self, prefix: str) -> str:
+        return f"{prefix}-{self._random.getrandbits(32):08X}"
+
+    def _unique_id(self, prefix: str, taken) -> str:
+        record_id = self._record_id(prefix)
+        while record_id in taken:
+            record_id = self._record_id(prefix)
+        return record_id
+
+    def _task(self, task_id: str, version: str) -> Dict:
+        return {
+            "id": task_id,
+            "title": self._text(self.title_words).capitalize(),
+            "description": self._text(self.text_words),
+            "priority": self._weighted(self.TASK_PRIORITY_WEIGHTS).value,
+            "status": self._weighted(self.TASK_STATUS_WEIGHTS).value,
+            "created_at": self._timestamp(),
+            "version": version,
+            "test_instructions": self._text(self.text_words // 2),
+            "assigned_to": self._random.choice(self.PEOPLE),
+            "bug_ids": []
+        }
+
+    def _bug(self, bug_id: str, task_id: str) -> Dict:
+        return {
+            "id": bug_id,
+            "title": self._text(self.title_words).capitalize(),
+            "description": self._text(self.text_words),
+            "priority": self._weighted(self.BUG_PRIORITY_WEIGHTS).value,
+            "status": self._weighted(self.BUG_STATUS_WEIGHTS).value,
+            "created_at": self._timestamp(),
+            "task_id": task_id,
+            "steps_to_reproduce": self._text(self.text_words // 2),
+            "expected_result": self._text(self.text_words // 4),
+            "actual_result": self._text(self.text_words // 4),
+            "screenshot_path": "",
+            "author": self._random.choice(self.PEOPLE),
+            "assigned_to": self._random.choice(self.PEOPLE),
+            "comments": [self._comment() for _ in range(self._random.randint(0, self.comments * 2))]
+        }
+
+    def _comment(self) -> Dict:
+        return {
+            "author": self._random.choice(self.PEOPLE),
+            "text": self._text(max(1, self.text_words // 4)),
+            "created_at": self._timestamp()
+        }
+
+    def generate_version(self, version: str) -> Dict:
+        tasks = {}
+        for _ in range(self.tasks):
+            task_id = self._unique_id("TASK", tasks)
+            tasks[task_id] = self._task(task_id, version)
+
+        task_ids = list(tasks)
+        bugs = {}
+        for _ in range(self.bugs):
+            bug_id = self._unique_id("BUG", bugs)
+            task_id = self._random.choice(task_ids)
+            bugs[bug_id] = self._bug(bug_id, task_id)
+            tasks[task_id]["bug_ids"].append(bug_id)
+
+        return {"tasks": tasks, "bugs": bugs}
+
+    def generate_project(self, name: str = "Benchmark Project") -> Project:
+        project = Project(
+            name=name,
+            description=f"Generated with seed {self.seed}",
+            author="benchmarks",
+            created_at=self._start.isoformat()
+        )
+        for version in self.version_names:
+            project.add_version(version)
+        for person in self.PEOPLE:
+            project.add_developer(person)
+            project.add_tester(person)
+        return project
+
+    def generate(self, name: str = "Benchmark Project") -> Dict:
+        project = self.generate_project(name)
+        return {
+            "meta": project.to_dict(),
+            "versions": {version: self.generate_version(version) for version in self.version_names}
+        }
+
+    def write(self, filepath: str, name: str = "Benchmark Project") -> Optional[Project]:
+        project_data = self.generate(name)
+        project = Project.from_dict(project_data["meta"])
+        if not ProjectFileHandler.save_project(project, filepath, project_data["versions"]):
+            return None
+        return project
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.project_generator",
+        description="Write a synthetic Smart Bug Tracker project"
+    )
+    parser.add_argument("output", help="Target .bugtracker.json, .bugtracker.db or .bugtracker directory")
+    parser.add_argument("--records", type=int, help="Total tasks and bugs (one task per ten records)")
+    parser.add_argument("--versions", type=int, default=1)
+    parser.add_argument("--tasks", type=int, default=100, help="Tasks per version")
+    parser.add_argument("--bugs", type=int, default=900, help="Bugs per version")
+    parser.add_argument("--comments", type=int, default=2, help="Average comments per bug")
+    parser.add_argument("--title-words", type=int, default=6)
+    parser.add_argument("--text-words", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    text_options = {
+        "comments": args.comments,
+        "title_words": args.title_words,
+        "text_words": args.text_words,
+        "seed": args.seed
+    }
+    if args.records is not None:
+        generator = ProjectGenerator.for_records(args.records, args.versions, **text_options)
+    else:
+        generator = ProjectGenerator(args.versions, args.tasks, args.bugs, **text_options)
+
+    if generator.write(args.output) is None:
+        print(f"Error writing project: {args.output}", file=sys.stderr)
+        return 1
+
+    print(f"Wrote {generator.versions} version(s) x {generator.tasks} tasks, {generator.bugs} bugs to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,441 @@
+import argparse
+import json
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from core.managers.bug_manager import BugManager
+from core.managers.project_session import ProjectSession
+from core.managers.task_manager import TaskManager
+from core.models.bug import BugPriority, BugStatus
+from core.models.task import TaskPriority, TaskStatus
+from core.utils.project_file_handler import ProjectFileHandler
+from core.utils.statistics_generator import StatisticsGenerator
+
+
+class CliError(Exception):
+    pass
+
+
+class TrackerCli:
+
+    BATCH_OPERATIONS = (
+        "add_bug", "update_bug", "delete_bug", "add_comment",
+        "add_task", "update_task", "delete_task"
+    )
+
+    ENUM_FIELDS = {
+        "bug": {"priority": BugPriority, "status": BugStatus},
+        "task": {"priority": TaskPriority, "status": TaskStatus},
+    }
+
+    def __init__(self, filepath: str, version: Optional[str] = None, as_json: bool = False, out=None):
+        self.filepath = filepath
+        self.as_json = as_json
+        self.out = out or sys.stdout
+
+        self.session = ProjectSession.open(filepath)
+        if self.session is None:
+            raise CliError(f"Cannot open project: {filepath}")
+
+        self.project = self.session.project
+        self.version = self._resolve_version(version)
+
+    def _resolve_version(self, version: Optional[str]) -> Optional[str]:
+        if version is None:
+            return self.project.versions[-1] if self.project.versions else None
+        if version not in self.project.versions:
+            raise CliError(f"Unknown version: {version}")
+        return version
+
+    def _require_version(self, version: Optional[str] = None) -> str:
+        version = self._resolve_version(version) if version else self.version
+        if not version:
+            raise CliError("The project has no versions")
+        return version
+
+    def managers(self) -> Tuple[TaskManager, BugManager]:
+        return self.session.managers(self._require_version())
+
+    def close(self):
+        journal = self.session.journal
+        if journal.needs_compaction:
+            self.session.writer.wait_idle()
+            if not journal.compact(self.project, self.session.project_data):
+                raise CliError("Failed to save project")
+        self.session.close()
+
+    def _print(self, text: str = ""):
+        self.out.write(text + "\n")
+
+    def _print_json(self, data):
+        self._print(json.dumps(data, ensure_ascii=False))
+
+    @staticmethod
+    def _enum(enum_type, value: Optional[str]):
+        if value is None:
+            return None
+        try:
+            if not isinstance(value, str):
+                raise ValueError(value)
+            return enum_type(value.lower())
+        except ValueError:
+            choices = ", ".join(member.value for member in enum_type)
+            raise CliError(f"Invalid {enum_type.__name__} {value!r} (expected one of: {choices})")
+
+    def _convert(self, kind: str, fields: Dict) -> Dict:
+        enum_fields = self.ENUM_FIELDS.get(kind, {})
+        converted = dict(fields)
+        for name, value in converted.items():
+            if name in enum_fields:
+                converted[name] = self._enum(enum_fields[name], value)
+            elif not isinstance(value, str):
+                raise CliError(f"{name} must be a string")
+        return converted
+
+    def _bug_fields(self, fields: Dict, task_manager: TaskManager) -> Dict:
+        fields = self._convert("bug", fields)
+        if fields.get("task_id") and not task_manager.get_task(fields["task_id"]):
+            raise CliError(f"Unknown task: {fields['task_id']}")
+        return fields
+
+    def _print_bugs(self, bugs):
+        for bug in bugs:
+            if self.as_json:
+                self._print_json(bug.to_dict())
+            else:
+                self._print(f"{bug.id}  {bug.status.value:<12} {bug.priority.value:<9} {bug.task_id or '-':<14} {bug.title}")
+
+    def _print_tasks(self, tasks, bug_manager: BugManager):
+        for task in tasks:
+            if self.as_json:
+                self._print_json(task.to_dict())
+            else:
+                bugs = bug_manager.count_bugs_by_task(task.id)
+                self._print(f"{task.id}  {task.status.value:<15} {task.priority.value:<9} {bugs:>5}  {task.title}")
+
+    def list_versions(self):
+        for version in self.project.versions:
+            if self.as_json:
+                self._print_json(version)
+            else:
+                marker = "*" if version == self.version else " "
+                self._print(f"{marker} {version}")
+
+    def list_bugs(self, status=None, priority=None, task="", search=""):
+        _, bug_manager = self.managers()
+        self._print_bugs(bug_manager.filter_bugs(
+            priority_filter=self._enum(BugPriority, priority),
+            status_filter=self._enum(BugStatus, status),
+            task_id_filter=task or "",
+            search_text=search or ""
+        ))
+
+    def list_tasks(self, status=None, priority=None, search=""):
+        task_manager, bug_manager = self.managers()
+        self._print_tasks(task_manager.filter_tasks(
+            priority_filter=self._enum(TaskPriority, priority),
+            status_filter=self._enum(TaskStatus, status),
+            search_text=search or ""
+        ), bug_manager)
+
+    def add_bug(self, **fields):
+        task_manager, bug_manager = self.managers()
+        bug = bug_manager.add_bug(**self._bug_fields(fields, task_manager))
+        if not bug:
+            raise CliError("Failed to add bug")
+        self._print_bugs([bug])
+
+    def update_bug(self, bug_id: str, **fields):
+        task_manager, bug_manager = self.managers()
+        if not bug_manager.get_bug(bug_id):
+            raise CliError(f"Unknown bug: {bug_id}")
+        if not bug_manager.update_bug(bug_id, **self._bug_fields(fields, task_manager)):
+            raise CliError(f"Failed to update bug {bug_id}")
+        self._print_bugs([bug_manager.get_bug(bug_id)])
+
+    def delete_bug(self, bug_id: str):
+        _, bug_manager = self.managers()
+        if not bug_manager.delete_bug(bug_id):
+            raise CliError(f"Unknown bug: {bug_id}")
+
+    def add_comment(self, bug_id: str, text: str, author: str = ""):
+        _, bug_manager = self.managers()
+        if not bug_manager.add_comment(bug_id, author, text):
+            raise CliError(f"Unknown bug: {bug_id}")
+
+    def add_task(self, **fields):
+        task_manager, bug_manager = self.managers()
+        task = task_manager.add_task(**self._convert("task", fields))
+        if not task:
+            raise CliError("Failed to add task")
+        self._print_tasks([task], bug_manager)
+
+    def update_task(self, task_id: str, **fields):
+        task_manager, bug_manager = self.managers()
+        if not task_manager.get_task(task_id):
+            raise CliError(f"Unknown task: {task_id}")
+        if not task_manager.update_task(task_id, **self._convert("task", fields)):
+            raise CliError(f"Failed to update task {task_id}")
+        self._print_tasks([task_manager.get_task(task_id)], bug_manager)
+
+    def delete_task(self, task_id: str):
+        task_manager, _ = self.managers()
+        if not task_manager.delete_task(task_id):
+            raise CliError(f"Unknown task: {task_id}")
+
+    def print_statistics(self):
+        task_manager, bug_manager = self.managers()
+        stats = StatisticsGenerator.generate_project_stats(self.project, task_manager, bug_manager)
+        if self.as_json:
+            self._print_json(stats)
+            return
+
+        tasks, bugs, progress = stats["tasks"], stats["bugs"], stats["progress"]
+        self._print(f"Project: {self.project.name} ({self.version})")
+        self._print(
+            f"Tasks: {tasks['total']} total, {tasks['status_summary']['todo']} todo, "
+            f"{tasks['status_summary']['in_progress']} in progress, {tasks['status_summary']['done']} done"
+        )
+        self._print(
+            f"Bugs: {bugs['total']} total, {bugs['open']} open, "
+            f"{bugs['by_status'].get('in_progress', 0)} in progress, {bugs['fixed']} fixed"
+        )
+        self._print("Task priorities: " + ", ".join(f"{k}={v}" for k, v in tasks["by_priority"].items()))
+        self._print("Bug priorities: " + ", ".join(f"{k}={v}" for k, v in bugs["by_priority"].items()))
+        self._print(
+            f"Completion: {progress['completion_rate']}% | "
+            f"Bug resolution: {progress['bug_resolution_rate']}% | "
+            f"Bugs per task: {progress['task_bug_ratio']}"
+        )
+
+    def export(self, target: str):
+        project_data = self.session.journal.ensure_all_versions(self.session.project_data)
+        if not ProjectFileHandler.save_project(self.project, target, project_data.get("versions", {})):
+            raise CliError(f"Failed to export project to {target}")
+        if not self.as_json:
+            self._print(f"Exported to {target}")
+
+    def run_batch(self, lines) -> int:
+        journal = self.session.journal
+        results: List[Dict] = []
+
+        journal.begin_batch()
+        try:
+            for number, line in enumerate(lines, 1):
+                line = line.strip()
+                if not line:
+                    continue
+
+                try:
+                    operation = json.loads(line)
+                    if not isinstance(operation, dict):
+                        raise CliError("Expected a JSON object")
+                    op = operation.pop("op", None)
+                    if op not in self.BATCH_OPERATIONS:
+                        raise CliError(f"Unknown operation: {op}")
+
+                    version = self._require_version(operation.pop("version", None))
+                    task_manager, bug_manager = self.session.managers(version)
+                    results.append(self._apply(op, operation, task_manager, bug_manager))
+                except (CliError, ValueError, TypeError, KeyError) as e:
+                    raise CliError(f"Line {number}: {e}")
+        except BaseException:
+            journal.cancel_batch()
+            raise
+
+        if not journal.commit_batch():
+            raise CliError("Failed to save project")
+        self.close()
+
+        if self.as_json:
+            for result in results:
+                self._print_json(result)
+        else:
+            self._print(f"Applied {len(results)} operations")
+        return len(results)
+
+    def _apply(self, op: str, fields: Dict, task_manager: TaskManager, bug_manager: BugManager) -> Dict:
+        if op == "add_bug":
+            bug = bug_manager.add_bug(**self._bug_fields(fields, task_manager))
+            if not bug:
+                raise CliError("Failed to add bug")
+            return {"op": op, "id": bug.id}
+
+        if op == "add_task":
+            task = task_manager.add_task(**self._convert("task", fields))
+            if not task:
+                raise CliError("Failed to add task")
+            return {"op": op, "id": task.id}
+
+        record_id = fields.pop("id")
+        if op == "update_bug":
+            ok = bug_manager.update_bug(record_id, **self._bug_fields(fields, task_manager))
+        elif op == "delete_bug":
+            ok = bug_manager.delete_bug(record_id)
+        elif op == "add_comment":
+            fields = self._convert("comment", fields)
+            ok = bug_manager.add_comment(record_id, fields.get("author", ""), fields["text"])
+        elif op == "update_task":
+            ok = task_manager.update_task(record_id, **self._convert("task", fields))
+        else:
+            ok = task_manager.delete_task(record_id)
+
+        if not ok:
+            raise CliError(f"{op} failed for {record_id}")
+        return {"op": op, "id": record_id}
+
+
+def _add_filter_arguments(parser, statuses, priorities):
+    parser.add_argument("--status", choices=[status.value for status in statuses])
+    parser.add_argument("--priority", choices=[priority.value for priority in priorities])
+    parser.add_argument("--search", default="")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m core.cli", description="Smart Bug Tracker command line")
+    parser.add_argument("project", help="Project file (.bugtracker.json, .bugtracker.db or sharded directory)")
+    parser.add_argument("--version", dest="project_version", help="Version to work on (defaults to the latest)")
+    parser.add_argument("--json", action="store_true", help="Print JSON lines instead of text")
+
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("versions", help="List project versions")
+    commands.add_parser("stats", help="Print statistics for the version")
+
+    export = commands.add_parser("export", help="Export the whole project to a JSON file")
+    export.add_argument("output")
+
+    batch = commands.add_parser("batch", help="Apply JSONL operations with one load and one save")
+    batch.add_argument("input", nargs="?", default="-", help="JSONL file, or - for stdin")
+
+    bugs = commands.add_parser("bugs", help="List and edit bugs").add_subparsers(dest="action", required=True)
+
+    bug_list = bugs.add_parser("list")
+    _add_filter_arguments(bug_list, BugStatus, BugPriority)
+    bug_list.add_argument("--task", default="")
+
+    bug_add = bugs.add_parser("add")
+    bug_add.add_argument("title")
+    bug_add.add_argument("--description", default="")
+    bug_add.add_argument("--priority", default=BugPriority.MEDIUM.value, choices=[p.value for p in BugPriority])
+    bug_add.add_argument("--task", dest="task_id", default="")
+    bug_add.add_argument("--steps", dest="steps_to_reproduce", default="")
+    bug_add.add_argument("--expected", dest="expected_result", default="")
+    bug_add.add_argument("--actual", dest="actual_result", default="")
+    bug_add.add_argument("--screenshot", dest="screenshot_path", default="")
+    bug_add.add_argument("--author", default="")
+
+    bug_update = bugs.add_parser("update")
+    bug_update.add_argument("id")
+    bug_update.add_argument("--title")
+    bug_update.add_argument("--description")
+    bug_update.add_argument("--priority", choices=[p.value for p in BugPriority])
+    bug_update.add_argument("--status", choices=[s.value for s in BugStatus])
+    bug_update.add_argument("--task", dest="task_id")
+    bug_update.add_argument("--assign", dest="assigned_to")
+
+    bug_delete = bugs.add_parser("delete")
+    bug_delete.add_argument("id")
+
+    bug_comment = bugs.add_parser("comment")
+    bug_comment.add_argument("id")
+    bug_comment.add_argument("text")
+    bug_comment.add_argument("--author", default="")
+
+    tasks = commands.add_parser("tasks", help="List and edit tasks").add_subparsers(dest="action", required=True)
+
+    task_list = tasks.add_parser("list")
+    _add_filter_arguments(task_list, TaskStatus, TaskPriority)
+
+    task_add = tasks.add_parser("add")
+    task_add.add_argument("title")
+    task_add.add_argument("--description", default="")
+    task_add.add_argument("--priority", default=TaskPriority.MEDIUM.value, choices=[p.value for p in TaskPriority])
+    task_add.add_argument("--instructions", dest="test_instructions", default="")
+    task_add.add_argument("--assign", dest="assigned_to", default="")
+
+    task_update = tasks.add_parser("update")
+    task_update.add_argument("id")
+    task_update.add_argument("--title")
+    task_update.add_argument("--description")
+    task_update.add_argument("--priority", choices=[p.value for p in TaskPriority])
+    task_update.add_argument("--status", choices=[s.value for s in TaskStatus])
+    task_update.add_argument("--instructions", dest="test_instructions")
+    task_update.add_argument("--assign", dest="assigned_to")
+
+    task_delete = tasks.add_parser("delete")
+    task_delete.add_argument("id")
+
+    return parser
+
+
+def _changed_fields(args, names) -> Dict:
+    return {name: getattr(args, name) for name in names if getattr(args, name) is not None}
+
+
+def _run(cli: TrackerCli, args) -> bool:
+    if args.command == "versions":
+        cli.list_versions()
+    elif args.command == "stats":
+        cli.print_statistics()
+    elif args.command == "export":
+        cli.export(args.output)
+    elif args.command == "batch":
+        if args.input == "-":
+            cli.run_batch(sys.stdin)
+        else:
+            with open(args.input, 'r', encoding='utf-8') as f:
+                cli.run_batch(f)
+        return False
+    elif args.command == "bugs":
+        if args.action == "list":
+            cli.list_bugs(args.status, args.priority, args.task, args.search)
+        elif args.action == "add":
+            cli.add_bug(**_changed_fields(args, (
+                "title", "description", "priority", "task_id", "steps_to_reproduce",
+                "expected_result", "actual_result", "screenshot_path", "author"
+            )))
+        elif args.action == "update":
+            cli.update_bug(args.id, **_changed_fields(args, (
+                "title", "description", "priority", "status", "task_id", "assigned_to"
+            )))
+        elif args.action == "delete":
+            cli.delete_bug(args.id)
+        else:
+            cli.add_comment(args.id, args.text, args.author)
+    else:
+        if args.action == "list":
+            cli.list_tasks(args.status, args.priority, args.search)
+        elif args.action == "add":
+            cli.add_task(**_changed_fields(args, (
+                "title", "description", "priority", "test_instructions", "assigned_to"
+            )))
+        elif args.action == "update":
+            cli.update_task(args.id, **_changed_fields(args, (
+                "title", "description", "priority", "status", "test_instructions", "assigned_to"
+            )))
+        else:
+            cli.delete_task(args.id)
+    return True
+
+
+def main(argv=None) -> int:
+    args = _build_parser().parse_args(argv)
+
+    try:
+        cli = TrackerCli(args.project, args.project_version, args.json)
+    except CliError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    try:
+        if _run(cli, args):
+            cli.close()
+        return 0
+    except (CliError, OSError) as e:
+        cli.session.close()
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,19 +1,41 @@
 import json
 from typing import Dict, List, Optional
 from pathlib import Path
+import threading
 import uuid
 
+from core.managers.change_events import ChangeEvent, ChangeNotifier, ChangeType
+from core.managers.record_index import RecordIndex
+from core.managers.search_index import SearchIndex
 from core.models.bug import Bug, BugPriority, BugStatus
+from core.utils.perf import Perf
 
 
 class BugManager:
     
-    def __init__(self, project_data: Dict, version: str):
+    TRACKED_FIELDS = (
+        "title", "description", "priority", "status", "task_id",
+        "steps_to_reproduce", "expected_result", "actual_result",
+        "screenshot_path", "assigned_to"
+    )
+    
+    @Perf.timed("bugs.build")
+    def __init__(self, project_data: Dict, version: str, journal=None):
         self.project_data = project_data
         self.version = version
+        self.journal = journal
         
         self._ensure_version_structure()
         self.bugs: Dict[str, Bug] = self._load_bugs_from_data()
+        self._dirty_ids = set()
+        self._deleted_ids = set()
+        self._lock = threading.RLock()
+        self._changes = ChangeNotifier()
+        
+        self.index = RecordIndex(("status", "priority", "task_id"))
+        self._search_index: Optional[SearchIndex] = None
+        for bug_id, bug in self.bugs.items():
+            self.index.add(bug_id, bug)
     
     def _ensure_version_structure(self):
         if "versions" not in self.project_data:
@@ -43,17 +65,81 @@ class BugManager:
             print(f"Error loading bugs: {e}")
             return {}
     
+    def _mark_dirty(self, bug_id: str):
+        with self._lock:
+            self._deleted_ids.discard(bug_id)
+            self._dirty_ids.add(bug_id)
+            self.index.update(bug_id, self.bugs[bug_id])
+            if self._search_index is not None:
+                self._search_index.update(bug_id, self._search_fields(self.bugs[bug_id]))
+    
+    def _mark_deleted(self, bug_id: str):
+        with self._lock:
+            self._dirty_ids.discard(bug_id)
+            self._deleted_ids.add(bug_id)
+            self.index.remove(bug_id)
+            if self._search_index is not None:
+                self._search_index.remove(bug_id)
+    
+    def subscribe(self, callback):
+        self._changes.subscribe(callback)
+    
+    def unsubscribe(self, callback):
+        self._changes.unsubscribe(callback)
+    
+    @property
+    def search_index(self) -> SearchIndex:
+        with self._lock:
+            if self._search_index is None:
+                with Perf.span("bugs.search_index_build"):
+                    self._search_index = SearchIndex()
+                    for bug_id, bug in self.bugs.items():
+                        self._search_index.add(bug_id, self._search_fields(bug))
+            return self._search_index
+    
+    @staticmethod
+    def _search_fields(bug: Bug) -> List[str]:
+        return [
+            bug.title, bug.description, bug.id, bug.task_id,
+            bug.steps_to_reproduce, bug.expected_result, bug.actual_result,
+            *(comment.get("text", "") for comment in bug.comments)
+        ]
+    
+    def _bugs_for(self, bug_ids) -> List[Bug]:
+        return [self.bugs[bug_id] for bug_id in self.index.ordered(bug_ids)]
+    
+    @Perf.timed("bugs.save_to_project_data")
     def save_to_project_data(self):
         try:
-            version_data = self.project_data["versions"][self.version]
-            version_data["bugs"] = {
-                bug_id: bug.to_dict() 
-                for bug_id, bug in self.bugs.items()
+            bugs_data = self.project_data["versions"][self.version].setdefault("bugs", {})
+            for bug_id in self._deleted_ids:
+                bugs_data.pop(bug_id, None)
+            
+            changes = {
+                bug_id: self.bugs[bug_id].to_dict()
+                for bug_id in self._dirty_ids
+                if bug_id in self.bugs
             }
-            return True
+            bugs_data.update(changes)
         except Exception as e:
             print(f"Error saving bugs to project data: {e}")
             return False
+        
+        deleted = self._deleted_ids
+        self._dirty_ids = set()
+        self._deleted_ids = set()
+        return self._journal_changes(changes, deleted)
+    
+    def _journal_changes(self, changes: Dict[str, Dict], deleted) -> bool:
+        if not self.journal:
+            return True
+        
+        ok = True
+        for bug_id, data in changes.items():
+            ok = self.journal.record_change(self.version, "bugs", bug_id, data) and ok
+        for bug_id in deleted:
+            ok = self.journal.record_change(self.version, "bugs", bug_id, None) and ok
+        return ok
     
     @property
     def count(self) -> int:
@@ -61,16 +147,17 @@ class BugManager:
     
     @property
     def open_count(self) -> int:
-        return sum(1 for bug in self.bugs.values() if bug.status == BugStatus.OPEN)
+        return self.index.count("status", BugStatus.OPEN)
     
     @property
     def fixed_count(self) -> int:
-        return sum(1 for bug in self.bugs.values() if bug.status == BugStatus.FIXED)
+        return self.index.count("status", BugStatus.FIXED)
     
     @property
     def critical_count(self) -> int:
-        return sum(1 for bug in self.bugs.values() if bug.priority == BugPriority.CRITICAL)
+        return self.index.count("priority", BugPriority.CRITICAL)
     
+    @Perf.timed("bugs.add_bug")
     def add_bug(self, 
                 title: str,
                 description: str = "",
@@ -96,9 +183,13 @@ class BugManager:
             author=author
         )
         
-        self.bugs[bug_id] = bug
+        with self._lock:
+            self.bugs[bug_id] = bug
+            self._mark_dirty(bug_id)
         
-        if self.save_to_project_data():
+        saved = self.save_to_project_data()
+        self._changes.emit(ChangeEvent(ChangeType.ADDED, bug_id, bug))
+        if saved:
             return bug
         return None
     
@@ -109,51 +200,82 @@ class BugManager:
         return list(self.bugs.values())
     
     def get_bugs_by_task(self, task_id: str) -> List[Bug]:
-        return [bug for bug in self.bugs.values() if bug.task_id == task_id]
+        return self._bugs_for(self.index.ids("task_id", task_id))
+    
+    def count_bugs_by_task(self, task_id: str) -> int:
+        return self.index.count("task_id", task_id)
     
     def get_bugs_by_status(self, status: BugStatus) -> List[Bug]:
-        return [bug for bug in self.bugs.values() if bug.status == status]
+        return self._bugs_for(self.index.ids("status", status))
     
     def get_bugs_by_priority(self, priority: BugPriority) -> List[Bug]:
-        return [bug for bug in self.bugs.values() if bug.priority == priority]
+        return self._bugs_for(self.index.ids("priority", priority))
     
+    @Perf.timed("bugs.filter_bugs")
     def filter_bugs(self, 
                priority_filter: Optional[BugPriority] = None,
                status_filter: Optional[BugStatus] = None,
                task_id_filter: str = "",
                search_text: str = "") -> List[Bug]:
-        filtered_bugs = self.get_all_bugs()
-        
-        if priority_filter:
-            filtered_bugs = [b for b in filtered_bugs if b.priority == priority_filter]
-        
-        if status_filter:
-            filtered_bugs = [b for b in filtered_bugs if b.status == status_filter]
-        
-        if task_id_filter:
+        with self._lock:
+            candidates = None
+            
+            if priority_filter:
+                candidates = self.index.ids("priority", priority_filter)
+            
+            if status_filter:
+                status_ids = self.index.ids("status", status_filter)
+                candidates = status_ids if candidates is None else candidates & status_ids
+            
             if task_id_filter.startswith("TASK-"):
-                filtered_bugs = [b for b in filtered_bugs if b.task_id == task_id_filter]
-            else:
+                task_ids = self.index.ids("task_id", task_id_filter)
+                candidates = task_ids if candidates is None else candidates & task_ids
+            
+            if search_text:
+                search_ids = self.search_index.search(search_text)
+                candidates = search_ids if candidates is None else candidates & search_ids
+            
+            filtered_bugs = self.get_all_bugs() if candidates is None else self._bugs_for(candidates)
+            
+            if task_id_filter and not task_id_filter.startswith("TASK-"):
                 filtered_bugs = [b for b in filtered_bugs if task_id_filter.lower() in b.task_id.lower()]
-        
-        if search_text:
-            search_lower = search_text.lower()
-            filtered_bugs = [
-                b for b in filtered_bugs
-                if search_lower in b.title.lower() 
-                or search_lower in b.description.lower()
-                or search_lower in b.id.lower()
-                or search_lower in b.task_id.lower()
-            ]
-        
-        return filtered_bugs
+            
+            return filtered_bugs
     
+    def matches(self,
+                bug_id: str,
+                priority_filter: Optional[BugPriority] = None,
+                status_filter: Optional[BugStatus] = None,
+                task_id_filter: str = "",
+                search_text: str = "") -> bool:
+        with self._lock:
+            bug = self.bugs.get(bug_id)
+            if bug is None:
+                return False
+            
+            if priority_filter and bug.priority != priority_filter:
+                return False
+            
+            if status_filter and bug.status != status_filter:
+                return False
+            
+            if task_id_filter.startswith("TASK-"):
+                if bug.task_id != task_id_filter:
+                    return False
+            elif task_id_filter and task_id_filter.lower() not in bug.task_id.lower():
+                return False
+            
+            return not search_text or self.search_index.matches(bug_id, search_text)
+    
+    @Perf.timed("bugs.update_bug")
     def update_bug(self, bug_id: str, **kwargs) -> bool:
         bug = self.get_bug(bug_id)
         if not bug:
             return False
         
         try:
+            before = ChangeNotifier.snapshot(bug, self.TRACKED_FIELDS)
+            
             if 'title' in kwargs:
                 bug._title = kwargs['title']
             if 'description' in kwargs:
@@ -175,25 +297,76 @@ class BugManager:
             if 'assigned_to' in kwargs:
                 bug.assign_to(kwargs['assigned_to'])
             
-            return self.save_to_project_data()
+            self._mark_dirty(bug_id)
+            saved = self.save_to_project_data()
         except Exception as e:
             print(f"Error updating bug: {e}")
             return False
+        
+        previous = ChangeNotifier.changed(bug, before)
+        if previous:
+            self._changes.emit(ChangeEvent(ChangeType.UPDATED, bug_id, bug, previous))
+        return saved
     
+    @Perf.timed("bugs.add_comment")
     def add_comment(self, bug_id: str, author: str, text: str) -> bool:
         bug = self.get_bug(bug_id)
         if not bug:
             return False
         
+        previous = {"comments": list(bug.comments)}
         bug.add_comment(author, text)
-        return self.save_to_project_data()
+        self._mark_dirty(bug_id)
+        saved = self.save_to_project_data()
+        self._changes.emit(ChangeEvent(ChangeType.UPDATED, bug_id, bug, previous))
+        return saved
     
+    @Perf.timed("bugs.delete_bug")
     def delete_bug(self, bug_id: str) -> bool:
         if bug_id in self.bugs:
-            del self.bugs[bug_id]
-            return self.save_to_project_data()
+            with self._lock:
+                bug = self.bugs.pop(bug_id)
+                self._mark_deleted(bug_id)
+            saved = self.save_to_project_data()
+            self._changes.emit(ChangeEvent(ChangeType.REMOVED, bug_id, bug))
+            return saved
         return False
     
+    @Perf.timed("bugs.apply_change")
+    def apply_change(self, bug_id: str, data: Optional[Dict]):
+        with self._lock:
+            previous_bug = self.bugs.get(bug_id)
+            bugs_data = self.project_data["versions"][self.version].setdefault("bugs", {})
+            
+            if data is None:
+                if previous_bug is None:
+                    return
+                del self.bugs[bug_id]
+                bugs_data.pop(bug_id, None)
+                self.index.remove(bug_id)
+                if self._search_index is not None:
+                    self._search_index.remove(bug_id)
+                event = ChangeEvent(ChangeType.REMOVED, bug_id, previous_bug)
+            else:
+                bug = Bug.from_dict(data)
+                self.bugs[bug_id] = bug
+                bugs_data[bug_id] = data
+                self.index.update(bug_id, bug)
+                if self._search_index is not None:
+                    self._search_index.update(bug_id, self._search_fields(bug))
+                
+                if previous_bug is None:
+                    event = ChangeEvent(ChangeType.ADDED, bug_id, bug)
+                else:
+                    before = ChangeNotifier.snapshot(previous_bug, self.TRACKED_FIELDS)
+                    previous = ChangeNotifier.changed(bug, before)
+                    if bug.comments != previous_bug.comments:
+                        previous["comments"] = list(previous_bug.comments)
+                    event = ChangeEvent(ChangeType.UPDATED, bug_id, bug, previous)
+        
+        self._changes.emit(event)
+    
+    @Perf.timed("bugs.get_bug_statistics")
     def get_bug_statistics(self) -> Dict:
         return {
             "total": self.count,
@@ -201,11 +374,11 @@ class BugManager:
             "fixed": self.fixed_count,
             "critical": self.critical_count,
             "by_priority": {
-                priority.value: len(self.get_bugs_by_priority(priority))
+                priority.value: self.index.count("priority", priority)
                 for priority in BugPriority
             },
             "by_status": {
-                status.value: len(self.get_bugs_by_status(status))
+                status.value: self.index.count("status", status)
                 for status in BugStatus
             }
         }
\ No newline at end of file
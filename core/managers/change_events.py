@@ -0,0 +1,55 @@
+from enum import Enum
+from typing import Any, Callable, Dict, FrozenSet, List, Optional
+
+
+class ChangeType(Enum):
+    ADDED = "added"
+    UPDATED = "updated"
+    REMOVED = "removed"
+
+
+class ChangeEvent:
+
+    def __init__(self, change_type: ChangeType, record_id: str, record, previous: Optional[Dict[str, Any]] = None):
+        self.change_type = change_type
+        self.record_id = record_id
+        self.record = record
+        self.previous: Dict[str, Any] = previous or {}
+
+    @property
+    def fields(self) -> FrozenSet[str]:
+        return frozenset(self.previous)
+
+    def touches(self, *fields: str) -> bool:
+        if self.change_type != ChangeType.UPDATED:
+            return True
+        return any(field in self.previous for field in fields)
+
+
+class ChangeNotifier:
+
+    def __init__(self):
+        self._subscribers: List[Callable[[ChangeEvent], None]] = []
+
+    def subscribe(self, callback: Callable[[ChangeEvent], None]):
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[ChangeEvent], None]):
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def emit(self, event: ChangeEvent):
+        for callback in list(self._subscribers):
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"Error handling change event: {e}")
+
+    @staticmethod
+    def snapshot(record, fields) -> Dict[str, Any]:
+        return {field: getattr(record, field) for field in fields}
+
+    @staticmethod
+    def changed(record, before: Dict[str, Any]) -> Dict[str, Any]:
+        return {field: value for field, value in before.items() if getattr(record, field) != value}
@@ -0,0 +1,89 @@
+from typing import Dict
+
+from core.managers.change_events import ChangeType
+from core.models.bug import BugPriority, BugStatus
+from core.models.task import TaskPriority, TaskStatus
+from core.utils.perf import Perf
+from core.utils.statistics_generator import StatisticsGenerator
+
+
+class LiveStatistics:
+
+    def __init__(self, task_manager, bug_manager):
+        self.task_manager = task_manager
+        self.bug_manager = bug_manager
+
+        self._tasks = self._initial_counters(task_manager, TaskStatus, TaskPriority)
+        self._bugs = self._initial_counters(bug_manager, BugStatus, BugPriority)
+
+        task_manager.subscribe(self._on_task_changed)
+        bug_manager.subscribe(self._on_bug_changed)
+
+    @staticmethod
+    def _initial_counters(manager, statuses, priorities) -> Dict:
+        return {
+            "total": manager.count,
+            "status": {status: manager.index.count("status", status) for status in statuses},
+            "priority": {priority: manager.index.count("priority", priority) for priority in priorities},
+        }
+
+    @staticmethod
+    def _apply(counters: Dict, event):
+        record = event.record
+
+        if event.change_type == ChangeType.UPDATED:
+            for field in ("status", "priority"):
+                if field in event.previous:
+                    counters[field][event.previous[field]] -= 1
+                    counters[field][getattr(record, field)] += 1
+            return
+
+        delta = 1 if event.change_type == ChangeType.ADDED else -1
+        counters["total"] += delta
+        counters["status"][record.status] += delta
+        counters["priority"][record.priority] += delta
+
+    def _on_task_changed(self, event):
+        self._apply(self._tasks, event)
+
+    def _on_bug_changed(self, event):
+        self._apply(self._bugs, event)
+
+    def close(self):
+        self.task_manager.unsubscribe(self._on_task_changed)
+        self.bug_manager.unsubscribe(self._on_bug_changed)
+
+    @property
+    def completion_rate(self) -> float:
+        return StatisticsGenerator._calculate_completion_rate(self.task_statistics())
+
+    @property
+    def bug_resolution_rate(self) -> float:
+        return StatisticsGenerator._calculate_bug_resolution_rate(self.bug_statistics())
+
+    def task_statistics(self) -> Dict:
+        status, priority = self._tasks["status"], self._tasks["priority"]
+        return {
+            "total": self._tasks["total"],
+            "todo": status[TaskStatus.TODO],
+            "in_progress": status[TaskStatus.IN_PROGRESS],
+            "done": status[TaskStatus.DONE],
+            "critical": priority[TaskPriority.CRITICAL],
+            "by_priority": {key.value: count for key, count in priority.items()},
+            "by_status": {key.value: count for key, count in status.items()}
+        }
+
+    def bug_statistics(self) -> Dict:
+        status, priority = self._bugs["status"], self._bugs["priority"]
+        return {
+            "total": self._bugs["total"],
+            "open": status[BugStatus.OPEN],
+            "fixed": status[BugStatus.FIXED],
+            "critical": priority[BugPriority.CRITICAL],
+            "by_priority": {key.value: count for key, count in priority.items()},
+            "by_status": {key.value: count for key, count in status.items()}
+        }
+
+    @Perf.timed("statistics.live_snapshot")
+    def snapshot(self, project) -> Dict:
+        return StatisticsGenerator.build_project_stats(project, self.task_statistics(), self.bug_statistics())
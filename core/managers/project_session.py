@@ -0,0 +1,156 @@
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.managers.bug_manager import BugManager
+from core.managers.live_statistics import LiveStatistics
+from core.managers.task_manager import TaskManager
+from core.models.project import Project
+from core.utils.perf import Perf
+from core.utils.project_file_handler import ProjectFileHandler
+from core.utils.project_journal import ProjectJournal
+from core.utils.project_lock import ProjectLock, ProjectLockedError
+from core.utils.save_writer import SaveWriter
+
+
+class ProjectSession:
+
+    def __init__(self, filepath: str, journal: ProjectJournal,
+                 lock: Optional[ProjectLock] = None, registration: Optional[ProjectLock] = None):
+        self.filepath = filepath
+        self.project: Optional[Project] = None
+        self.project_data: Dict = {}
+        self.journal = journal
+        self.writer = journal.writer
+        self.lock = lock
+        self.registration = registration
+        self.journal.owner = lock is not None
+        self.journal.on_entries = self._apply_entries
+        self._managers: Dict[str, Tuple[TaskManager, BugManager]] = {}
+        self._statistics: Dict[str, LiveStatistics] = {}
+
+    @property
+    def is_owner(self) -> bool:
+        return self.lock is not None
+
+    @staticmethod
+    @Perf.timed("session.open")
+    def open(filepath: str,
+             progress: Optional[Callable[[str, int, int], None]] = None) -> Optional['ProjectSession']:
+        journal = ProjectFileHandler.open_journal(filepath, SaveWriter())
+        lock = ProjectLock(journal.filepath)
+        registration = None
+        try:
+            try:
+                lock.acquire()
+            except ProjectLockedError:
+                lock = None
+                registration = ProjectLock.register(journal.filepath)
+        except OSError as e:
+            print(f"Error locking project: {e}")
+            journal.writer.stop()
+            journal.close()
+            return None
+
+        session = ProjectSession(filepath, journal, lock, registration)
+        try:
+            loaded = session._load(progress)
+        except BaseException:
+            session.close()
+            raise
+
+        if not loaded:
+            session.close()
+            return None
+        return session
+
+    def _load(self, progress=None) -> bool:
+        project_data = ProjectFileHandler.load_project_full(
+            self.filepath, lazy_versions=True, progress=progress, journal=self.journal
+        )
+        if not project_data or "meta" not in project_data:
+            return False
+
+        try:
+            meta_data = project_data["meta"]
+            if 'github_url' not in meta_data:
+                meta_data['github_url'] = ''
+            if self.project is None:
+                self.project = Project.from_dict(meta_data)
+            else:
+                self.project.update_from_dict(meta_data)
+        except Exception as e:
+            print(f"Error loading project: {e}")
+            return False
+
+        self.project_data = project_data
+        return True
+
+    def managers(self, version: str) -> Tuple[TaskManager, BugManager]:
+        if version not in self._managers:
+            with Perf.span("session.load_version"):
+                self.journal.ensure_version(self.project_data, version)
+                self._managers[version] = (
+                    TaskManager(self.project_data, version, self.journal),
+                    BugManager(self.project_data, version, self.journal)
+                )
+                self._statistics[version] = LiveStatistics(*self._managers[version])
+        return self._managers[version]
+
+    def statistics(self, version: str) -> LiveStatistics:
+        self.managers(version)
+        return self._statistics[version]
+
+    @Perf.timed("session.sync")
+    def sync(self) -> List[Dict]:
+        self._take_ownership()
+        return self.journal.poll()
+
+    def _take_ownership(self):
+        if self.lock is not None:
+            return
+
+        lock = ProjectLock(self.journal.filepath)
+        try:
+            lock.acquire()
+        except (ProjectLockedError, OSError):
+            return
+
+        self.lock = lock
+        self.journal.owner = True
+        if self.registration:
+            self.registration.release()
+            self.registration = None
+
+    def _apply_entries(self, entries: List[Dict]):
+        for entry in entries:
+            try:
+                kind = entry.get("k")
+                if kind == "meta":
+                    self.project.update_from_dict(entry["d"])
+                    self.project_data["meta"] = entry["d"]
+                elif entry.get("v") in self._managers and kind in ProjectJournal.RECORD_KINDS:
+                    task_manager, bug_manager = self._managers[entry["v"]]
+                    manager = task_manager if kind == "tasks" else bug_manager
+                    manager.apply_change(entry["id"], entry.get("d"))
+                else:
+                    self.journal.apply_entry(self.project_data, entry)
+            except Exception as e:
+                print(f"Error applying project change: {e}")
+
+    def reload(self) -> bool:
+        self.writer.wait_idle()
+        if not self._load():
+            return False
+
+        for statistics in self._statistics.values():
+            statistics.close()
+        self._statistics.clear()
+        self._managers.clear()
+        return True
+
+    def close(self):
+        self.writer.stop()
+        self.journal.close()
+        if self.lock:
+            self.lock.release()
+        if self.registration:
+            self.registration.release()
@@ -0,0 +1,49 @@
+from typing import Dict, Hashable, Iterable, List, Set, Tuple
+
+
+class RecordIndex:
+
+    def __init__(self, fields: Tuple[str, ...]):
+        self.fields = fields
+        self._buckets: Dict[str, Dict[Hashable, Set[str]]] = {field: {} for field in fields}
+        self._keys: Dict[str, Tuple] = {}
+        self._order: Dict[str, int] = {}
+        self._next_position = 0
+
+    def add(self, record_id: str, record):
+        if record_id in self._keys:
+            self._unlink(record_id)
+        else:
+            self._order[record_id] = self._next_position
+            self._next_position += 1
+
+        keys = tuple(getattr(record, field) for field in self.fields)
+        for field, key in zip(self.fields, keys):
+            self._buckets[field].setdefault(key, set()).add(record_id)
+        self._keys[record_id] = keys
+
+    def update(self, record_id: str, record):
+        self.add(record_id, record)
+
+    def remove(self, record_id: str):
+        if record_id in self._keys:
+            self._unlink(record_id)
+            del self._keys[record_id]
+            del self._order[record_id]
+
+    def _unlink(self, record_id: str):
+        for field, key in zip(self.fields, self._keys[record_id]):
+            bucket = self._buckets[field].get(key)
+            if bucket is not None:
+                bucket.discard(record_id)
+                if not bucket:
+                    del self._buckets[field][key]
+
+    def ids(self, field: str, key: Hashable) -> Set[str]:
+        return self._buckets[field].get(key, set())
+
+    def count(self, field: str, key: Hashable) -> int:
+        return len(self._buckets[field].get(key, ()))
+
+    def ordered(self, record_ids: Iterable[str]) -> List[str]:
+        return sorted(record_ids, key=self._order.__getitem__)
@@ -0,0 +1,93 @@
+import re
+from typing import Dict, Iterable, Set
+
+
+class SearchIndex:
+
+    GRAM_SIZE = 3
+    SEPARATOR = "\x00"
+    TOKEN_PATTERN = re.compile(r"\w+")
+
+    def __init__(self):
+        self._texts: Dict[str, str] = {}
+        self._tokens: Dict[str, Set[str]] = {}
+        self._grams: Dict[str, Set[str]] = {}
+
+    @staticmethod
+    def _grams_of(text: str) -> Set[str]:
+        size = SearchIndex.GRAM_SIZE
+        return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+    def add(self, record_id: str, fields: Iterable[str]):
+        if record_id in self._texts:
+            self.remove(record_id)
+
+        text = self.SEPARATOR.join(field.lower() for field in fields if field)
+        self._texts[record_id] = text
+
+        for token in set(self.TOKEN_PATTERN.findall(text)):
+            ids = self._tokens.get(token)
+            if ids is None:
+                ids = self._tokens[token] = set()
+                for gram in self._grams_of(token):
+                    self._grams.setdefault(gram, set()).add(token)
+            ids.add(record_id)
+
+    def update(self, record_id: str, fields: Iterable[str]):
+        self.add(record_id, fields)
+
+    def remove(self, record_id: str):
+        text = self._texts.pop(record_id, None)
+        if text is None:
+            return
+
+        for token in set(self.TOKEN_PATTERN.findall(text)):
+            ids = self._tokens.get(token)
+            if ids is None:
+                continue
+
+            ids.discard(record_id)
+            if not ids:
+                del self._tokens[token]
+                for gram in self._grams_of(token):
+                    tokens = self._grams.get(gram)
+                    if tokens is not None:
+                        tokens.discard(token)
+                        if not tokens:
+                            del self._grams[gram]
+
+    def _tokens_containing(self, word: str) -> Set[str]:
+        if len(word) < self.GRAM_SIZE:
+            return {token for token in self._tokens if word in token}
+
+        candidates = None
+        for gram in self._grams_of(word):
+            tokens = self._grams.get(gram)
+            if not tokens:
+                return set()
+            candidates = set(tokens) if candidates is None else candidates & tokens
+
+        return {token for token in candidates if word in token}
+
+    def matches(self, record_id: str, query: str) -> bool:
+        return query.lower() in self._texts.get(record_id, "")
+
+    def search(self, query: str) -> Set[str]:
+        query = query.lower()
+        words = sorted(set(self.TOKEN_PATTERN.findall(query)), key=len, reverse=True)
+        if not words:
+            return {record_id for record_id, text in self._texts.items() if query in text}
+
+        candidates = None
+        for word in words:
+            ids = set()
+            for token in self._tokens_containing(word):
+                ids |= self._tokens[token]
+
+            candidates = ids if candidates is None else candidates & ids
+            if not candidates:
+                return set()
+
+        if len(words) == 1 and words[0] == query:
+            return candidates
+        return {record_id for record_id in candidates if query in self._texts[record_id]}
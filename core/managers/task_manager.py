@@ -2,19 +2,37 @@ import json
 import os
 from typing import Dict, List, Optional
 from pathlib import Path
+import threading
 import uuid
 
+from core.managers.change_events import ChangeEvent, ChangeNotifier, ChangeType
+from core.managers.record_index import RecordIndex
+from core.managers.search_index import SearchIndex
 from core.models.task import Task, TaskPriority, TaskStatus
+from core.utils.perf import Perf
 
 
 class TaskManager:
     
-    def __init__(self, project_data: Dict, version: str):
+    TRACKED_FIELDS = ("title", "description", "priority", "status", "test_instructions", "assigned_to")
+    
+    @Perf.timed("tasks.build")
+    def __init__(self, project_data: Dict, version: str, journal=None):
         self.project_data = project_data
         self.version = version
+        self.journal = journal
         
         self._ensure_version_structure()
         self.tasks: Dict[str, Task] = self._load_tasks_from_data()
+        self._dirty_ids = set()
+        self._deleted_ids = set()
+        self._lock = threading.RLock()
+        self._changes = ChangeNotifier()
+        
+        self.index = RecordIndex(("status", "priority"))
+        self._search_index: Optional[SearchIndex] = None
+        for task_id, task in self.tasks.items():
+            self.index.add(task_id, task)
     
     def _ensure_version_structure(self):
         if "versions" not in self.project_data:
@@ -44,17 +62,77 @@ class TaskManager:
             print(f"Error loading tasks: {e}")
             return {}
     
+    def _mark_dirty(self, task_id: str):
+        with self._lock:
+            self._deleted_ids.discard(task_id)
+            self._dirty_ids.add(task_id)
+            self.index.update(task_id, self.tasks[task_id])
+            if self._search_index is not None:
+                self._search_index.update(task_id, self._search_fields(self.tasks[task_id]))
+    
+    def _mark_deleted(self, task_id: str):
+        with self._lock:
+            self._dirty_ids.discard(task_id)
+            self._deleted_ids.add(task_id)
+            self.index.remove(task_id)
+            if self._search_index is not None:
+                self._search_index.remove(task_id)
+    
+    def subscribe(self, callback):
+        self._changes.subscribe(callback)
+    
+    def unsubscribe(self, callback):
+        self._changes.unsubscribe(callback)
+    
+    @property
+    def search_index(self) -> SearchIndex:
+        with self._lock:
+            if self._search_index is None:
+                with Perf.span("tasks.search_index_build"):
+                    self._search_index = SearchIndex()
+                    for task_id, task in self.tasks.items():
+                        self._search_index.add(task_id, self._search_fields(task))
+            return self._search_index
+    
+    @staticmethod
+    def _search_fields(task: Task) -> List[str]:
+        return [task.title, task.description, task.id, task.test_instructions]
+    
+    def _tasks_for(self, task_ids) -> List[Task]:
+        return [self.tasks[task_id] for task_id in self.index.ordered(task_ids)]
+    
+    @Perf.timed("tasks.save_to_project_data")
     def save_to_project_data(self):
         try:
-            version_data = self.project_data["versions"][self.version]
-            version_data["tasks"] = {
-                task_id: task.to_dict() 
-                for task_id, task in self.tasks.items()
+            tasks_data = self.project_data["versions"][self.version].setdefault("tasks", {})
+            for task_id in self._deleted_ids:
+                tasks_data.pop(task_id, None)
+            
+            changes = {
+                task_id: self.tasks[task_id].to_dict()
+                for task_id in self._dirty_ids
+                if task_id in self.tasks
             }
-            return True
+            tasks_data.update(changes)
         except Exception as e:
             print(f"Error saving tasks to project data: {e}")
             return False
+        
+        deleted = self._deleted_ids
+        self._dirty_ids = set()
+        self._deleted_ids = set()
+        return self._journal_changes(changes, deleted)
+    
+    def _journal_changes(self, changes: Dict[str, Dict], deleted) -> bool:
+        if not self.journal:
+            return True
+        
+        ok = True
+        for task_id, data in changes.items():
+            ok = self.journal.record_change(self.version, "tasks", task_id, data) and ok
+        for task_id in deleted:
+            ok = self.journal.record_change(self.version, "tasks", task_id, None) and ok
+        return ok
     
     @property
     def count(self) -> int:
@@ -62,20 +140,21 @@ class TaskManager:
     
     @property
     def todo_count(self) -> int:
-        return sum(1 for task in self.tasks.values() if task.status == TaskStatus.TODO)
+        return self.index.count("status", TaskStatus.TODO)
     
     @property
     def in_progress_count(self) -> int:
-        return sum(1 for task in self.tasks.values() if task.status == TaskStatus.IN_PROGRESS)
+        return self.index.count("status", TaskStatus.IN_PROGRESS)
     
     @property
     def done_count(self) -> int:
-        return sum(1 for task in self.tasks.values() if task.status == TaskStatus.DONE)
+        return self.index.count("status", TaskStatus.DONE)
     
     @property
     def critical_count(self) -> int:
-        return sum(1 for task in self.tasks.values() if task.priority == TaskPriority.CRITICAL)
+        return self.index.count("priority", TaskPriority.CRITICAL)
     
+    @Perf.timed("tasks.add_task")
     def add_task(self, 
                  title: str, 
                  description: str = "",
@@ -94,9 +173,13 @@ class TaskManager:
             assigned_to=assigned_to
         )
         
-        self.tasks[task_id] = task
+        with self._lock:
+            self.tasks[task_id] = task
+            self._mark_dirty(task_id)
         
-        if self.save_to_project_data():
+        saved = self.save_to_project_data()
+        self._changes.emit(ChangeEvent(ChangeType.ADDED, task_id, task))
+        if saved:
             return task
         return None
     
@@ -107,17 +190,20 @@ class TaskManager:
         return list(self.tasks.values())
     
     def get_tasks_by_priority(self, priority: TaskPriority) -> List[Task]:
-        return [task for task in self.tasks.values() if task.priority == priority]
+        return self._tasks_for(self.index.ids("priority", priority))
     
     def get_tasks_by_status(self, status: TaskStatus) -> List[Task]:
-        return [task for task in self.tasks.values() if task.status == status]
+        return self._tasks_for(self.index.ids("status", status))
     
+    @Perf.timed("tasks.update_task")
     def update_task(self, task_id: str, **kwargs) -> bool:
         task = self.get_task(task_id)
         if not task:
             return False
         
         try:
+            before = ChangeNotifier.snapshot(task, self.TRACKED_FIELDS)
+            
             if 'title' in kwargs:
                 task._title = kwargs['title']
             if 'description' in kwargs:
@@ -133,17 +219,61 @@ class TaskManager:
             if 'assigned_to' in kwargs:
                 task.update_assigned_to(kwargs['assigned_to'])
             
-            return self.save_to_project_data()
+            self._mark_dirty(task_id)
+            saved = self.save_to_project_data()
         except Exception as e:
             print(f"Error updating task: {e}")
             return False
+        
+        previous = ChangeNotifier.changed(task, before)
+        if previous:
+            self._changes.emit(ChangeEvent(ChangeType.UPDATED, task_id, task, previous))
+        return saved
     
+    @Perf.timed("tasks.delete_task")
     def delete_task(self, task_id: str) -> bool:
         if task_id in self.tasks:
-            del self.tasks[task_id]
-            return self.save_to_project_data()
+            with self._lock:
+                task = self.tasks.pop(task_id)
+                self._mark_deleted(task_id)
+            saved = self.save_to_project_data()
+            self._changes.emit(ChangeEvent(ChangeType.REMOVED, task_id, task))
+            return saved
         return False
     
+    @Perf.timed("tasks.apply_change")
+    def apply_change(self, task_id: str, data: Optional[Dict]):
+        with self._lock:
+            previous_task = self.tasks.get(task_id)
+            tasks_data = self.project_data["versions"][self.version].setdefault("tasks", {})
+            
+            if data is None:
+                if previous_task is None:
+                    return
+                del self.tasks[task_id]
+                tasks_data.pop(task_id, None)
+                self.index.remove(task_id)
+                if self._search_index is not None:
+                    self._search_index.remove(task_id)
+                event = ChangeEvent(ChangeType.REMOVED, task_id, previous_task)
+            else:
+                task = Task.from_dict(data)
+                self.tasks[task_id] = task
+                tasks_data[task_id] = data
+                self.index.update(task_id, task)
+                if self._search_index is not None:
+                    self._search_index.update(task_id, self._search_fields(task))
+                
+                if previous_task is None:
+                    event = ChangeEvent(ChangeType.ADDED, task_id, task)
+                else:
+                    before = ChangeNotifier.snapshot(previous_task, self.TRACKED_FIELDS)
+                    previous = ChangeNotifier.changed(task, before)
+                    event = ChangeEvent(ChangeType.UPDATED, task_id, task, previous)
+        
+        self._changes.emit(event)
+    
+    @Perf.timed("tasks.get_task_statistics")
     def get_task_statistics(self) -> Dict:
         return {
             "total": self.count,
@@ -152,37 +282,52 @@ class TaskManager:
             "done": self.done_count,
             "critical": self.critical_count,
             "by_priority": {
-                priority.value: len(self.get_tasks_by_priority(priority))
+                priority.value: self.index.count("priority", priority)
                 for priority in TaskPriority
             },
             "by_status": {
-                status.value: len(self.get_tasks_by_status(status))
+                status.value: self.index.count("status", status)
                 for status in TaskStatus
             }
         }
 
+    @Perf.timed("tasks.filter_tasks")
     def filter_tasks(self, 
                  priority_filter: Optional[TaskPriority] = None,
                  status_filter: Optional[TaskStatus] = None,
                  search_text: str = "") -> List[Task]:
-        filtered_tasks = self.get_all_tasks()
-        
-        if priority_filter:
-            filtered_tasks = [t for t in filtered_tasks if t.priority == priority_filter]
-        
-        if status_filter:
-            filtered_tasks = [t for t in filtered_tasks if t.status == status_filter]
-        
-        if search_text:
-            search_lower = search_text.lower()
-            filtered_tasks = [
-                t for t in filtered_tasks
-                if search_lower in t.title.lower() 
-                or search_lower in t.description.lower()
-                or search_lower in t.id.lower()
-            ]
-        
-        return filtered_tasks
-
-    def get_tasks_by_priority(self, priority: TaskPriority) -> List[Task]:
-        return self.filter_tasks(priority_filter=priority)
\ No newline at end of file
+        with self._lock:
+            candidates = None
+            
+            if priority_filter:
+                candidates = self.index.ids("priority", priority_filter)
+            
+            if status_filter:
+                status_ids = self.index.ids("status", status_filter)
+                candidates = status_ids if candidates is None else candidates & status_ids
+            
+            if search_text:
+                search_ids = self.search_index.search(search_text)
+                candidates = search_ids if candidates is None else candidates & search_ids
+            
+            if candidates is None:
+                return self.get_all_tasks()
+            return self._tasks_for(candidates)
+    
+    def matches(self,
+                task_id: str,
+                priority_filter: Optional[TaskPriority] = None,
+                status_filter: Optional[TaskStatus] = None,
+                search_text: str = "") -> bool:
+        with self._lock:
+            task = self.tasks.get(task_id)
+            if task is None:
+                return False
+            
+            if priority_filter and task.priority != priority_filter:
+                return False
+            
+            if status_filter and task.status != status_filter:
+                return False
+            
+            return not search_text or self.search_index.matches(task_id, search_text)
\ No newline at end of file
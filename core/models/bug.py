@@ -3,6 +3,8 @@ from datetime import datetime
 from typing import Dict, Optional, List
 from enum import Enum
 
+from core.models.record_fields import RecordFields
+
 
 class BugStatus(Enum):
     OPEN = "open"
@@ -21,13 +23,21 @@ class BugPriority(Enum):
     
     @staticmethod
     def from_string(priority_str: str) -> 'BugPriority':
-        for priority in BugPriority:
-            if priority.value == priority_str.lower():
-                return priority
-        return BugPriority.MEDIUM
+        return BUG_PRIORITIES.get(priority_str.lower(), BugPriority.MEDIUM)
+
+
+BUG_STATUSES = {status.value: status for status in BugStatus}
+BUG_PRIORITIES = {priority.value: priority for priority in BugPriority}
 
 
-class Bug:    
+class Bug:
+    
+    __slots__ = (
+        "_id", "_title", "_description", "_priority", "_status", "_created_at",
+        "_task_id", "_steps_to_reproduce", "_expected_result", "_actual_result",
+        "_screenshot_path", "_author", "_assigned_to", "_comments"
+    )
+    
     def __init__(self, 
                  id: str, 
                  title: str, 
@@ -48,14 +58,14 @@ class Bug:
         self._description = description
         self._priority = priority
         self._status = status
-        self._created_at = created_at or datetime.now().isoformat()
-        self._task_id = task_id
+        self._created_at = RecordFields.pack_timestamp(created_at) if created_at else RecordFields.now()
+        self._task_id = RecordFields.shared(task_id)
         self._steps_to_reproduce = steps_to_reproduce
         self._expected_result = expected_result
         self._actual_result = actual_result
         self._screenshot_path = screenshot_path
-        self._author = author
-        self._assigned_to = assigned_to
+        self._author = RecordFields.shared(author)
+        self._assigned_to = RecordFields.shared(assigned_to)
         self._comments: List[Dict] = []
         
     @property
@@ -80,7 +90,7 @@ class Bug:
     
     @property
     def created_at(self) -> str:
-        return self._created_at
+        return RecordFields.unpack_timestamp(self._created_at)
     
     @property
     def task_id(self) -> str:
@@ -129,21 +139,10 @@ class Bug:
         self._priority = priority
     
     def assign_to(self, person: str):
-        self._assigned_to = person
+        self._assigned_to = RecordFields.shared(person)
     
     def update_task_id(self, task_id: str):
-        self._task_id = task_id
-    
-    def get_status_color(self):
-        if self.status == BugStatus.FIXED:
-            return "#4CAF50"
-        elif self.status == BugStatus.OPEN:
-            return "#F44336"
-        elif self.status == BugStatus.IN_PROGRESS:
-            return "#2196F3"
-        elif self.status in [BugStatus.WONT_FIX, BugStatus.DUPLICATE, BugStatus.INVALID]:
-            return "#9E9E9E"
-        return "#FF9800"
+        self._task_id = RecordFields.shared(task_id)
     
     def to_dict(self) -> Dict:
         return {
@@ -152,7 +151,7 @@ class Bug:
             "description": self._description,
             "priority": self._priority.value,
             "status": self._status.value,
-            "created_at": self._created_at,
+            "created_at": RecordFields.unpack_timestamp(self._created_at),
             "task_id": self._task_id,
             "steps_to_reproduce": self._steps_to_reproduce,
             "expected_result": self._expected_result,
@@ -160,28 +159,27 @@ class Bug:
             "screenshot_path": self._screenshot_path,
             "author": self._author,
             "assigned_to": self._assigned_to,
-            "comments": self._comments
+            "comments": list(self._comments)
         }
     
     @staticmethod
     def from_dict(data: Dict) -> 'Bug':
-        bug = Bug(
-            id=data['id'],
-            title=data['title'],
-            description=data['description'],
-            priority=BugPriority.from_string(data['priority']),
-            status=BugStatus(data['status']),
-            created_at=data['created_at'],
-            task_id=data.get('task_id', ''),
-            steps_to_reproduce=data.get('steps_to_reproduce', ''),
-            expected_result=data.get('expected_result', ''),
-            actual_result=data.get('actual_result', ''),
-            screenshot_path=data.get('screenshot_path', ''),
-            author=data.get('author', ''),
-            assigned_to=data.get('assigned_to', '')
-        )
+        created_at = data['created_at']
         
-        comments = data.get('comments', [])
-        bug._comments = comments
+        bug = Bug.__new__(Bug)
+        bug._id = data['id']
+        bug._title = data['title']
+        bug._description = data['description']
+        bug._priority = BugPriority.from_string(data['priority'])
+        bug._status = BUG_STATUSES.get(data['status']) or BugStatus(data['status'])
+        bug._created_at = RecordFields.pack_timestamp(created_at) if created_at else RecordFields.now()
+        bug._task_id = RecordFields.shared(data.get('task_id', ''))
+        bug._steps_to_reproduce = data.get('steps_to_reproduce', '')
+        bug._expected_result = data.get('expected_result', '')
+        bug._actual_result = data.get('actual_result', '')
+        bug._screenshot_path = data.get('screenshot_path', '')
+        bug._author = RecordFields.shared(data.get('author', ''))
+        bug._assigned_to = RecordFields.shared(data.get('assigned_to', ''))
+        bug._comments = list(data.get('comments', []))
         
         return bug
\ No newline at end of file
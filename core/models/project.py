@@ -74,12 +74,22 @@ class Project:
             "description": self._description,
             "author": self._author,
             "created_at": self._created_at,
-            "versions": self._versions,
-            "developers": self._developers,
-            "testers": self._testers,
+            "versions": list(self._versions),
+            "developers": list(self._developers),
+            "testers": list(self._testers),
             "github_url": self._github_url
         }
     
+    def update_from_dict(self, data: Dict):
+        self._name = data['name']
+        self._description = data['description']
+        self._author = data['author']
+        self._created_at = data['created_at']
+        self._versions = list(data.get('versions', []))
+        self._developers = list(data.get('developers', []))
+        self._testers = list(data.get('testers', []))
+        self._github_url = data.get('github_url', '')
+    
     @staticmethod
     def from_dict(data: Dict) -> 'Project':
         project = Project(
@@ -88,8 +98,8 @@ class Project:
             author=data['author'],
             created_at=data['created_at']
         )
-        project._versions = data.get('versions', [])
-        project._developers = data.get('developers', [])
-        project._testers = data.get('testers', [])
+        project._versions = list(data.get('versions', []))
+        project._developers = list(data.get('developers', []))
+        project._testers = list(data.get('testers', []))
         project._github_url = data.get('github_url', '')
         return project
\ No newline at end of file
@@ -0,0 +1,42 @@
+import sys
+from datetime import datetime, timedelta
+from typing import Union
+
+
+class RecordFields:
+
+    EPOCH = datetime(1970, 1, 1)
+    MICROSECOND = timedelta(microseconds=1)
+
+    @staticmethod
+    def shared(value):
+        if type(value) is str:
+            return sys.intern(value)
+        return value
+
+    @staticmethod
+    def now() -> int:
+        return (datetime.now() - RecordFields.EPOCH) // RecordFields.MICROSECOND
+
+    @staticmethod
+    def pack_timestamp(value) -> Union[int, str]:
+        if (
+            type(value) is not str
+            or len(value) not in (19, 26)
+            or value[4] != "-" or value[7] != "-" or value[10] != "T"
+            or value[13] != ":" or value[16] != ":"
+            or (len(value) == 26 and (value[19] != "." or value.endswith("000000")))
+        ):
+            return value
+
+        try:
+            moment = datetime.fromisoformat(value)
+        except ValueError:
+            return value
+        return (moment - RecordFields.EPOCH) // RecordFields.MICROSECOND
+
+    @staticmethod
+    def unpack_timestamp(value) -> str:
+        if type(value) is int:
+            return (RecordFields.EPOCH + timedelta(microseconds=value)).isoformat()
+        return value
@@ -1,9 +1,8 @@
 import json
-from datetime import datetime
 from typing import Dict, Optional, List
 from enum import Enum
 
-from PyQt5.QtGui import QColor
+from core.models.record_fields import RecordFields
 
 
 class TaskPriority(Enum):
@@ -14,10 +13,7 @@ class TaskPriority(Enum):
     
     @staticmethod
     def from_string(priority_str: str) -> 'TaskPriority':
-        for priority in TaskPriority:
-            if priority.value == priority_str.lower():
-                return priority
-        return TaskPriority.MEDIUM
+        return TASK_PRIORITIES.get(priority_str.lower(), TaskPriority.MEDIUM)
 
 
 class TaskStatus(Enum):
@@ -29,8 +25,17 @@ class TaskStatus(Enum):
     BLOCKED = "blocked"
 
 
+TASK_STATUSES = {status.value: status for status in TaskStatus}
+TASK_PRIORITIES = {priority.value: priority for priority in TaskPriority}
+
+
 class Task:
     
+    __slots__ = (
+        "_id", "_title", "_description", "_priority", "_status", "_created_at",
+        "_version", "_test_instructions", "_assigned_to", "_bug_ids"
+    )
+    
     def __init__(self, 
                  id: str, 
                  title: str, 
@@ -47,10 +52,10 @@ class Task:
         self._description = description
         self._priority = priority
         self._status = status
-        self._created_at = created_at or datetime.now().isoformat()
-        self._version = version
+        self._created_at = RecordFields.pack_timestamp(created_at) if created_at else RecordFields.now()
+        self._version = RecordFields.shared(version)
         self._test_instructions = test_instructions
-        self._assigned_to = assigned_to
+        self._assigned_to = RecordFields.shared(assigned_to)
         self._bug_ids: List[str] = []
         
     @property
@@ -75,7 +80,7 @@ class Task:
     
     @property
     def created_at(self) -> str:
-        return self._created_at
+        return RecordFields.unpack_timestamp(self._created_at)
     
     @property
     def version(self) -> str:
@@ -93,20 +98,6 @@ class Task:
     def bug_ids(self) -> List[str]:
         return self._bug_ids
 
-    def get_status_color(self) -> QColor:
-        if self.status == TaskStatus.DONE:
-            return QColor(100, 200, 100)
-        elif self.status == TaskStatus.IN_PROGRESS:
-            return QColor(100, 150, 255)
-        elif self.status == TaskStatus.TESTING:
-            return QColor(200, 150, 255)
-        elif self.status == TaskStatus.READY_FOR_TEST:
-            return QColor(255, 200, 100)
-        elif self.status == TaskStatus.BLOCKED:
-            return QColor(255, 100, 100)
-        else:
-            return QColor(200, 200, 200)
-    
     def add_bug(self, bug_id: str):
         if bug_id not in self._bug_ids:
             self._bug_ids.append(bug_id)
@@ -128,7 +119,7 @@ class Task:
         self._test_instructions = instructions
     
     def update_assigned_to(self, person: str):
-        self._assigned_to = person
+        self._assigned_to = RecordFields.shared(person)
     
     def to_dict(self) -> Dict:
         return {
@@ -137,29 +128,27 @@ class Task:
             "description": self._description,
             "priority": self._priority.value,
             "status": self._status.value,
-            "created_at": self._created_at,
+            "created_at": RecordFields.unpack_timestamp(self._created_at),
             "version": self._version,
             "test_instructions": self._test_instructions,
             "assigned_to": self._assigned_to,
-            "bug_ids": self._bug_ids
+            "bug_ids": list(self._bug_ids)
         }
     
     @staticmethod
     def from_dict(data: Dict) -> 'Task':
-        task = Task(
-            id=data['id'],
-            title=data['title'],
-            description=data['description'],
-            priority=TaskPriority.from_string(data['priority']),
-            status=TaskStatus(data['status']),
-            created_at=data['created_at'],
-            version=data.get('version', ''),
-            test_instructions=data.get('test_instructions', ''),
-            assigned_to=data.get('assigned_to', '')
-        )
+        created_at = data['created_at']
         
-        bug_ids = data.get('bug_ids', [])
-        for bug_id in bug_ids:
-            task.add_bug(bug_id)
+        task = Task.__new__(Task)
+        task._id = data['id']
+        task._title = data['title']
+        task._description = data['description']
+        task._priority = TaskPriority.from_string(data['priority'])
+        task._status = TASK_STATUSES.get(data['status']) or TaskStatus(data['status'])
+        task._created_at = RecordFields.pack_timestamp(created_at) if created_at else RecordFields.now()
+        task._version = RecordFields.shared(data.get('version', ''))
+        task._test_instructions = data.get('test_instructions', '')
+        task._assigned_to = RecordFields.shared(data.get('assigned_to', ''))
+        task._bug_ids = list(dict.fromkeys(data.get('bug_ids', [])))
         
         return task
\ No newline at end of file
@@ -0,0 +1,413 @@
+import argparse
+import asyncio
+import json
+import sys
+from http import HTTPStatus
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from core.managers.project_session import ProjectSession
+from core.models.bug import BugPriority, BugStatus
+from core.models.task import TaskPriority, TaskStatus
+
+
+class HttpError(Exception):
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class TrackerServer:
+
+    SAVE_DELAY_SECONDS = 0.5
+    SYNC_INTERVAL_SECONDS = 1.0
+    MAX_BODY_BYTES = 10 * 1024 * 1024
+
+    ENUM_FIELDS = {
+        "bugs": {"priority": BugPriority, "status": BugStatus},
+        "tasks": {"priority": TaskPriority, "status": TaskStatus},
+    }
+
+    BUG_FIELDS = (
+        "title", "description", "priority", "status", "task_id", "steps_to_reproduce",
+        "expected_result", "actual_result", "screenshot_path", "author", "assigned_to"
+    )
+    TASK_FIELDS = ("title", "description", "priority", "status", "test_instructions", "assigned_to")
+    COMMENT_FIELDS = ("author", "text")
+
+    def __init__(self, session: ProjectSession, host: str = "127.0.0.1", port: int = 8765):
+        self.session = session
+        self.project = session.project
+        self.host = host
+        self.port = port
+
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._save_handle: Optional[asyncio.TimerHandle] = None
+        self._sync_handle: Optional[asyncio.TimerHandle] = None
+        self._saving = False
+
+    async def start(self):
+        self._loop = asyncio.get_running_loop()
+        self.session.writer.on_done = lambda ok: self._loop.call_soon_threadsafe(self._on_saved, ok)
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._sync_handle = self._loop.call_later(self.SYNC_INTERVAL_SECONDS, self._sync_periodically)
+
+    async def serve_forever(self):
+        await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save_handle = None
+        if self._sync_handle is not None:
+            self._sync_handle.cancel()
+            self._sync_handle = None
+
+        await asyncio.get_running_loop().run_in_executor(None, self.flush)
+        self.session.close()
+
+    def flush(self) -> bool:
+        self.session.writer.wait_idle()
+        if not self.session.journal.entry_count:
+            return True
+        return self.session.journal.compact(self.project, self.session.project_data)
+
+    def _sync(self):
+        try:
+            self.session.sync()
+        except Exception as e:
+            print(f"Error reading project changes: {e}")
+            return
+
+        if not self._saving and self._save_handle is None and self.session.journal.needs_compaction:
+            self._save_handle = self._loop.call_later(self.SAVE_DELAY_SECONDS, self._start_save)
+
+    def _sync_periodically(self):
+        self._sync()
+        self._sync_handle = self._loop.call_later(self.SYNC_INTERVAL_SECONDS, self._sync_periodically)
+
+    def _request_save(self):
+        if not self.session.journal.checkpoint(self.project, self.session.project_data):
+            print("Error recording project metadata")
+
+        if self._save_handle is None:
+            self._save_handle = self._loop.call_later(self.SAVE_DELAY_SECONDS, self._start_save)
+
+    def _start_save(self):
+        self._save_handle = None
+        journal = self.session.journal
+        if self._saving or not journal.needs_compaction:
+            return
+
+        try:
+            job = journal.begin_save(self.project, self.session.project_data)
+        except Exception as e:
+            print(f"Error starting save: {e}")
+            return
+
+        if job is not None:
+            self._saving = True
+            self.session.writer.submit(job)
+
+    def _on_saved(self, ok: bool):
+        self._saving = False
+        if not ok:
+            print("Error saving project")
+        if self.session.journal.needs_compaction and self._save_handle is None:
+            self._save_handle = self._loop.call_later(self.SAVE_DELAY_SECONDS, self._start_save)
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+
+                keep_alive = True
+                try:
+                    method, target, headers, keep_alive = self._parse_head(head)
+                    length = self._content_length(headers)
+                    if length > self.MAX_BODY_BYTES:
+                        keep_alive = False
+                        raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large")
+                    body = await reader.readexactly(length) if length else b""
+                    status, payload = self._dispatch(method, target, body)
+                except HttpError as e:
+                    status, payload = e.status, {"error": e.message}
+                except asyncio.IncompleteReadError:
+                    return
+                except Exception as e:
+                    print(f"Error handling request: {e}")
+                    status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Internal server error"}
+
+                writer.write(self._response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    return
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _parse_head(head: bytes) -> Tuple[str, str, Dict[str, str], bool]:
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, protocol = lines[0].split(" ", 2)
+        except ValueError:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Malformed request line")
+
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if protocol == "HTTP/1.1" else connection == "keep-alive"
+        return method.upper(), target, headers, keep_alive
+
+    @staticmethod
+    def _content_length(headers: Dict[str, str]) -> int:
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            length = -1
+        if length < 0:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+        return length
+
+    @staticmethod
+    def _response(status: HTTPStatus, payload, keep_alive: bool) -> bytes:
+        body = b"" if payload is None else json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        return head.encode("latin-1") + body
+
+    @staticmethod
+    def _json_body(body: bytes) -> Dict:
+        try:
+            data = json.loads(body or b"{}")
+        except ValueError:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Body is not valid JSON")
+        if not isinstance(data, dict):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Body must be a JSON object")
+        return data
+
+    def _fields(self, kind: str, data: Dict, allowed) -> Dict:
+        unknown = set(data) - set(allowed)
+        if unknown:
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"Unknown fields: {', '.join(sorted(unknown))}")
+
+        enum_fields = self.ENUM_FIELDS.get(kind, {})
+        fields = dict(data)
+        for name, value in fields.items():
+            if name in enum_fields:
+                fields[name] = self._enum(enum_fields[name], value)
+            elif not isinstance(value, str):
+                raise HttpError(HTTPStatus.BAD_REQUEST, f"{name} must be a string")
+        return fields
+
+    @staticmethod
+    def _enum(enum_type, value):
+        if value is None or value == "":
+            return None
+        try:
+            return enum_type(str(value).lower())
+        except ValueError:
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"Invalid {enum_type.__name__}: {value}")
+
+    def _managers(self, version: str):
+        if version not in self.project.versions:
+            raise HttpError(HTTPStatus.NOT_FOUND, f"Unknown version: {version}")
+        return self.session.managers(version)
+
+    @staticmethod
+    def _page(records: List, query: Dict[str, List[str]]) -> Dict:
+        try:
+            offset = max(int(query.get("offset", ["0"])[0]), 0)
+            limit = int(query["limit"][0]) if "limit" in query else None
+        except ValueError:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "offset and limit must be integers")
+
+        page = records[offset:] if limit is None else records[offset:offset + max(limit, 0)]
+        return {"total": len(records), "items": [record.to_dict() for record in page]}
+
+    def _dispatch(self, method: str, target: str, body: bytes):
+        self._sync()
+        url = urlsplit(target)
+        parts = [unquote(part) for part in url.path.strip("/").split("/") if part]
+        query = parse_qs(url.query)
+
+        if parts == ["versions"] and method == "GET":
+            return HTTPStatus.OK, self.project.versions
+
+        if len(parts) < 3 or parts[0] != "versions":
+            raise HttpError(HTTPStatus.NOT_FOUND, "Not found")
+
+        version, resource, rest = parts[1], parts[2], parts[3:]
+        task_manager, bug_manager = self._managers(version)
+
+        if resource == "stats" and not rest and method == "GET":
+            return HTTPStatus.OK, self.session.statistics(version).snapshot(self.project)
+        if resource == "bugs":
+            return self._bugs(method, rest, query, body, task_manager, bug_manager)
+        if resource == "tasks":
+            return self._tasks(method, rest, query, body, task_manager, bug_manager)
+        raise HttpError(HTTPStatus.NOT_FOUND, "Not found")
+
+    def _bugs(self, method: str, rest: List[str], query, body: bytes, task_manager, bug_manager):
+        if not rest:
+            if method == "GET":
+                bugs = bug_manager.filter_bugs(
+                    priority_filter=self._enum(BugPriority, query.get("priority", [""])[0]),
+                    status_filter=self._enum(BugStatus, query.get("status", [""])[0]),
+                    task_id_filter=query.get("task", [""])[0],
+                    search_text=query.get("search", [""])[0]
+                )
+                return HTTPStatus.OK, self._page(bugs, query)
+
+            if method == "POST":
+                fields = self._fields("bugs", self._json_body(body), self.BUG_FIELDS)
+                if not fields.get("title"):
+                    raise HttpError(HTTPStatus.BAD_REQUEST, "title is required")
+                status = fields.pop("status", None)
+                assigned_to = fields.pop("assigned_to", None)
+
+                bug = bug_manager.add_bug(**{key: value for key, value in fields.items() if value is not None})
+                if not bug:
+                    raise HttpError(HTTPStatus.INTERNAL_SERVER_ERROR, "Failed to add bug")
+                if status or assigned_to is not None:
+                    bug_manager.update_bug(bug.id, status=status, assigned_to=assigned_to or "")
+                self._request_save()
+                return HTTPStatus.CREATED, bug.to_dict()
+
+            raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, "Method not allowed")
+
+        bug_id = rest[0]
+        if not bug_manager.get_bug(bug_id):
+            raise HttpError(HTTPStatus.NOT_FOUND, f"Unknown bug: {bug_id}")
+
+        if rest[1:] == ["comments"] and method == "POST":
+            data = self._fields("comments", self._json_body(body), self.COMMENT_FIELDS)
+            if not data.get("text"):
+                raise HttpError(HTTPStatus.BAD_REQUEST, "text is required")
+            bug_manager.add_comment(bug_id, data.get("author", ""), data["text"])
+            self._request_save()
+            return HTTPStatus.CREATED, bug_manager.get_bug(bug_id).to_dict()
+
+        if len(rest) != 1:
+            raise HttpError(HTTPStatus.NOT_FOUND, "Not found")
+
+        if method == "GET":
+            return HTTPStatus.OK, bug_manager.get_bug(bug_id).to_dict()
+
+        if method == "PATCH":
+            fields = self._fields("bugs", self._json_body(body), self.BUG_FIELDS)
+            fields.pop("author", None)
+            if not bug_manager.update_bug(bug_id, **fields):
+                raise HttpError(HTTPStatus.INTERNAL_SERVER_ERROR, f"Failed to update bug {bug_id}")
+            self._request_save()
+            return HTTPStatus.OK, bug_manager.get_bug(bug_id).to_dict()
+
+        if method == "DELETE":
+            bug_manager.delete_bug(bug_id)
+            self._request_save()
+            return HTTPStatus.NO_CONTENT, None
+
+        raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, "Method not allowed")
+
+    def _tasks(self, method: str, rest: List[str], query, body: bytes, task_manager, bug_manager):
+        if not rest:
+            if method == "GET":
+                tasks = task_manager.filter_tasks(
+                    priority_filter=self._enum(TaskPriority, query.get("priority", [""])[0]),
+                    status_filter=self._enum(TaskStatus, query.get("status", [""])[0]),
+                    search_text=query.get("search", [""])[0]
+                )
+                return HTTPStatus.OK, self._page(tasks, query)
+
+            if method == "POST":
+                fields = self._fields("tasks", self._json_body(body), self.TASK_FIELDS)
+                if not fields.get("title"):
+                    raise HttpError(HTTPStatus.BAD_REQUEST, "title is required")
+                status = fields.pop("status", None)
+
+                task = task_manager.add_task(**{key: value for key, value in fields.items() if value is not None})
+                if not task:
+                    raise HttpError(HTTPStatus.INTERNAL_SERVER_ERROR, "Failed to add task")
+                if status:
+                    task_manager.update_task(task.id, status=status)
+                self._request_save()
+                return HTTPStatus.CREATED, task.to_dict()
+
+            raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, "Method not allowed")
+
+        task_id = rest[0]
+        if len(rest) != 1:
+            raise HttpError(HTTPStatus.NOT_FOUND, "Not found")
+        if not task_manager.get_task(task_id):
+            raise HttpError(HTTPStatus.NOT_FOUND, f"Unknown task: {task_id}")
+
+        if method == "GET":
+            return HTTPStatus.OK, task_manager.get_task(task_id).to_dict()
+
+        if method == "PATCH":
+            fields = self._fields("tasks", self._json_body(body), self.TASK_FIELDS)
+            if not task_manager.update_task(task_id, **fields):
+                raise HttpError(HTTPStatus.INTERNAL_SERVER_ERROR, f"Failed to update task {task_id}")
+            self._request_save()
+            return HTTPStatus.OK, task_manager.get_task(task_id).to_dict()
+
+        if method == "DELETE":
+            task_manager.delete_task(task_id)
+            self._request_save()
+            return HTTPStatus.NO_CONTENT, None
+
+        raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, "Method not allowed")
+
+
+async def _serve(server: TrackerServer):
+    await server.start()
+    print(f"Serving {server.project.name} on http://{server.host}:{server.port}")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m core.server", description="Smart Bug Tracker JSON API")
+    parser.add_argument("project", help="Project file (.bugtracker.json, .bugtracker.db or sharded directory)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args(argv)
+
+    session = ProjectSession.open(args.project)
+    if session is None:
+        print(f"Error: cannot open project {args.project}", file=sys.stderr)
+        return 1
+
+    try:
+        asyncio.run(_serve(TrackerServer(session, args.host, args.port)))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+from typing import Callable, Dict, List, Optional, Tuple
+
+from PyQt5.QtCore import QEvent, QRect, QSize, Qt, pyqtSignal
+from PyQt5.QtGui import QColor, QFont, QPainter, QPixmap
+from PyQt5.QtWidgets import QStyledItemDelegate, QToolTip
+
+
+class ActionButtonDelegate(QStyledItemDelegate):
+
+    BUTTONS = {
+        "view": ("👁️", "#2196F3", "#1976D2", "#0D47A1"),
+        "done": ("✅", "#4CAF50", "#388E3C", "#1B5E20"),
+        "in_progress": ("🔄", "#FF9800", "#F57C00", "#E65100"),
+        "delete": ("🗑️", "#F44336", "#D32F2F", "#B71C1C"),
+    }
+
+    BUTTON_SIZE = QSize(32, 26)
+    MARGIN = 5
+    SPACING = 5
+    RADIUS = 4
+    FONT_PIXEL_SIZE = 12
+
+    NORMAL, HOVER, PRESSED = range(3)
+
+    _pixmaps: Dict[Tuple, QPixmap] = {}
+
+    action_clicked = pyqtSignal(str, str)
+
+    def __init__(self, view, actions_for: Callable[[str], List[Tuple[str, str]]], parent=None):
+        super().__init__(parent or view)
+        self.view = view
+        self.actions_for = actions_for
+        self._hovered: Optional[Tuple[str, str]] = None
+        self._pressed: Optional[Tuple[str, str]] = None
+
+        view.setMouseTracking(True)
+        view.viewport().installEventFilter(self)
+
+    @classmethod
+    def button_pixmap(cls, action: str, state: int, size: QSize, ratio: float) -> QPixmap:
+        key = (action, state, size.width(), size.height(), ratio)
+        pixmap = cls._pixmaps.get(key)
+        if pixmap is not None:
+            return pixmap
+
+        text, *colors = cls.BUTTONS[action]
+        pixmap = QPixmap(int(size.width() * ratio), int(size.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(colors[state]))
+        painter.drawRoundedRect(QRect(0, 0, size.width(), size.height()), cls.RADIUS, cls.RADIUS)
+
+        font = QFont()
+        font.setPixelSize(cls.FONT_PIXEL_SIZE)
+        painter.setFont(font)
+        painter.setPen(Qt.white)
+        painter.drawText(QRect(0, 0, size.width(), size.height()), Qt.AlignCenter, text)
+        painter.end()
+
+        cls._pixmaps[key] = pixmap
+        return pixmap
+
+    def _button_rects(self, rect: QRect, count: int) -> List[QRect]:
+        size = self.BUTTON_SIZE
+        top = rect.top() + (rect.height() - size.height()) // 2
+        left = rect.left() + self.MARGIN
+        return [
+            QRect(left + i * (size.width() + self.SPACING), top, size.width(), size.height())
+            for i in range(count)
+        ]
+
+    def _hit(self, rect: QRect, index, pos) -> Optional[Tuple[str, str]]:
+        record_id = index.data(Qt.UserRole)
+        if not record_id:
+            return None
+
+        actions = self.actions_for(record_id)
+        for (action, _), button_rect in zip(actions, self._button_rects(rect, len(actions))):
+            if button_rect.contains(pos):
+                return record_id, action
+        return None
+
+    def _tooltip(self, record_id: str, action: str) -> str:
+        for name, tooltip in self.actions_for(record_id):
+            if name == action:
+                return tooltip
+        return ""
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+
+        record_id = index.data(Qt.UserRole)
+        if not record_id:
+            return
+
+        actions = self.actions_for(record_id)
+        ratio = painter.device().devicePixelRatioF()
+        for (action, _), button_rect in zip(actions, self._button_rects(option.rect, len(actions))):
+            state = self.NORMAL
+            if self._pressed == (record_id, action):
+                state = self.PRESSED
+            elif self._hovered == (record_id, action):
+                state = self.HOVER
+            painter.drawPixmap(button_rect.topLeft(), self.button_pixmap(action, state, self.BUTTON_SIZE, ratio))
+
+    def sizeHint(self, option, index):
+        record_id = index.data(Qt.UserRole)
+        count = len(self.actions_for(record_id)) if record_id else 0
+        width = self.MARGIN * 2 + count * self.BUTTON_SIZE.width() + max(count - 1, 0) * self.SPACING
+        return QSize(width, self.BUTTON_SIZE.height() + 4)
+
+    def _set_hovered(self, hovered: Optional[Tuple[str, str]]):
+        if hovered != self._hovered:
+            self._hovered = hovered
+            self.view.viewport().update()
+
+    def _hit_at(self, pos) -> Optional[Tuple[str, str]]:
+        index = self.view.indexAt(pos)
+        if not index.isValid() or self.view.itemDelegateForColumn(index.column()) is not self:
+            return None
+        return self._hit(self.view.visualRect(index), index, pos)
+
+    def eventFilter(self, obj, event):
+        event_type = event.type()
+        if event_type == QEvent.MouseMove:
+            self._set_hovered(self._hit_at(event.pos()))
+        elif event_type == QEvent.Leave:
+            self._set_hovered(None)
+        elif event_type == QEvent.MouseButtonRelease and self._pressed is not None:
+            if self._hit_at(event.pos()) != self._pressed:
+                self._pressed = None
+                self.view.viewport().update()
+        return False
+
+    def editorEvent(self, event, model, option, index):
+        event_type = event.type()
+        if event_type not in (QEvent.MouseButtonPress, QEvent.MouseButtonRelease, QEvent.MouseButtonDblClick):
+            return False
+
+        hit = self._hit(option.rect, index, event.pos())
+
+        if event_type == QEvent.MouseButtonPress:
+            if hit is None or event.button() != Qt.LeftButton:
+                return False
+            self._pressed = hit
+            self.view.viewport().update(option.rect)
+            return True
+
+        if event_type == QEvent.MouseButtonDblClick:
+            return hit is not None
+
+        pressed, self._pressed = self._pressed, None
+        if pressed is None:
+            return False
+
+        self.view.viewport().update(option.rect)
+        if hit == pressed:
+            record_id, action = pressed
+            self.action_clicked.emit(action, record_id)
+        return True
+
+    def helpEvent(self, event, view, option, index):
+        hit = self._hit(option.rect, index, event.pos())
+        if hit is None:
+            QToolTip.hideText()
+            return False
+
+        QToolTip.showText(event.globalPos(), self._tooltip(*hit), view)
+        return True
@@ -18,10 +18,12 @@ from typing import List
 
 from core.models.bug import BugPriority
 from core.models.task import Task
+from core.utils.perf import Perf
 
 
 class AddBugDialog(QDialog):
     bug_added = pyqtSignal()
+    @Perf.timed("dialog.add_bug")
     def __init__(self, version: str, available_tasks: List[Task], parent=None):
         super().__init__(parent)
         self.setWindowTitle(f"Add Bug - {version}")
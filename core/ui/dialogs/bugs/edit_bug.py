@@ -17,9 +17,11 @@ from typing import List
 
 from core.models.bug import Bug, BugPriority, BugStatus
 from core.models.task import Task
+from core.utils.perf import Perf
 
 
 class EditBugDialog(QDialog):    
+    @Perf.timed("dialog.edit_bug")
     def __init__(self, bug: Bug, available_tasks: List[Task], is_tester: bool = True, parent=None):
         super().__init__(parent)
         self.setWindowTitle(f"Edit Bug - {bug.id}")
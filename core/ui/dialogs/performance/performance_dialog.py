@@ -0,0 +1,198 @@
+from PyQt5.QtWidgets import (
+    QDialog,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QHeaderView,
+    QAbstractItemView,
+    QFileDialog,
+    QMessageBox
+)
+from PyQt5.QtCore import Qt, QTimer
+
+from core.utils.perf import Perf, PerfMetric
+
+
+class PerformanceDialog(QDialog):
+
+    REFRESH_MS = 1000
+    COLUMNS = ["Operation", "Calls", "Last ms", "p50 ms", "p95 ms", "Max ms", "Total ms", "Bytes/call"]
+
+    @Perf.timed("dialog.performance")
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Performance")
+        self.resize(900, 600)
+        self.setStyleSheet("""
+            QDialog {
+                background-color: #2b2b2b;
+            }
+            QLabel {
+                color: #ffffff;
+            }
+        """)
+
+        self._metrics = {}
+
+        self._setup_ui()
+        self._refresh()
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.REFRESH_MS)
+        self._timer.timeout.connect(self._refresh)
+        if Perf.enabled:
+            self._timer.start()
+
+    def _setup_ui(self):
+        layout = QVBoxLayout()
+
+        if Perf.enabled:
+            status_text = "Instrumentation is on. Latencies cover the last calls of each operation."
+        else:
+            status_text = (
+                f"Instrumentation is off. Start the application with {Perf.ENV_VAR}=1 to collect timings, "
+                f"or with {Perf.TRACE_ENV_VAR}=session.trace.json to also record a trace."
+            )
+        status_label = QLabel(status_text)
+        status_label.setWordWrap(True)
+        status_label.setStyleSheet("color: #888888;")
+        layout.addWidget(status_label)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.setSortingEnabled(True)
+        self.table.itemSelectionChanged.connect(self._show_details)
+        layout.addWidget(self.table)
+
+        self.details_label = QLabel("Select an operation to see its latency histogram")
+        self.details_label.setWordWrap(True)
+        self.details_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.details_label.setMinimumHeight(80)
+        layout.addWidget(self.details_label)
+
+        button_layout = QHBoxLayout()
+
+        refresh_btn = QPushButton("Refresh")
+        refresh_btn.clicked.connect(self._refresh)
+        button_layout.addWidget(refresh_btn)
+
+        reset_btn = QPushButton("Reset")
+        reset_btn.clicked.connect(self._reset)
+        button_layout.addWidget(reset_btn)
+
+        button_layout.addStretch()
+
+        self.trace_label = QLabel()
+        self.trace_label.setStyleSheet("color: #888888;")
+        button_layout.addWidget(self.trace_label)
+
+        self.trace_btn = QPushButton()
+        self.trace_btn.setEnabled(Perf.enabled)
+        self.trace_btn.clicked.connect(self._toggle_trace)
+        button_layout.addWidget(self.trace_btn)
+
+        export_trace_btn = QPushButton("Export Trace...")
+        export_trace_btn.setEnabled(Perf.enabled)
+        export_trace_btn.setToolTip("Save recorded spans as Chrome trace JSON (chrome://tracing, Perfetto)")
+        export_trace_btn.clicked.connect(self._export_trace)
+        button_layout.addWidget(export_trace_btn)
+
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        button_layout.addWidget(close_btn)
+
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
+
+    @staticmethod
+    def _number_item(value, text: str) -> QTableWidgetItem:
+        item = QTableWidgetItem(text)
+        item.setData(Qt.EditRole, value)
+        item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+        return item
+
+    def _selected_name(self):
+        items = self.table.selectedItems()
+        return self.table.item(items[0].row(), 0).text() if items else None
+
+    def _refresh(self):
+        selected = self._selected_name()
+        self._metrics = {metric["name"]: metric for metric in Perf.snapshot()}
+
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(len(self._metrics))
+        for row, metric in enumerate(self._metrics.values()):
+            self.table.setItem(row, 0, QTableWidgetItem(metric["name"]))
+            self.table.setItem(row, 1, self._number_item(metric["calls"], str(metric["calls"])))
+            for column, key in enumerate(("last", "p50", "p95", "max", "total"), start=2):
+                milliseconds = metric[key] * 1000
+                self.table.setItem(row, column, self._number_item(milliseconds, f"{milliseconds:.2f}"))
+            bytes_per_call = metric["bytes_per_call"]
+            self.table.setItem(row, 7, self._number_item(bytes_per_call, f"{bytes_per_call:,.0f}" if metric["bytes"] else ""))
+        self.table.setSortingEnabled(True)
+
+        self._update_trace_controls()
+
+        if selected:
+            for row in range(self.table.rowCount()):
+                if self.table.item(row, 0).text() == selected:
+                    self.table.selectRow(row)
+                    break
+        self._show_details()
+
+    def _show_details(self):
+        metric = self._metrics.get(self._selected_name())
+        if metric is None:
+            return
+
+        buckets = [
+            f"{label}: {count}"
+            for label, count in zip(PerfMetric.bucket_labels(), metric["histogram"])
+            if count
+        ]
+        recent = ", ".join(f"{seconds * 1000:.1f}" for seconds in metric["recent"][-20:])
+        text = f"<b>{metric['name']}</b> — mean {metric['mean'] * 1000:.2f} ms over {metric['calls']} calls"
+        if metric["bytes"]:
+            text += f", {metric['bytes']:,} bytes written"
+        text += f"<br>Histogram: {' | '.join(buckets)}<br>Recent (ms): {recent}"
+        self.details_label.setText(text)
+
+    def _update_trace_controls(self):
+        self.trace_btn.setText("Stop Trace" if Perf.tracing else "Record Trace")
+        state = "recording" if Perf.tracing else "stopped"
+        self.trace_label.setText(f"Trace: {Perf.trace_event_count():,} spans ({state})")
+
+    def _toggle_trace(self):
+        if Perf.tracing:
+            Perf.stop_trace()
+        else:
+            Perf.start_trace()
+        self._update_trace_controls()
+
+    def _export_trace(self):
+        filepath, _ = QFileDialog.getSaveFileName(
+            self, "Export Trace", "session.trace.json", "Chrome Trace (*.json);;All Files (*)"
+        )
+        if not filepath:
+            return
+
+        if Perf.export_trace(filepath):
+            QMessageBox.information(
+                self, "Export Trace",
+                f"Trace exported to:\n{filepath}\n\nOpen it in chrome://tracing or ui.perfetto.dev."
+            )
+        else:
+            QMessageBox.warning(self, "Error", "Failed to export trace")
+
+    def _reset(self):
+        Perf.reset()
+        self._refresh()
+        self.details_label.setText("Select an operation to see its latency histogram")
@@ -7,21 +7,24 @@ from PyQt5.QtWidgets import (
     QHBoxLayout,
     QPushButton,
     QFileDialog, 
-    QMessageBox
+    QMessageBox,
+    QComboBox
 )
 
 import os
 
 from core.models.project import Project
+from core.utils.perf import Perf
 from core.utils.project_file_handler import ProjectFileHandler
 
 
 class NewProjectDialog(QDialog):
     
+    @Perf.timed("dialog.new_project")
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Create New project")
-        self.setFixedSize(400, 450)
+        self.setFixedSize(400, 500)
         self.project_created = False
         self.created_project_path = None
         
@@ -104,6 +107,14 @@ class NewProjectDialog(QDialog):
         path_layout.addWidget(self.browse_btn)
         layout.addLayout(path_layout)
         
+        layout.addWidget(QLabel("Storage format:"))
+        self.format_combo = QComboBox()
+        self.format_combo.addItem("JSON file (.bugtracker.json)", ".bugtracker.json")
+        self.format_combo.addItem("SQLite database (.bugtracker.db)", ".bugtracker.db")
+        self.format_combo.addItem("Sharded directory (.bugtracker/)", ".bugtracker")
+        self.format_combo.setToolTip("SQLite or a sharded directory is recommended for projects with many thousands of bugs")
+        layout.addWidget(self.format_combo)
+        
         layout.addStretch()
         
         btn_layout = QHBoxLayout()
@@ -151,6 +162,7 @@ class NewProjectDialog(QDialog):
         description = self.desc_input.toPlainText().strip()
         author = self.author_input.text().strip()
         folder = self.path_input.text().strip()
+        github_url = self.github_input.text().strip()
         
         if not name:
             QMessageBox.warning(self, "Error", "Input project's title")
@@ -167,7 +179,8 @@ class NewProjectDialog(QDialog):
 
         project.github_url = github_url
         
-        filename = f"{name.replace(' ', '_')}.bugtracker.json"
+        extension = self.format_combo.currentData()
+        filename = f"{name.replace(' ', '_')}{extension}"
         filepath = os.path.join(folder, filename)
         
         if ProjectFileHandler.save_project(project, filepath):
@@ -2,14 +2,17 @@ import os
 
 from PyQt5.QtWidgets import QFileDialog
 
+from core.utils.perf import Perf
+
 
 class OpenProjectDialog(QFileDialog):
     
+    @Perf.timed("dialog.open_project")
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Open project")
         self.setFileMode(QFileDialog.ExistingFile)
-        self.setNameFilter("Smart Bug Tracker (*.bugtracker.json)")
+        self.setNameFilter("Smart Bug Tracker (*.bugtracker.json *.bugtracker.db manifest.json)")
         self.setViewMode(QFileDialog.Detail)
         
         self.setDirectory(os.path.expanduser("~"))
@@ -2,9 +2,12 @@ from PyQt5.QtWidgets import QDialog, QVBoxLayout, QPushButton, QLabel
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont
 
+from core.utils.perf import Perf
+
 
 class RoleSelectionDialog(QDialog):
     
+    @Perf.timed("dialog.role_selection")
     def __init__(self, project_name, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Select Role")
@@ -18,17 +21,17 @@ class RoleSelectionDialog(QDialog):
         layout = QVBoxLayout()
         layout.setSpacing(20)
         
-        header_label = QLabel(f"Select role for working with:\n {self.project_name}")
-        header_label.setAlignment(Qt.AlignCenter)
+        self.header_label = QLabel(f"Select role for working with:\n {self.project_name}")
+        self.header_label.setAlignment(Qt.AlignCenter)
         header_font = QFont()
         header_font.setPointSize(14)
         header_font.setBold(True)
-        header_label.setFont(header_font)
-        header_label.setStyleSheet("color: #0d6efd;")
+        self.header_label.setFont(header_font)
+        self.header_label.setStyleSheet("color: #0d6efd;")
 
-        header_label.setMaximumWidth(380)
+        self.header_label.setMaximumWidth(380)
 
-        layout.addWidget(header_label)
+        layout.addWidget(self.header_label)
         
         layout.addSpacing(20)
         
@@ -51,8 +54,22 @@ class RoleSelectionDialog(QDialog):
         desc_label.setStyleSheet("color: #888888;")
         layout.addWidget(desc_label)
         
+        self.status_label = QLabel()
+        self.status_label.setAlignment(Qt.AlignCenter)
+        self.status_label.setStyleSheet("color: #888888;")
+        self.status_label.hide()
+        layout.addWidget(self.status_label)
+        
         self.setLayout(layout)
     
+    def set_project_name(self, project_name):
+        self.project_name = project_name
+        self.header_label.setText(f"Select role for working with:\n {project_name}")
+    
+    def set_status(self, text):
+        self.status_label.setText(text)
+        self.status_label.setVisible(bool(text))
+    
     def _select_role(self, role):
         self.selected_role = role
         self.accept()
@@ -11,9 +11,11 @@ from PyQt5.QtWidgets import (
 )
 
 from core.models.task import TaskPriority
+from core.utils.perf import Perf
 
 
 class AddTaskDialog(QDialog):    
+    @Perf.timed("dialog.add_task")
     def __init__(self, version: str, parent=None):
         super().__init__(parent)
         self.setWindowTitle(f"Add Test Task - {version}")
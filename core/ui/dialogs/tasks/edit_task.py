@@ -11,9 +11,11 @@ from PyQt5.QtWidgets import (
 )
 
 from core.models.task import Task, TaskPriority, TaskStatus
+from core.utils.perf import Perf
 
 
 class EditTaskDialog(QDialog):    
+    @Perf.timed("dialog.edit_task")
     def __init__(self, task: Task, parent=None):
         super().__init__(parent)
         self.setWindowTitle(f"Edit Task - {task.id}")
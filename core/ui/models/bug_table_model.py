@@ -0,0 +1,61 @@
+from typing import List, Optional
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor
+
+from core.models.bug import Bug, BugPriority
+from core.ui.models.record_table_model import RecordTableModel
+from core.ui.status_colors import StatusColors
+
+
+class BugTableModel(RecordTableModel):
+
+    COLUMNS = ["Title", "Priority", "Status", "Task", "Date", "ID", "Actions"]
+    ID_COLUMN = 5
+    ACTIONS_COLUMN = 6
+
+    PRIORITY_COLORS = {
+        BugPriority.CRITICAL: QColor(255, 100, 100),
+        BugPriority.HIGH: QColor(255, 150, 50),
+        BugPriority.MEDIUM: QColor(255, 200, 50),
+        BugPriority.LOW: QColor(150, 200, 150),
+    }
+
+    def _get_record(self, record_id: str) -> Optional[Bug]:
+        return self.bug_manager.get_bug(record_id) if self.bug_manager else None
+
+    def _column_text(self, bug: Bug, column: int) -> str:
+        if column == 0:
+            return bug.title
+        if column == 1:
+            return bug.priority.value.upper()
+        if column == 2:
+            return bug.status.value.replace('_', ' ').title()
+        if column == 3:
+            return self._task_text(bug)
+        if column == 4:
+            return bug.created_at[:10] if bug.created_at else "N/A"
+        return bug.id
+
+    def _role_data(self, bug: Bug, column: int, role: int):
+        if role == Qt.ForegroundRole:
+            if column == 1:
+                return self.PRIORITY_COLORS.get(bug.priority)
+            if column == 2:
+                return StatusColors.bug(bug.status)
+        return None
+
+    def _task_text(self, bug: Bug) -> str:
+        if not bug.task_id or not self.task_manager:
+            return "No task"
+
+        task = self.task_manager.get_task(bug.task_id)
+        if task:
+            return task.title
+        return f"{bug.task_id} (not found)"
+
+    def bug_at(self, row: int) -> Optional[Bug]:
+        return self.record_at(row)
+
+    def set_bugs(self, bug_manager, task_manager, bugs: List[Bug]):
+        self.set_records(bug_manager, task_manager, bugs)
@@ -0,0 +1,156 @@
+from typing import Dict, List, Optional
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from core.utils.perf import Perf
+
+
+class RecordTableModel(QAbstractTableModel):
+
+    COLUMNS: List[str] = []
+    ID_COLUMN = 0
+    ACTIONS_COLUMN = -1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.bug_manager = None
+        self.task_manager = None
+        self._record_ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._sort_column: Optional[int] = None
+        self._sort_order = Qt.AscendingOrder
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._record_ids)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        record = self.record_at(index.row())
+        if record is None:
+            return None
+
+        column = index.column()
+
+        if role == Qt.UserRole:
+            return record.id
+
+        if role == Qt.DisplayRole:
+            if column == self.ACTIONS_COLUMN:
+                return None
+            return self._column_text(record, column)
+
+        return self._role_data(record, column, role)
+
+    def _get_record(self, record_id: str):
+        raise NotImplementedError
+
+    def _column_text(self, record, column: int) -> str:
+        raise NotImplementedError
+
+    def _role_data(self, record, column: int, role: int):
+        return None
+
+    def record_at(self, row: int):
+        if 0 <= row < len(self._record_ids):
+            return self._get_record(self._record_ids[row])
+        return None
+
+    def row_of(self, record_id: str) -> int:
+        return self._rows.get(record_id, -1)
+
+    def _sort_key(self, record_id: str) -> str:
+        if self._sort_column == self.ID_COLUMN:
+            return record_id
+
+        record = self._get_record(record_id)
+        return self._column_text(record, self._sort_column) if record else ""
+
+    def _sorted(self, record_ids: List[str]) -> List[str]:
+        if self._sort_column is None:
+            return record_ids
+        return sorted(record_ids, key=self._sort_key, reverse=self._sort_order == Qt.DescendingOrder)
+
+    def _in_order(self, first: str, second: str) -> bool:
+        if self._sort_order == Qt.DescendingOrder:
+            return self._sort_key(first) >= self._sort_key(second)
+        return self._sort_key(first) <= self._sort_key(second)
+
+    def _insert_position(self, record_id: str) -> int:
+        if self._sort_column is None:
+            return len(self._record_ids)
+
+        low, high = 0, len(self._record_ids)
+        while low < high:
+            middle = (low + high) // 2
+            if self._in_order(self._record_ids[middle], record_id):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _reindex(self, start: int = 0):
+        for row in range(start, len(self._record_ids)):
+            self._rows[self._record_ids[row]] = row
+
+    def sort(self, column: int, order=Qt.AscendingOrder):
+        if column == self.ACTIONS_COLUMN:
+            return
+
+        self.layoutAboutToBeChanged.emit()
+        self._sort_column = column
+        self._sort_order = order
+        self._record_ids = self._sorted(self._record_ids)
+        self._reindex()
+        self.layoutChanged.emit()
+
+    @Perf.timed("model.set_records")
+    def set_records(self, bug_manager, task_manager, records: List):
+        self.beginResetModel()
+        self.bug_manager = bug_manager
+        self.task_manager = task_manager
+        self._record_ids = self._sorted([record.id for record in records])
+        self._rows = {record_id: row for row, record_id in enumerate(self._record_ids)}
+        self.endResetModel()
+
+    def _misplaced(self, record_id: str) -> bool:
+        row = self._rows[record_id]
+        if row > 0 and not self._in_order(self._record_ids[row - 1], record_id):
+            return True
+        return row + 1 < len(self._record_ids) and not self._in_order(record_id, self._record_ids[row + 1])
+
+    def _remove_row(self, row: int):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[self._record_ids.pop(row)]
+        self._reindex(row)
+        self.endRemoveRows()
+
+    def update_record(self, record_id: str, visible: bool):
+        row = self._rows.get(record_id)
+        if not visible:
+            if row is not None:
+                self._remove_row(row)
+            return
+
+        if row is not None and self._sort_column is not None and self._misplaced(record_id):
+            self._remove_row(row)
+            row = None
+
+        if row is None:
+            row = self._insert_position(record_id)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._record_ids.insert(row, record_id)
+            self._reindex(row)
+            self.endInsertRows()
+            return
+
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.COLUMNS) - 1))
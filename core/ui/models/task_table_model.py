@@ -0,0 +1,104 @@
+from typing import List, Optional
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor, QFont
+
+from core.models.task import Task, TaskPriority, TaskStatus
+from core.ui.models.record_table_model import RecordTableModel
+from core.ui.status_colors import StatusColors
+
+
+class TaskTableModel(RecordTableModel):
+
+    COLUMNS = ["Title", "Description", "Priority", "Status", "Bugs", "ID", "Actions"]
+    BUGS_COLUMN = 4
+    ID_COLUMN = 5
+    ACTIONS_COLUMN = 6
+
+    PRIORITY_COLORS = {
+        TaskPriority.CRITICAL: QColor(255, 100, 100),
+        TaskPriority.HIGH: QColor(255, 150, 50),
+        TaskPriority.MEDIUM: QColor(255, 200, 50),
+        TaskPriority.LOW: QColor(150, 200, 150),
+    }
+
+    PRIORITY_MARKS = {
+        TaskPriority.CRITICAL: "🔥 ",
+        TaskPriority.HIGH: "⚠️ ",
+    }
+
+    DONE_BACKGROUND = QColor(60, 150, 60, 30)
+    BLOCKED_FOREGROUND = QColor(150, 150, 150)
+    BUGS_FOREGROUND = QColor(255, 100, 100)
+
+    def __init__(self, highlight_status: bool = False, parent=None):
+        super().__init__(parent)
+        self.highlight_status = highlight_status
+
+        self._bold_font = QFont()
+        self._bold_font.setBold(True)
+        self._strike_font = QFont()
+        self._strike_font.setStrikeOut(True)
+
+    def _get_record(self, record_id: str) -> Optional[Task]:
+        return self.task_manager.get_task(record_id) if self.task_manager else None
+
+    def bug_count(self, task_id: str) -> int:
+        return self.bug_manager.count_bugs_by_task(task_id) if self.bug_manager else 0
+
+    def _column_text(self, task: Task, column: int) -> str:
+        if column == 0:
+            if not self.highlight_status:
+                return task.title
+            title = self.PRIORITY_MARKS.get(task.priority, "") + task.title
+            if task.status == TaskStatus.DONE:
+                title = "✅ " + title
+            return title
+        if column == 1:
+            return task.description
+        if column == 2:
+            return task.priority.value.upper()
+        if column == 3:
+            return task.status.value.replace('_', ' ').title()
+        if column == self.BUGS_COLUMN:
+            return str(self.bug_count(task.id))
+        return task.id
+
+    def _role_data(self, task: Task, column: int, role: int):
+        if role == Qt.ForegroundRole:
+            if column == 2:
+                return self.PRIORITY_COLORS.get(task.priority)
+            if not self.highlight_status:
+                if column == self.BUGS_COLUMN and self.bug_count(task.id) > 0:
+                    return self.BUGS_FOREGROUND
+                return None
+            if column == 3:
+                return StatusColors.task(task.status)
+            if column == 0 and task.status == TaskStatus.BLOCKED:
+                return self.BLOCKED_FOREGROUND
+            return None
+
+        if not self.highlight_status:
+            return None
+
+        if role == Qt.BackgroundRole:
+            if task.status == TaskStatus.DONE and column != self.ACTIONS_COLUMN:
+                return self.DONE_BACKGROUND
+        elif role == Qt.FontRole and column == 0:
+            if task.status == TaskStatus.IN_PROGRESS:
+                return self._bold_font
+            if task.status == TaskStatus.BLOCKED:
+                return self._strike_font
+        elif role == Qt.ToolTipRole:
+            if column == 0:
+                status_text = task.status.value.replace('_', ' ').title()
+                return f"Status: {status_text}\nDescription: {task.description}"
+            if column == 3:
+                return "Click to change status"
+        return None
+
+    def task_at(self, row: int) -> Optional[Task]:
+        return self.record_at(row)
+
+    def set_tasks(self, bug_manager, task_manager, tasks: List[Task]):
+        self.set_records(bug_manager, task_manager, tasks)
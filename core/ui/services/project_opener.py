@@ -0,0 +1,110 @@
+from typing import Dict, Optional
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from core.managers.project_session import ProjectSession
+from core.utils.project_file_handler import ProjectFileHandler, ProjectLoadCancelled
+
+
+class ProjectOpenSignals(QObject):
+
+    progress = pyqtSignal(str, int, int)
+    meta_loaded = pyqtSignal(dict)
+    finished = pyqtSignal(object, str)
+
+
+class ProjectOpenTask(QRunnable):
+
+    def __init__(self, filepath: str):
+        super().__init__()
+        self.filepath = filepath
+        self.cancelled = False
+        self.signals = ProjectOpenSignals()
+
+    def report(self, stage: str, done: int, total: int):
+        if self.cancelled:
+            raise ProjectLoadCancelled()
+        self.signals.progress.emit(stage, done, total)
+
+    def report_meta(self, meta: Dict):
+        if not self.cancelled:
+            self.signals.meta_loaded.emit(dict(meta))
+
+    def run(self):
+        session = None
+        error = ""
+        try:
+            project = ProjectFileHandler.load_project(self.filepath)
+            if project:
+                self.report_meta(project.to_dict())
+            session = ProjectSession.open(self.filepath, self.report)
+            if session is None:
+                error = "Failed to load project"
+        except ProjectLoadCancelled:
+            if session:
+                session.close()
+            session = None
+        except Exception as e:
+            print(f"Error opening project: {e}")
+            if session:
+                session.close()
+            session = None
+            error = "Failed to load project"
+
+        if self.cancelled:
+            if session:
+                session.close()
+            return
+        self.signals.finished.emit(session, error)
+
+
+class ProjectOpener(QObject):
+
+    progress = pyqtSignal(str, int, int)
+    meta_loaded = pyqtSignal(dict)
+    finished = pyqtSignal(object, str)
+
+    def __init__(self, filepath: str, parent=None):
+        super().__init__(parent)
+        self.filepath = filepath
+        self.session: Optional[ProjectSession] = None
+        self.error = ""
+        self.done = False
+        self._task = ProjectOpenTask(filepath)
+        self._task.signals.progress.connect(self._on_progress)
+        self._task.signals.meta_loaded.connect(self._on_meta_loaded)
+        self._task.signals.finished.connect(self._on_finished)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._task.cancelled
+
+    def start(self):
+        QThreadPool.globalInstance().start(self._task)
+
+    def cancel(self):
+        self._task.cancelled = True
+        if self.session:
+            self.session.close()
+            self.session = None
+
+    def take_session(self) -> Optional[ProjectSession]:
+        session, self.session = self.session, None
+        return session
+
+    def _on_progress(self, stage: str, done: int, total: int):
+        if not self.cancelled:
+            self.progress.emit(stage, done, total)
+
+    def _on_meta_loaded(self, meta: Dict):
+        if not self.cancelled:
+            self.meta_loaded.emit(meta)
+
+    def _on_finished(self, session, error: str):
+        self.done = True
+        self.error = error
+        if self.cancelled and session:
+            session.close()
+            session = None
+        self.session = session
+        self.finished.emit(session, error)
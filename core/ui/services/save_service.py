@@ -0,0 +1,112 @@
+from typing import Dict, Optional, Tuple
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from core.utils.perf import Perf
+
+
+
+class SaveService(QObject):
+
+    DEBOUNCE_MS = 500
+    SYNC_INTERVAL_MS = 1000
+
+    saved = pyqtSignal(bool)
+    project_changed = pyqtSignal()
+    _job_finished = pyqtSignal(bool)
+
+    def __init__(self, session, parent=None):
+        super().__init__(parent)
+        self.session = session
+        self.writer = session.writer
+        self.journal = session.journal
+        self._notify = self._job_finished.emit
+        self.writer.on_done = self._notify
+
+        self._pending: Optional[Tuple] = None
+        self._busy = False
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.DEBOUNCE_MS)
+        self._timer.timeout.connect(self._start_save)
+
+        self._job_finished.connect(self._on_job_finished)
+
+        self._sync_timer = QTimer(self)
+        self._sync_timer.setInterval(self.SYNC_INTERVAL_MS)
+        self._sync_timer.timeout.connect(self.sync)
+        self._sync_timer.start()
+
+    def request_save(self, project, project_data: Dict) -> bool:
+        if not self.journal.checkpoint(project, project_data):
+            return False
+
+        self._pending = (project, project_data)
+        self._timer.start()
+        return True
+
+    @Perf.timed("save.start")
+    def _start_save(self):
+        if self._busy or self._pending is None:
+            return
+
+        project, project_data = self._pending
+        self._pending = None
+
+        try:
+            if self.journal.needs_compaction:
+                job = self.journal.begin_save(project, project_data)
+            else:
+                job = lambda: True
+        except Exception as e:
+            print(f"Error starting save: {e}")
+            self.saved.emit(False)
+            return
+
+        if job is None:
+            self.saved.emit(True)
+            return
+
+        self._busy = True
+        self.writer.submit(job)
+
+    @Perf.timed("save.sync")
+    def sync(self):
+        try:
+            entries = self.session.sync()
+        except Exception as e:
+            print(f"Error reading project changes: {e}")
+            return
+
+        if any(entry.get("k") == "meta" for entry in entries):
+            self.project_changed.emit()
+        if self._pending is None and not self._busy and self.journal.needs_compaction:
+            self._pending = (self.session.project, self.session.project_data)
+            self._timer.start()
+
+    def _on_job_finished(self, ok: bool):
+        self._busy = False
+        self.saved.emit(ok)
+        if self._pending is not None:
+            self._timer.start()
+
+    def wait_idle(self):
+        self.writer.wait_idle()
+
+    @Perf.timed("save.flush")
+    def flush(self, project, project_data: Dict) -> bool:
+        self._timer.stop()
+        self._pending = None
+        self.writer.wait_idle()
+
+        if not self.journal.entry_count:
+            return True
+        return self.journal.compact(project, project_data)
+
+    def shutdown(self):
+        self._timer.stop()
+        self._sync_timer.stop()
+        self._pending = None
+        if self.writer.on_done is self._notify:
+            self.writer.on_done = None
@@ -0,0 +1,90 @@
+from typing import Callable, List, Optional
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+
+class SearchTask(QRunnable):
+
+    def __init__(self, controller, generation: int, query: Callable[[], List]):
+        super().__init__()
+        self.controller = controller
+        self.generation = generation
+        self.query = query
+
+    def run(self):
+        if not self.controller.is_current(self.generation):
+            return
+
+        try:
+            results = self.query()
+        except Exception as e:
+            print(f"Error running search: {e}")
+            return
+
+        if self.controller.is_current(self.generation):
+            self.controller._finished.emit(self.generation, results)
+
+
+class SearchController(QObject):
+
+    DEBOUNCE_MS = 250
+
+    results_ready = pyqtSignal(object)
+    _finished = pyqtSignal(int, object)
+
+    def __init__(self, query_factory: Callable[[], Optional[Callable[[], List]]], parent=None):
+        super().__init__(parent)
+        self.query_factory = query_factory
+        self._generation = 0
+        self._running = False
+
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.DEBOUNCE_MS)
+        self._timer.timeout.connect(self.run_now)
+
+        self._finished.connect(self._on_finished)
+
+    def is_current(self, generation: int) -> bool:
+        return generation == self._generation
+
+    def schedule(self, *args):
+        self._generation += 1
+        self._timer.start()
+
+    def run_now(self):
+        self._timer.stop()
+        self._generation += 1
+
+        query = self.query_factory()
+        self._running = query is not None
+        if query is None:
+            return
+
+        self._pool.clear()
+        self._pool.start(SearchTask(self, self._generation, query))
+
+    def refresh(self):
+        if self._running and not self._timer.isActive():
+            self.run_now()
+
+    def cancel(self):
+        self._timer.stop()
+        self._generation += 1
+        self._running = False
+        self._pool.clear()
+
+    def wait_idle(self):
+        self._pool.waitForDone()
+
+    def shutdown(self):
+        self.cancel()
+        self.wait_idle()
+
+    def _on_finished(self, generation: int, results):
+        if self.is_current(generation):
+            self._running = False
+            self.results_ready.emit(results)
@@ -0,0 +1,69 @@
+import importlib
+import os
+import sys
+from typing import Dict, List, Tuple
+
+from PyQt5.QtCore import QObject, QTimer
+
+from core.utils.perf import Perf
+
+
+class WindowLoader(QObject):
+
+    PREWARM_ENV_VAR = "BUGTRACKER_PREWARM"
+    PREWARM_DELAY_MS = 300
+
+    MODULES: Dict[str, Tuple[str, str]] = {
+        "open_project": ("core.ui.dialogs.projects.open_project", "OpenProjectDialog"),
+        "new_project": ("core.ui.dialogs.projects.new_project", "NewProjectDialog"),
+        "role_selection": ("core.ui.dialogs.roles.role_selection", "RoleSelectionDialog"),
+        "project_opener": ("core.ui.services.project_opener", "ProjectOpener"),
+        "tester": ("core.ui.windows.tester_window", "TesterWindow"),
+        "developer": ("core.ui.windows.developer_window", "DeveloperWindow"),
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pending: List[str] = []
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._prewarm_next)
+
+    @staticmethod
+    def prewarm_enabled() -> bool:
+        return os.environ.get(WindowLoader.PREWARM_ENV_VAR, "1").strip().lower() not in ("0", "false", "no", "off")
+
+    @staticmethod
+    def load(name: str):
+        module_name, attribute = WindowLoader.MODULES[name]
+        module = sys.modules.get(module_name)
+        if module is None:
+            with Perf.span(f"import.{name}"):
+                module = importlib.import_module(module_name)
+        return getattr(module, attribute)
+
+    def start_prewarm(self):
+        if not self.prewarm_enabled():
+            return
+
+        self._pending = [name for name in self.MODULES if self.MODULES[name][0] not in sys.modules]
+        if self._pending:
+            self._timer.start(self.PREWARM_DELAY_MS)
+
+    def stop(self):
+        self._timer.stop()
+        self._pending = []
+
+    def _prewarm_next(self):
+        if not self._pending:
+            return
+
+        name = self._pending.pop(0)
+        try:
+            self.load(name)
+        except Exception as e:
+            print(f"Error pre-loading {name}: {e}")
+
+        if self._pending:
+            self._timer.start(0)
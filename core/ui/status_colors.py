@@ -0,0 +1,34 @@
+from PyQt5.QtGui import QColor
+
+from core.models.bug import BugStatus
+from core.models.task import TaskStatus
+
+
+class StatusColors:
+
+    TASK = {
+        TaskStatus.DONE: QColor(100, 200, 100),
+        TaskStatus.IN_PROGRESS: QColor(100, 150, 255),
+        TaskStatus.TESTING: QColor(200, 150, 255),
+        TaskStatus.READY_FOR_TEST: QColor(255, 200, 100),
+        TaskStatus.BLOCKED: QColor(255, 100, 100),
+    }
+    TASK_DEFAULT = QColor(200, 200, 200)
+
+    BUG = {
+        BugStatus.FIXED: QColor("#4CAF50"),
+        BugStatus.OPEN: QColor("#F44336"),
+        BugStatus.IN_PROGRESS: QColor("#2196F3"),
+        BugStatus.WONT_FIX: QColor("#9E9E9E"),
+        BugStatus.DUPLICATE: QColor("#9E9E9E"),
+        BugStatus.INVALID: QColor("#9E9E9E"),
+    }
+    BUG_DEFAULT = QColor("#FF9800")
+
+    @staticmethod
+    def task(status: TaskStatus) -> QColor:
+        return StatusColors.TASK.get(status, StatusColors.TASK_DEFAULT)
+
+    @staticmethod
+    def bug(status: BugStatus) -> QColor:
+        return StatusColors.BUG.get(status, StatusColors.BUG_DEFAULT)
@@ -5,10 +5,13 @@ from PyQt5.QtGui import *
 
 from core.managers.task_manager import TaskManager
 from core.models.bug import Bug, BugPriority
+from core.ui.status_colors import StatusColors
+from core.utils.perf import Perf
 
 
 class BugDetailWindow(QDialog):
     
+    @Perf.timed("dialog.bug_details")
     def __init__(self, bug: Bug, task_manager: TaskManager = None, parent=None):
         super().__init__(parent)
         self.bug = bug
@@ -339,7 +342,7 @@ class BugDetailWindow(QDialog):
     
     def _load_bug_data(self):
         status_text = self.bug.status.value.replace('_', ' ').title()
-        status_color = QColor(self.bug.get_status_color())
+        status_color = StatusColors.bug(self.bug.status)
         self.status_badge.setText(status_text)
         self.status_badge.setStyleSheet(f"""
             QLabel {{
@@ -1,3 +1,5 @@
+from pathlib import Path
+
 from PyQt5.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -8,20 +10,18 @@ from PyQt5.QtWidgets import (
     QFrame,
     QDialog,
     QDesktopWidget,
-    QMessageBox
+    QMessageBox,
+    QProgressDialog
 )
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont
 
-from core.ui.dialogs.projects.new_project import NewProjectDialog
-from core.ui.dialogs.projects.open_project import OpenProjectDialog
-from core.ui.dialogs.roles.role_selection import RoleSelectionDialog
-from core.ui.windows.developer_window import DeveloperWindow
-from core.ui.windows.tester_window import TesterWindow
-from core.utils.project_file_handler import ProjectFileHandler
+from core.ui.services.window_loader import WindowLoader
+from core.utils.perf import Perf
 
 
 class MainWindow(QMainWindow):
+    @Perf.timed("main.construct")
     def __init__(self, parent=None):
         super().__init__()
         self.setWindowTitle('Smart Bug Tracker')
@@ -172,6 +172,9 @@ class MainWindow(QMainWindow):
 
         self.center_window()
 
+        self.window_loader = WindowLoader(self)
+        self.window_loader.start_prewarm()
+
     def center_window(self):
         frame = self.frameGeometry()
         center_point = QDesktopWidget().availableGeometry().center()
@@ -179,38 +182,101 @@ class MainWindow(QMainWindow):
         self.move(frame.topLeft())
     
     def on_new_project(self):
-        dialog = NewProjectDialog(self)
+        dialog = WindowLoader.load("new_project")(self)
         if dialog.exec_() == QDialog.Accepted:
             self._load_project(dialog.created_project_path)
     
     def on_open_project(self):
-        dialog = OpenProjectDialog(self)
+        dialog = WindowLoader.load("open_project")(self)
         if dialog.exec_():
             files = dialog.selectedFiles()
             if files:
                 self._load_project(files[0])
     
     def _load_project(self, filepath: str):
-        project = ProjectFileHandler.load_project(filepath)
-        if project:
-            self.current_project = project
-            self.current_filepath = filepath
+        opener = WindowLoader.load("project_opener")(filepath, self)
+        role_dialog = WindowLoader.load("role_selection")(project_name=Path(filepath).name, parent=self)
+        
+        role_dialog.set_status("Loading project...")
+        opener.meta_loaded.connect(lambda meta: role_dialog.set_project_name(meta.get("name", "")))
+        opener.progress.connect(lambda stage, done, total: role_dialog.set_status(self._progress_text(stage, done, total)))
+        opener.finished.connect(lambda session, error: role_dialog.reject() if error else role_dialog.set_status(""))
+        
+        try:
+            role, session = self._open_project(opener, role_dialog)
+        finally:
+            for signal in (opener.meta_loaded, opener.progress, opener.finished):
+                signal.disconnect()
+            opener.deleteLater()
+            role_dialog.deleteLater()
+        
+        if not session:
+            return
+        
+        self.current_project = session.project
+        self.current_filepath = filepath
+        
+        if role == "developer":
+            self.developer_window = WindowLoader.load("developer")(session, self)
+            self.developer_window.show()
+            self.hide()
             
-            role_dialog = RoleSelectionDialog(project_name=project.name, parent=self)
-            if role_dialog.exec_() == QDialog.Accepted:
-                role = role_dialog.selected_role
-                
-                if role == "developer":
-                    self.developer_window = DeveloperWindow(project, filepath, self)
-                    self.developer_window.show()
-                    self.hide()
-                    
-                elif role == "tester":
-                    self.tester_window = TesterWindow(project, filepath, self)
-                    self.tester_window.show()
-                    self.hide()
-            else:
-                QMessageBox.warning(self, "Error", "Failed to load project")
+        elif role == "tester":
+            self.tester_window = WindowLoader.load("tester")(session, self)
+            self.tester_window.show()
+            self.hide()
+        else:
+            session.close()
+    
+    def _open_project(self, opener, role_dialog):
+        opener.start()
+        
+        if role_dialog.exec_() != QDialog.Accepted:
+            opener.cancel()
+            if opener.error:
+                QMessageBox.warning(self, "Error", opener.error)
+            return None, None
+        
+        if not opener.done and not self._wait_for_project(opener):
+            opener.cancel()
+            return None, None
+        
+        session = opener.take_session()
+        if not session:
+            QMessageBox.warning(self, "Error", opener.error or "Failed to load project")
+            return None, None
+        return role_dialog.selected_role, session
+    
+    def _wait_for_project(self, opener) -> bool:
+        progress_dialog = QProgressDialog("Loading project...", "Cancel", 0, 0, self)
+        progress_dialog.setWindowTitle("Opening Project")
+        progress_dialog.setWindowModality(Qt.WindowModal)
+        progress_dialog.setMinimumDuration(0)
+        progress_dialog.setAutoClose(False)
+        progress_dialog.setAutoReset(False)
+        
+        def on_progress(stage, done, total):
+            progress_dialog.setLabelText(self._progress_text(stage, done, total))
+            progress_dialog.setMaximum(total)
+            progress_dialog.setValue(min(done, total))
+        
+        def on_finished(session, error):
+            progress_dialog.accept()
+        
+        opener.progress.connect(on_progress)
+        opener.finished.connect(on_finished)
+        try:
+            return progress_dialog.exec_() == QDialog.Accepted and opener.done
+        finally:
+            opener.progress.disconnect(on_progress)
+            opener.finished.disconnect(on_finished)
+            progress_dialog.deleteLater()
+    
+    @staticmethod
+    def _progress_text(stage: str, done: int, total: int) -> str:
+        if stage == "read":
+            return f"Reading project file... {done / 1048576:.1f} / {total / 1048576:.1f} MB"
+        return "Loading project..."
     
     def on_help(self):
         help_text = """
@@ -4,9 +4,12 @@ from PyQt5.QtGui import *
 
 from core.models.bug import BugStatus
 from core.models.task import Task, TaskPriority
+from core.ui.status_colors import StatusColors
+from core.utils.perf import Perf
 
 
 class TaskDetailWindow(QDialog):
+    @Perf.timed("dialog.task_details")
     def __init__(self, task: Task, parent=None):
         super().__init__(parent)
         self.task = task
@@ -157,7 +160,7 @@ class TaskDetailWindow(QDialog):
     
     def _load_task_data(self):
         status_text = self.task.status.value.replace('_', ' ').title()
-        status_color = self.task.get_status_color()
+        status_color = StatusColors.task(self.task.status)
         self.status_label.setText(f"<span style='color: rgb({status_color.red()}, {status_color.green()}, {status_color.blue()});'>{status_text}</span>")
         
         priority_text = self.task.priority.value.upper()
@@ -196,7 +199,6 @@ class TaskDetailWindow(QDialog):
                 return
             
             for bug in bugs:
-                status_color = bug.get_status_color()
                 item_text = f"[{bug.id}] {bug.title} - {bug.status.value.replace('_', ' ').title()}"
                 
                 item = QListWidgetItem(item_text)
@@ -12,9 +12,8 @@ from PyQt5.QtWidgets import (
     QComboBox,
     QPushButton,
     QLineEdit,
-    QTableWidget,
+    QTableView,
     QInputDialog,
-    QTableWidgetItem,
     QMenu,
     QDialog,
     QFileDialog,
@@ -24,26 +23,34 @@ from PyQt5.QtWidgets import (
     QGroupBox,
 )
 from PyQt5.QtCore import Qt, QDateTime
-from PyQt5.QtGui import QKeySequence, QColor, QFont
+from PyQt5.QtGui import QKeySequence
 
-from core.managers.bug_manager import BugManager
-from core.managers.task_manager import TaskManager
 from core.models.bug import BugPriority, BugStatus
 from core.models.task import TaskPriority, TaskStatus
 from core.ui.windows.bug_detailed_window import BugDetailWindow
 from core.ui.windows.task_detail_window import TaskDetailWindow
 from core.ui.dialogs.bugs.add_bug import AddBugDialog
 from core.ui.dialogs.bugs.edit_bug import EditBugDialog
+from core.ui.dialogs.performance.performance_dialog import PerformanceDialog
+from core.ui.delegates.action_button_delegate import ActionButtonDelegate
+from core.ui.models.bug_table_model import BugTableModel
+from core.ui.models.task_table_model import TaskTableModel
+from core.ui.services.save_service import SaveService
+from core.ui.services.search_controller import SearchController
+from core.utils.perf import Perf
 from core.utils.project_file_handler import ProjectFileHandler
-from core.utils.statistics_generator import StatisticsGenerator
 
 
 class TesterWindow(QMainWindow):
     
-    def __init__(self, project, filepath, parent=None):
+    @Perf.timed("tester.construct")
+    def __init__(self, session, parent=None):
         super().__init__(parent)
-        self.project = project
-        self.filepath = filepath
+        self.session = session
+        self.project = session.project
+        self.filepath = session.filepath
+        self.journal = session.journal
+        self._handed_off = False
         
         self.task_manager = None
         self.bug_manager = None
@@ -53,13 +60,11 @@ class TesterWindow(QMainWindow):
         self.selected_task_id = None
         self.selected_bug_id = None
         
-        self.project_data = ProjectFileHandler.load_project_full(filepath)
-        if not self.project_data:
-            QMessageBox.critical(self, "Error", "Failed to load project data")
-            self.close()
-            return
+        self.save_service = SaveService(session, self)
+        self.save_service.saved.connect(self._on_project_saved)
+        self.save_service.project_changed.connect(self._on_project_changed)
         
-        self.setWindowTitle(f"Smart Bug Tracker - {project.name} [Tester]")
+        self.setWindowTitle(f"Smart Bug Tracker - {self.project.name} [Tester]")
         self.setGeometry(100, 100, 1200, 800)
         
         self._setup_ui()
@@ -178,6 +183,10 @@ class TesterWindow(QMainWindow):
         help_shortcuts_action = QAction("Help", self)
         help_shortcuts_action.triggered.connect(self._show_help)
         help_menu.addAction(help_shortcuts_action)
+
+        performance_action = QAction("Performance", self)
+        performance_action.triggered.connect(self._show_performance)
+        help_menu.addAction(performance_action)
     
     def _setup_ui(self):
         central_widget = QWidget()
@@ -303,7 +312,7 @@ class TesterWindow(QMainWindow):
             "Done", 
             "Blocked"
         ])
-        self.task_filter_status.currentTextChanged.connect(self._refresh_tasks_table)
+        self.task_filter_status.currentTextChanged.connect(lambda _: self._refresh_tasks_table())
         filter_panel.addWidget(self.task_filter_status)
         
         self.task_filter_priority = QComboBox()
@@ -314,12 +323,15 @@ class TesterWindow(QMainWindow):
             "Medium", 
             "Low"
         ])
-        self.task_filter_priority.currentTextChanged.connect(self._refresh_tasks_table)
+        self.task_filter_priority.currentTextChanged.connect(lambda _: self._refresh_tasks_table())
         filter_panel.addWidget(self.task_filter_priority)
         
+        self.task_search = SearchController(self._task_query, self)
+        self.task_search.results_ready.connect(self._show_task_results)
+        
         self.task_search_input = QLineEdit()
         self.task_search_input.setPlaceholderText("Search tasks...")
-        self.task_search_input.textChanged.connect(self._refresh_tasks_table)
+        self.task_search_input.textChanged.connect(self.task_search.schedule)
         filter_panel.addWidget(self.task_search_input)
         
         clear_filters_btn = QPushButton("Clear Filters")
@@ -346,22 +358,21 @@ class TesterWindow(QMainWindow):
         filter_panel.addStretch()
         main_layout.addLayout(filter_panel)
         
-        self.tasks_table = QTableWidget()
-        self.tasks_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.tasks_table.setColumnCount(7)
-        self.tasks_table.setHorizontalHeaderLabels([ 
-            "Title",
-            "Description",
-            "Priority", 
-            "Status", 
-            "Bugs", 
-            "ID",
-            "Actions"
-        ])
+        self.task_model = TaskTableModel(parent=self)
+        self.task_model.sort(TaskTableModel.ID_COLUMN, Qt.DescendingOrder)
+        
+        self.tasks_table = QTableView()
+        self.tasks_table.setModel(self.task_model)
+        self.tasks_table.setEditTriggers(QTableView.NoEditTriggers)
         self.tasks_table.horizontalHeader().setStretchLastSection(True)
-        self.tasks_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.tasks_table.setSelectionBehavior(QTableView.SelectRows)
+        self.tasks_table.verticalHeader().setDefaultSectionSize(40)
         
-        self.tasks_table.itemDoubleClicked.connect(self._on_task_double_clicked)
+        self.tasks_table.doubleClicked.connect(self._on_task_double_clicked)
+        
+        self.task_actions = ActionButtonDelegate(self.tasks_table, self._task_actions)
+        self.task_actions.action_clicked.connect(self._on_task_action)
+        self.tasks_table.setItemDelegateForColumn(TaskTableModel.ACTIONS_COLUMN, self.task_actions)
         
         self.tasks_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.tasks_table.customContextMenuRequested.connect(self._show_tasks_context_menu)
@@ -381,17 +392,20 @@ class TesterWindow(QMainWindow):
         
         self.bug_filter_status = QComboBox()
         self.bug_filter_status.addItems(["All Statuses", "Open", "In Progress", "Fixed", "Won't Fix", "Duplicate", "Invalid"])
-        self.bug_filter_status.currentTextChanged.connect(self._refresh_bugs_table)
+        self.bug_filter_status.currentTextChanged.connect(lambda _: self._refresh_bugs_table())
         filter_panel.addWidget(self.bug_filter_status)
         
         self.bug_filter_priority = QComboBox()
         self.bug_filter_priority.addItems(["All Priorities", "Critical", "High", "Medium", "Low"])
-        self.bug_filter_priority.currentTextChanged.connect(self._refresh_bugs_table)
+        self.bug_filter_priority.currentTextChanged.connect(lambda _: self._refresh_bugs_table())
         filter_panel.addWidget(self.bug_filter_priority)
         
+        self.bug_search = SearchController(self._bug_query, self)
+        self.bug_search.results_ready.connect(self._show_bug_results)
+        
         self.bug_search_input = QLineEdit()
         self.bug_search_input.setPlaceholderText("Search bugs...")
-        self.bug_search_input.textChanged.connect(self._refresh_bugs_table)
+        self.bug_search_input.textChanged.connect(self.bug_search.schedule)
         filter_panel.addWidget(self.bug_search_input)
         
         clear_bug_filters_btn = QPushButton("Clear Filters")
@@ -439,14 +453,21 @@ class TesterWindow(QMainWindow):
         filter_panel.addWidget(new_bug_btn)
         main_layout.addLayout(filter_panel)
 
-        self.bugs_table = QTableWidget()
-        self.bugs_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.bugs_table.setColumnCount(7)
-        self.bugs_table.setHorizontalHeaderLabels(["Title", "Priority", "Status", "Task", "Date", "ID", "Actions"])
+        self.bug_model = BugTableModel(self)
+        self.bug_model.sort(BugTableModel.ID_COLUMN, Qt.DescendingOrder)
+        
+        self.bugs_table = QTableView()
+        self.bugs_table.setModel(self.bug_model)
+        self.bugs_table.setEditTriggers(QTableView.NoEditTriggers)
         self.bugs_table.horizontalHeader().setStretchLastSection(True)
-        self.bugs_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.bugs_table.setSelectionBehavior(QTableView.SelectRows)
+        self.bugs_table.verticalHeader().setDefaultSectionSize(40)
+        
+        self.bugs_table.doubleClicked.connect(self._on_bug_double_clicked)
         
-        self.bugs_table.itemDoubleClicked.connect(self._on_bug_double_clicked)
+        self.bug_actions = ActionButtonDelegate(self.bugs_table, self._bug_actions)
+        self.bug_actions.action_clicked.connect(self._on_bug_action)
+        self.bugs_table.setItemDelegateForColumn(BugTableModel.ACTIONS_COLUMN, self.bug_actions)
         
         self.bugs_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.bugs_table.customContextMenuRequested.connect(self._show_bugs_context_menu)
@@ -683,14 +704,13 @@ class TesterWindow(QMainWindow):
         widget.setLayout(main_layout)
         return widget
     
+    @Perf.timed("tester.update_statistics")
     def _update_statistics(self):
         if not self.task_manager or not self.bug_manager:
             self._set_simple_empty_stats()
             return
         
-        stats = StatisticsGenerator.generate_project_stats(
-            self.project, self.task_manager, self.bug_manager
-        )
+        stats = self.session.statistics(self.current_version).snapshot(self.project)
         
         progress_info = stats["progress"]
         task_percentage = progress_info["completion_rate"]
@@ -792,10 +812,11 @@ class TesterWindow(QMainWindow):
             if self._save_project():
                 main_window = self.parent()
                 
-                developer_window = DeveloperWindow(self.project, self.filepath, main_window)
+                developer_window = DeveloperWindow(self.session, main_window)
                 developer_window.show()
                 
-                self.hide()
+                self._handed_off = True
+                self.close()
             else:
                 QMessageBox.warning(self, "Error", "Failed to save project. Please try again.")
         
@@ -804,11 +825,15 @@ class TesterWindow(QMainWindow):
             self.current_version = version
             self._load_version_data(version)
     
+    def _on_project_changed(self):
+        for version in self.project.versions:
+            if self.version_combo.findText(version) < 0:
+                self.version_combo.addItem(version)
+    
+    @Perf.timed("tester.load_version_data")
     def _load_version_data(self, version):
         self.current_version = version
-        
-        self.task_manager = TaskManager(self.project_data, version)
-        self.bug_manager = BugManager(self.project_data, version)
+        self._set_managers(*self.session.managers(version))
         
         self._clear_bug_filters()
         
@@ -823,24 +848,83 @@ class TesterWindow(QMainWindow):
             f"Open Bugs: {self.bug_manager.open_count}"
         )
 
-    def _on_task_double_clicked(self, item):
-        row = item.row()
-        task_id_item = self.tasks_table.item(row, 5)
-        if not task_id_item:
+    def _set_managers(self, task_manager, bug_manager):
+        if self.task_manager:
+            self.task_manager.unsubscribe(self._on_task_changed)
+        if self.bug_manager:
+            self.bug_manager.unsubscribe(self._on_bug_changed)
+        
+        self.task_manager, self.bug_manager = task_manager, bug_manager
+        
+        if task_manager:
+            task_manager.subscribe(self._on_task_changed)
+        if bug_manager:
+            bug_manager.subscribe(self._on_bug_changed)
+    
+    def _on_task_changed(self, event):
+        self._update_task_row(event.record_id)
+        
+        if event.touches("title") and self.bug_manager:
+            for bug_id in list(self.bug_manager.index.ids("task_id", event.record_id)):
+                self._update_bug_row(bug_id)
+        
+        if event.touches("status", "priority"):
+            self._update_statistics()
+    
+    def _on_bug_changed(self, event):
+        self._update_bug_row(event.record_id)
+        
+        if event.touches("task_id"):
+            for task_id in {event.record.task_id, event.previous.get("task_id", "")}:
+                if task_id:
+                    self._update_task_row(task_id)
+        
+        if event.touches("status", "priority"):
+            self._update_statistics()
+    
+    def _on_task_double_clicked(self, index):
+        if index.column() == TaskTableModel.ACTIONS_COLUMN:
             return
         
-        task_id = task_id_item.data(Qt.UserRole)
+        task_id = index.data(Qt.UserRole)
         task = self.task_manager.get_task(task_id)
         
         if task:
             dialog = TaskDetailWindow(task, self)
             dialog.exec_()
     
+    @Perf.timed("tester.refresh_tasks_table")
     def _refresh_tasks_table(self):
+        self.task_search.cancel()
+        if not self.task_manager:
+            self.task_model.set_tasks(None, None, [])
+            return
+        
+        self.task_model.set_tasks(self.bug_manager, self.task_manager, self._filtered_tasks())
+    
+    def _show_task_results(self, tasks):
+        if self.task_manager:
+            self.task_model.set_tasks(self.bug_manager, self.task_manager, tasks)
+    
+    @Perf.timed("tester.update_task_row")
+    def _update_task_row(self, task_id):
         if not self.task_manager:
-            self.tasks_table.setRowCount(0)
             return
         
+        self.task_search.refresh()
+        self.task_model.update_record(task_id, self.task_manager.matches(task_id, **self._task_filter_args()))
+    
+    def _filtered_tasks(self):
+        return self.task_manager.filter_tasks(**self._task_filter_args())
+    
+    def _task_query(self):
+        if not self.task_manager:
+            return None
+        
+        task_manager, filter_args = self.task_manager, self._task_filter_args()
+        return lambda: task_manager.filter_tasks(**filter_args)
+    
+    def _task_filter_args(self):
         status_text = self.task_filter_status.currentText()
         priority_text = self.task_filter_priority.currentText()
         search_text = self.task_search_input.text().strip()
@@ -862,122 +946,44 @@ class TesterWindow(QMainWindow):
         status_filter = status_map.get(status_text) if status_text != "All Statuses" else None
         priority_filter = priority_map.get(priority_text) if priority_text != "All Priorities" else None
         
-        tasks = self.task_manager.filter_tasks(
+        return dict(
             priority_filter=priority_filter,
             status_filter=status_filter,
             search_text=search_text
         )
+    
+    def _select_task_row(self, task_id):
+        row = self.task_model.row_of(task_id)
+        if row < 0:
+            return
         
-        self.tasks_table.setRowCount(len(tasks))
-
-        for row in range(len(tasks)):
-            self.tasks_table.setRowHeight(row, 40)
+        index = self.task_model.index(row, 0)
+        self.tasks_table.selectRow(row)
+        self.tasks_table.scrollTo(index)
+    
+    def _task_actions(self, task_id):
+        task = self.task_manager.get_task(task_id) if self.task_manager else None
+        if not task:
+            return []
         
-        for row, task in enumerate(tasks):
-            
-            title_item = QTableWidgetItem(task.title)
-            self.tasks_table.setItem(row, 0, title_item)
-
-            description_item = QTableWidgetItem(task.description)
-            self.tasks_table.setItem(row, 1, description_item)
-            
-            priority_item = QTableWidgetItem(task.priority.value.upper())
-            if task.priority == TaskPriority.CRITICAL:
-                priority_item.setForeground(QColor(255, 100, 100))
-            elif task.priority == TaskPriority.HIGH:
-                priority_item.setForeground(QColor(255, 150, 50))
-            elif task.priority == TaskPriority.MEDIUM:
-                priority_item.setForeground(QColor(255, 200, 50))
-            else:
-                priority_item.setForeground(QColor(150, 200, 150))
-            self.tasks_table.setItem(row, 2, priority_item)
-            
-            status_item = QTableWidgetItem(task.status.value.replace('_', ' ').title())
-            self.tasks_table.setItem(row, 3, status_item)
-            
-            bugs_count = len(self.bug_manager.get_bugs_by_task(task.id)) if self.bug_manager else 0
-            bugs_item = QTableWidgetItem(str(bugs_count))
-            if bugs_count > 0:
-                bugs_item.setForeground(QColor(255, 100, 100))
-            self.tasks_table.setItem(row, 4, bugs_item)
-
-            id_item = QTableWidgetItem(task.id)
-            id_item.setData(Qt.UserRole, task.id)
-            self.tasks_table.setItem(row, 5, id_item)
-
-            actions_widget = QWidget()
-            actions_layout = QHBoxLayout()
-            actions_layout.setContentsMargins(5, 2, 5, 2)
-            actions_layout.setSpacing(5)
-            
-            view_btn = QPushButton("👁️")
-            view_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #2196F3;
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                    font-size: 12px;
-                }
-                QPushButton:hover {
-                    background-color: #1976D2;
-                }
-                QPushButton:pressed {
-                    background-color: #0D47A1;
-                }
-            """)
-            view_btn.setToolTip("View task details")
-            view_btn.clicked.connect(lambda checked, t=task: self._view_task_details(t))
-            
-            if task.status == TaskStatus.IN_PROGRESS:
-                done_btn = QPushButton("✅")
-                done_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #4CAF50;
-                        color: white;
-                        border: none;
-                        border-radius: 4px;
-                        font-size: 12px;
-                    }
-                    QPushButton:hover {
-                        background-color: #388E3C;
-                    }
-                    QPushButton:pressed {
-                        background-color: #1B5E20;
-                    }
-                """)
-                done_btn.setToolTip("Mark as Done")
-                done_btn.clicked.connect(lambda checked, t=task: self._mark_task_status(t, TaskStatus.DONE))
-                actions_layout.addWidget(done_btn)
-            else:
-                in_progress_btn = QPushButton("🔄")
-                in_progress_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #FF9800;
-                        color: white;
-                        border: none;
-                        border-radius: 4px;
-                        font-size: 12px;
-                    }
-                    QPushButton:hover {
-                        background-color: #F57C00;
-                    }
-                    QPushButton:pressed {
-                        background-color: #E65100;
-                    }
-                """)
-                in_progress_btn.setToolTip("Mark as In Progress")
-                in_progress_btn.clicked.connect(lambda checked, t=task: self._mark_task_status(t, TaskStatus.IN_PROGRESS))
-                actions_layout.addWidget(in_progress_btn)
-            
-            actions_layout.addWidget(view_btn)
-            actions_layout.addStretch()
-            
-            actions_widget.setLayout(actions_layout)
-            
-            self.tasks_table.setCellWidget(row, 6, actions_widget)
+        if task.status == TaskStatus.IN_PROGRESS:
+            actions = [("done", "Mark as Done")]
+        else:
+            actions = [("in_progress", "Mark as In Progress")]
+        actions.append(("view", "View task details"))
+        return actions
+    
+    def _on_task_action(self, action, task_id):
+        task = self.task_manager.get_task(task_id) if self.task_manager else None
+        if not task:
+            return
         
-        self.tasks_table.sortItems(5, Qt.DescendingOrder)
+        if action == "done":
+            self._mark_task_status(task, TaskStatus.DONE)
+        elif action == "in_progress":
+            self._mark_task_status(task, TaskStatus.IN_PROGRESS)
+        elif action == "view":
+            self._view_task_details(task)
     
     def _clear_task_filters(self):
         self.task_filter_status.setCurrentText("All Statuses")
@@ -990,13 +996,11 @@ class TesterWindow(QMainWindow):
 
         self.tasks_table.setFocus()
 
-    def _on_bug_double_clicked(self, item):
-        row = item.row()
-        bug_id_item = self.bugs_table.item(row, 5)
-        if not bug_id_item:
+    def _on_bug_double_clicked(self, index):
+        if index.column() == BugTableModel.ACTIONS_COLUMN:
             return
         
-        bug_id = bug_id_item.data(Qt.UserRole)
+        bug_id = index.data(Qt.UserRole)
         bug = self.bug_manager.get_bug(bug_id)
         
         if bug:
@@ -1013,15 +1017,11 @@ class TesterWindow(QMainWindow):
         
         menu = QMenu()
         
-        selected_row = self.tasks_table.currentRow()
-        if selected_row < 0:
-            return
-        
-        task_id_item = self.tasks_table.item(selected_row, 5)
-        if not task_id_item:
+        selected_index = self.tasks_table.currentIndex()
+        if not selected_index.isValid():
             return
         
-        task_id = task_id_item.data(Qt.UserRole)
+        task_id = selected_index.data(Qt.UserRole)
         task = self.task_manager.get_task(task_id)
         if not task:
             return
@@ -1032,7 +1032,7 @@ class TesterWindow(QMainWindow):
         add_bug_action = menu.addAction("➕ Add Bug for this Task")
         add_bug_action.triggered.connect(lambda: self._add_bug_for_task(task))
         
-        bugs_count = len(self.bug_manager.get_bugs_by_task(task.id)) if self.bug_manager else 0
+        bugs_count = self.bug_manager.count_bugs_by_task(task.id) if self.bug_manager else 0
         if bugs_count > 0:
             view_bugs_action = menu.addAction(f"👁️ View {bugs_count} Bugs")
             view_bugs_action.triggered.connect(lambda: self._view_task_bugs(task))
@@ -1055,16 +1055,43 @@ class TesterWindow(QMainWindow):
     
     def _mark_task_status(self, task, status: TaskStatus):
         if self.task_manager.update_task(task.id, status=status):
-            self._refresh_tasks_table()
             self._save_project()
             status_text = status.value.replace('_', ' ').title()
             self.statusBar().showMessage(f"Task marked as {status_text}", 3000)
         
+    @Perf.timed("tester.refresh_bugs_table")
     def _refresh_bugs_table(self):
+        self.bug_search.cancel()
         if not self.bug_manager:
-            self.bugs_table.setRowCount(0)
+            self.bug_model.set_bugs(None, None, [])
             return
         
+        self.bug_model.set_bugs(self.bug_manager, self.task_manager, self._filtered_bugs())
+        self.bugs_table.setFocus()
+    
+    def _show_bug_results(self, bugs):
+        if self.bug_manager:
+            self.bug_model.set_bugs(self.bug_manager, self.task_manager, bugs)
+    
+    @Perf.timed("tester.update_bug_row")
+    def _update_bug_row(self, bug_id):
+        if not self.bug_manager:
+            return
+        
+        self.bug_search.refresh()
+        self.bug_model.update_record(bug_id, self.bug_manager.matches(bug_id, **self._bug_filter_args()))
+    
+    def _filtered_bugs(self):
+        return self.bug_manager.filter_bugs(**self._bug_filter_args())
+    
+    def _bug_query(self):
+        if not self.bug_manager:
+            return None
+        
+        bug_manager, filter_args = self.bug_manager, self._bug_filter_args()
+        return lambda: bug_manager.filter_bugs(**filter_args)
+    
+    def _bug_filter_args(self):
         status_text = self.bug_filter_status.currentText()
         priority_text = self.bug_filter_priority.currentText()
         search_text = self.bug_search_input.text().strip()
@@ -1088,160 +1115,48 @@ class TesterWindow(QMainWindow):
         status_filter = status_map.get(status_text) if status_text != "All Statuses" else None
         priority_filter = priority_map.get(priority_text) if priority_text != "All Priorities" else None
 
-        bugs = self.bug_manager.filter_bugs(
+        return dict(
             priority_filter=priority_filter,
             status_filter=status_filter,
             search_text=search_text
         )
+    
+    def _select_bug_row(self, bug_id):
+        row = self.bug_model.row_of(bug_id)
+        if row < 0:
+            return
         
-        self.bugs_table.setRowCount(len(bugs))
-
-        for row in range(len(bugs)):
-            self.bugs_table.setRowHeight(row, 40)
-        
-        for row, bug in enumerate(bugs):   
-            title_item = QTableWidgetItem(bug.title)
-            self.bugs_table.setItem(row, 0, title_item)
-            
-            priority_item = QTableWidgetItem(bug.priority.value.upper())
-            
-            if bug.priority == BugPriority.CRITICAL:
-                priority_item.setForeground(QColor(255, 100, 100))
-            elif bug.priority == BugPriority.HIGH:
-                priority_item.setForeground(QColor(255, 150, 50))
-            elif bug.priority == BugPriority.MEDIUM:
-                priority_item.setForeground(QColor(255, 200, 50))
-            else:
-                priority_item.setForeground(QColor(150, 200, 150))
-            
-            self.bugs_table.setItem(row, 1, priority_item)
-            
-            status_item = QTableWidgetItem(bug.status.value.replace('_', ' ').title())
-            status_color = bug.get_status_color()
-            status_item.setForeground(QColor(status_color))
-            self.bugs_table.setItem(row, 2, status_item)
-            
-            task_display_text = ""
-            if bug.task_id and self.task_manager:
-                task = self.task_manager.get_task(bug.task_id)
-                if task:
-                    task_display_text = f"{task.title}"
-                else:
-                    task_display_text = f"{bug.task_id} (not found)"
-            else:
-                task_display_text = "No task"
-            
-            task_item = QTableWidgetItem(task_display_text)
-            task_item.setData(Qt.UserRole, bug.task_id if bug.task_id else "")
-            self.bugs_table.setItem(row, 3, task_item)
-            
-            date_str = bug.created_at[:10] if bug.created_at else "N/A"
-            date_item = QTableWidgetItem(date_str)
-            self.bugs_table.setItem(row, 4, date_item)
-
-            id_item = QTableWidgetItem(bug.id)
-            id_item.setData(Qt.UserRole, bug.id)
-            self.bugs_table.setItem(row, 5, id_item)
-
-            actions_widget = QWidget()
-            actions_layout = QHBoxLayout()
-            actions_layout.setContentsMargins(5, 2, 5, 2)
-            actions_layout.setSpacing(5)
-            
-            view_btn = QPushButton("👁️")
-            view_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #2196F3;
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                    font-size: 12px;
-                }
-                QPushButton:hover {
-                    background-color: #1976D2;
-                }
-                QPushButton:pressed {
-                    background-color: #0D47A1;
-                }
-            """)
-            view_btn.setToolTip("View bug details")
-            view_btn.clicked.connect(lambda checked, b=bug: self._view_bug_details(b))
-            
-            if bug.status == BugStatus.IN_PROGRESS:
-                done_btn = QPushButton("✅")
-                done_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #4CAF50;
-                        color: white;
-                        border: none;
-                        border-radius: 4px;
-                        font-size: 12px;
-                    }
-                    QPushButton:hover {
-                        background-color: #388E3C;
-                    }
-                    QPushButton:pressed {
-                        background-color: #1B5E20;
-                    }
-                """)
-                done_btn.setToolTip("Mark as Done")
-                done_btn.clicked.connect(lambda checked, b=bug: self._mark_bug_status(b, BugStatus.FIXED))
-                actions_layout.addWidget(done_btn)
-            else:
-                in_progress_btn = QPushButton("🔄")
-                in_progress_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #FF9800;
-                        color: white;
-                        border: none;
-                        border-radius: 4px;
-                        font-size: 12px;
-                    }
-                    QPushButton:hover {
-                        background-color: #F57C00;
-                    }
-                    QPushButton:pressed {
-                        background-color: #E65100;
-                    }
-                """)
-                in_progress_btn.setToolTip("Mark as In Progress")
-                in_progress_btn.clicked.connect(lambda checked, b=bug: self._mark_bug_status(b, BugStatus.IN_PROGRESS))
-                actions_layout.addWidget(in_progress_btn)
-
-            delete_btn = QPushButton("🗑️")
-            delete_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #F44336;
-                        color: white;
-                        border: none;
-                        border-radius: 4px;
-                        font-size: 12px;
-                    }
-                    QPushButton:hover {
-                        background-color: #D32F2F;
-                    }
-                    QPushButton:pressed {
-                        background-color: #B71C1C;
-                    }
-                """)
-            delete_btn.setToolTip("Delete task")
-            delete_btn.clicked.connect(lambda checked, b=bug: self._delete_bug(b))
-            
-            actions_layout.addWidget(view_btn)
-            actions_layout.addWidget(delete_btn)
-            actions_layout.addStretch()
-            
-            actions_widget.setLayout(actions_layout)
-            
-            self.bugs_table.setCellWidget(row, 6, actions_widget)
-
+        index = self.bug_model.index(row, 0)
+        self.bugs_table.selectRow(index.row())
+        self.bugs_table.scrollTo(index)
+    
+    def _bug_actions(self, bug_id):
+        bug = self.bug_manager.get_bug(bug_id) if self.bug_manager else None
+        if not bug:
+            return []
         
-        self.bugs_table.sortItems(6, Qt.DescendingOrder)
+        if bug.status == BugStatus.IN_PROGRESS:
+            actions = [("done", "Mark as Done")]
+        else:
+            actions = [("in_progress", "Mark as In Progress")]
+        actions.append(("view", "View bug details"))
+        actions.append(("delete", "Delete bug"))
+        return actions
+    
+    def _on_bug_action(self, action, bug_id):
+        bug = self.bug_manager.get_bug(bug_id) if self.bug_manager else None
+        if not bug:
+            return
         
-        self.bugs_table.sortItems(5, Qt.DescendingOrder)
-
-        self.bugs_table.setFocus()
-
+        if action == "done":
+            self._mark_bug_status(bug, BugStatus.FIXED)
+        elif action == "in_progress":
+            self._mark_bug_status(bug, BugStatus.IN_PROGRESS)
+        elif action == "view":
+            self._view_bug_details(bug)
+        elif action == "delete":
+            self._delete_bug(bug)
+    
     def _clear_selection(self):
         self.tasks_table.clearSelection()
         self.bugs_table.clearSelection()
@@ -1262,15 +1177,11 @@ class TesterWindow(QMainWindow):
         
         menu = QMenu()
         
-        selected_row = self.bugs_table.currentRow()
-        if selected_row < 0:
-            return
-        
-        bug_id_item = self.bugs_table.item(selected_row, 5)
-        if not bug_id_item:
+        selected_index = self.bugs_table.currentIndex()
+        if not selected_index.isValid():
             return
         
-        bug_id = bug_id_item.data(Qt.UserRole)
+        bug_id = selected_index.data(Qt.UserRole)
         bug = self.bug_manager.get_bug(bug_id)
         if not bug:
             return
@@ -1312,7 +1223,6 @@ class TesterWindow(QMainWindow):
         if ok and comment.strip():
             author = "Tester"
             if self.bug_manager.add_comment(bug.id, author, comment.strip()):
-                self._refresh_bugs_table()
                 self._save_project()
                 self.statusBar().showMessage("Comment added successfully!", 3000)
     
@@ -1333,18 +1243,11 @@ class TesterWindow(QMainWindow):
             if bug_data:
                 bug = self.bug_manager.add_bug(**bug_data)
                 if bug:
-                    self._refresh_bugs_table()
-                    self._refresh_tasks_table()
-                    self._update_statistics()
                     self._save_project()
                     
                     self.tab_widget.setCurrentIndex(1)
                     
-                    for row in range(self.bugs_table.rowCount()):
-                        item = self.bugs_table.item(row, 0)
-                        if item and item.text() == bug.id:
-                            self.bugs_table.selectRow(row)
-                            break
+                    self._select_bug_row(bug.id)
                     
                     QMessageBox.information(
                         self, 
@@ -1377,18 +1280,11 @@ class TesterWindow(QMainWindow):
             if bug_data:
                 bug = self.bug_manager.add_bug(**bug_data)
                 if bug:
-                    self._refresh_bugs_table()
-                    self._refresh_tasks_table()
-                    self._update_statistics()
                     self._save_project()
                     
                     self.tab_widget.setCurrentIndex(1)
                     
-                    for row in range(self.bugs_table.rowCount()):
-                        item = self.bugs_table.item(row, 0)
-                        if item and item.text() == bug.id:
-                            self.bugs_table.selectRow(row)
-                            break
+                    self._select_bug_row(bug.id)
                     
                     QMessageBox.information(
                         self, 
@@ -1408,13 +1304,11 @@ class TesterWindow(QMainWindow):
         if dialog.exec_() == QDialog.Accepted:
             updated_data = dialog.get_updated_bug_data()
             if updated_data and self.bug_manager.update_bug(bug.id, **updated_data):
-                self._refresh_bugs_table()
                 self._save_project()
                 self.statusBar().showMessage("Bug updated successfully!", 3000)
     
     def _mark_bug_status(self, bug, status: BugStatus):
         if self.bug_manager.update_bug(bug.id, status=status):
-            self._refresh_bugs_table()
             self._save_project()
             status_text = status.value.replace('_', ' ').title()
             self.statusBar().showMessage(f"Bug marked as {status_text}", 3000)
@@ -1430,9 +1324,6 @@ class TesterWindow(QMainWindow):
         
         if reply == QMessageBox.Yes:
             if self.bug_manager.delete_bug(bug.id):
-                self._refresh_bugs_table()
-                self._refresh_tasks_table()
-                self._update_statistics()
                 self._save_project()
                 self.statusBar().showMessage("Bug deleted successfully!", 3000)
     
@@ -1444,30 +1335,44 @@ class TesterWindow(QMainWindow):
         if bugs:
             self.tab_widget.setCurrentIndex(1)
             self.bug_search_input.setText(task.id)
+            self.bug_search.run_now()
         else:
             QMessageBox.information(self, "Info", f"No bugs found for task {task.id}")
     
     def _save_project(self):
-        versions_data = self.project_data.get("versions", {})
-        
-        if ProjectFileHandler.save_project(self.project, self.filepath, versions_data):
-            self.statusBar().showMessage("Project saved successfully!", 3000)
+        if self.save_service.request_save(self.project, self.session.project_data):
             return True
         else:
             QMessageBox.warning(self, "Error", "Failed to save project")
             return False
     
+    def _on_project_saved(self, ok):
+        if ok:
+            self.statusBar().showMessage("Project saved successfully!", 3000)
+        else:
+            QMessageBox.warning(self, "Error", "Failed to save project")
+    
+    def closeEvent(self, event):
+        self.bug_search.shutdown()
+        self.task_search.shutdown()
+        self._set_managers(None, None)
+        self.save_service.shutdown()
+        if not self._handed_off:
+            if not self.save_service.flush(self.project, self.session.project_data):
+                QMessageBox.warning(self, "Error", "Failed to save project")
+            self.session.close()
+        super().closeEvent(event)
+    
     def _refresh_data(self):
-        self.project_data = ProjectFileHandler.load_project_full(self.filepath)
-        if not self.project_data:
+        self.save_service.flush(self.project, self.session.project_data)
+        if not self.session.reload():
             QMessageBox.warning(self, "Error", "Failed to reload project data")
             return
         
         self._clear_selection()
         
         if self.current_version:
-            self.task_manager = TaskManager(self.project_data, self.current_version)
-            self.bug_manager = BugManager(self.project_data, self.current_version)
+            self._set_managers(*self.session.managers(self.current_version))
             self._refresh_tasks_table()
             self._refresh_bugs_table()
             self._update_statistics()
@@ -1483,7 +1388,8 @@ class TesterWindow(QMainWindow):
         
         if file_path:
             try:
-                versions_data = self.project_data.get("versions", {})
+                self.journal.ensure_all_versions(self.session.project_data)
+                versions_data = self.session.project_data.get("versions", {})
                 success = ProjectFileHandler.save_project(self.project, file_path, versions_data)
                 
                 if success:
@@ -1509,12 +1415,13 @@ class TesterWindow(QMainWindow):
             try:
                 import json
                 
+                live_statistics = self.session.statistics(self.current_version)
                 stats = {
                     "project": self.project.name,
                     "version": self.current_version,
                     "date": QDateTime.currentDateTime().toString(Qt.ISODate),
-                    "task_statistics": self.task_manager.get_task_statistics(),
-                    "bug_statistics": self.bug_manager.get_bug_statistics()
+                    "task_statistics": live_statistics.task_statistics(),
+                    "bug_statistics": live_statistics.bug_statistics()
                 }
                 
                 with open(file_path, 'w', encoding='utf-8') as f:
@@ -1528,16 +1435,12 @@ class TesterWindow(QMainWindow):
         if not self.bug_manager:
             return
         
-        selected_row = self.bugs_table.currentRow()
-        if selected_row < 0:
+        selected_index = self.bugs_table.currentIndex()
+        if not selected_index.isValid():
             QMessageBox.warning(self, "No Selection", "Please select a bug to delete")
             return
         
-        bug_id_item = self.bugs_table.item(selected_row, 5)
-        if not bug_id_item:
-            return
-        
-        bug_id = bug_id_item.data(Qt.UserRole)
+        bug_id = selected_index.data(Qt.UserRole)
         bug = self.bug_manager.get_bug(bug_id)
         
         if bug:
@@ -1547,16 +1450,12 @@ class TesterWindow(QMainWindow):
         if not self.bug_manager:
             return
         
-        selected_row = self.bugs_table.currentRow()
-        if selected_row < 0:
+        selected_index = self.bugs_table.currentIndex()
+        if not selected_index.isValid():
             QMessageBox.warning(self, "No Selection", "Please select a bug to edit")
             return
         
-        bug_id_item = self.bugs_table.item(selected_row, 5)
-        if not bug_id_item:
-            return
-        
-        bug_id = bug_id_item.data(Qt.UserRole)
+        bug_id = selected_index.data(Qt.UserRole)
         bug = self.bug_manager.get_bug(bug_id)
         
         if bug:
@@ -1566,16 +1465,12 @@ class TesterWindow(QMainWindow):
         if not self.bug_manager:
             return
         
-        selected_row = self.bugs_table.currentRow()
-        if selected_row < 0:
+        selected_index = self.bugs_table.currentIndex()
+        if not selected_index.isValid():
             QMessageBox.warning(self, "No Selection", "Please select a bug")
             return
         
-        bug_id_item = self.bugs_table.item(selected_row, 5)
-        if not bug_id_item:
-            return
-        
-        bug_id = bug_id_item.data(Qt.UserRole)
+        bug_id = selected_index.data(Qt.UserRole)
         bug = self.bug_manager.get_bug(bug_id)
         
         if bug:
@@ -1655,6 +1550,10 @@ class TesterWindow(QMainWindow):
         
         QMessageBox.about(self, "About Smart Bug Tracker", about_text)
     
+    def _show_performance(self):
+        dialog = PerformanceDialog(self)
+        dialog.exec_()
+    
     def _show_help(self):
         help_dialog = QDialog(self)
         help_dialog.setWindowTitle("Keyboard Shortcuts Help")
@@ -0,0 +1,204 @@
+import atexit
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+from typing import Deque, Dict, List, Optional, Tuple
+
+
+class PerfMetric:
+
+    BUCKETS_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000, 5000)
+    RECENT = 256
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.bytes = 0
+        self.histogram: List[int] = [0] * (len(self.BUCKETS_MS) + 1)
+        self.recent: Deque[float] = deque(maxlen=self.RECENT)
+
+    def add(self, seconds: float):
+        self.calls += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.histogram[bisect_left(self.BUCKETS_MS, seconds * 1000)] += 1
+        self.recent.append(seconds)
+
+    @staticmethod
+    def bucket_labels() -> List[str]:
+        labels = [f"≤{bound:g} ms" for bound in PerfMetric.BUCKETS_MS]
+        labels.append(f">{PerfMetric.BUCKETS_MS[-1]:g} ms")
+        return labels
+
+    @staticmethod
+    def _percentile(ordered: List[float], fraction: float) -> float:
+        if not ordered:
+            return 0.0
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+    def snapshot(self) -> Dict:
+        ordered = sorted(self.recent)
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "total": self.total,
+            "mean": self.total / self.calls if self.calls else 0.0,
+            "max": self.max,
+            "last": self.recent[-1] if self.recent else 0.0,
+            "p50": self._percentile(ordered, 0.5),
+            "p95": self._percentile(ordered, 0.95),
+            "bytes": self.bytes,
+            "bytes_per_call": self.bytes / self.calls if self.calls else 0,
+            "histogram": list(self.histogram),
+            "recent": list(self.recent)
+        }
+
+
+class Perf:
+
+    ENV_VAR = "BUGTRACKER_PERF"
+    TRACE_ENV_VAR = "BUGTRACKER_TRACE"
+    TRACE_LIMIT = 200_000
+
+    trace_path = os.environ.get(TRACE_ENV_VAR, "").strip() or None
+    enabled = (
+        os.environ.get(ENV_VAR, "").strip().lower() not in ("", "0", "false", "no", "off")
+        or trace_path is not None
+    )
+    tracing = trace_path is not None
+
+    _metrics: Dict[str, PerfMetric] = {}
+    _events: Deque[Tuple[str, float, float, int]] = deque(maxlen=TRACE_LIMIT)
+    _threads: Dict[int, str] = {}
+    _origin = time.perf_counter()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _metric(name: str) -> PerfMetric:
+        metric = Perf._metrics.get(name)
+        if metric is None:
+            metric = Perf._metrics[name] = PerfMetric(name)
+        return metric
+
+    @staticmethod
+    def record(name: str, seconds: float, started: Optional[float] = None):
+        with Perf._lock:
+            Perf._metric(name).add(seconds)
+
+            if Perf.tracing and started is not None:
+                thread_id = threading.get_native_id()
+                if thread_id not in Perf._threads:
+                    Perf._threads[thread_id] = threading.current_thread().name
+                Perf._events.append((name, started, seconds, thread_id))
+
+    @staticmethod
+    def add_bytes(name: str, size: int):
+        if not Perf.enabled:
+            return
+        with Perf._lock:
+            Perf._metric(name).bytes += size
+
+    @staticmethod
+    def timed(name: str):
+        def decorate(func):
+            if not Perf.enabled:
+                return func
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                started = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    Perf.record(name, time.perf_counter() - started, started)
+
+            return wrapper
+
+        return decorate
+
+    @staticmethod
+    @contextmanager
+    def span(name: str):
+        if not Perf.enabled:
+            yield
+            return
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            Perf.record(name, time.perf_counter() - started, started)
+
+    @staticmethod
+    def snapshot() -> List[Dict]:
+        with Perf._lock:
+            return [metric.snapshot() for _, metric in sorted(Perf._metrics.items())]
+
+    @staticmethod
+    def reset():
+        with Perf._lock:
+            Perf._metrics.clear()
+
+    @staticmethod
+    def start_trace():
+        with Perf._lock:
+            Perf._events.clear()
+            Perf.tracing = Perf.enabled
+
+    @staticmethod
+    def stop_trace():
+        Perf.tracing = False
+
+    @staticmethod
+    def trace_events() -> List[Dict]:
+        with Perf._lock:
+            events = sorted(Perf._events, key=lambda event: event[1])
+            threads = dict(Perf._threads)
+
+        process_id = os.getpid()
+        trace = [
+            {"name": "process_name", "ph": "M", "pid": process_id, "tid": 0, "args": {"name": "Smart Bug Tracker"}}
+        ]
+        trace.extend(
+            {"name": "thread_name", "ph": "M", "pid": process_id, "tid": thread_id, "args": {"name": thread_name}}
+            for thread_id, thread_name in threads.items()
+        )
+        trace.extend(
+            {
+                "name": name,
+                "cat": name.split(".", 1)[0],
+                "ph": "X",
+                "ts": round((started - Perf._origin) * 1_000_000, 3),
+                "dur": round(seconds * 1_000_000, 3),
+                "pid": process_id,
+                "tid": thread_id
+            }
+            for name, started, seconds, thread_id in events
+        )
+        return trace
+
+    @staticmethod
+    def export_trace(filepath: str) -> bool:
+        try:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump({"traceEvents": Perf.trace_events(), "displayTimeUnit": "ms"}, f)
+            return True
+        except Exception as e:
+            print(f"Error exporting trace: {e}")
+            return False
+
+    @staticmethod
+    def trace_event_count() -> int:
+        return len(Perf._events)
+
+
+if Perf.trace_path:
+    atexit.register(Perf.export_trace, Perf.trace_path)
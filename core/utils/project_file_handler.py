@@ -1,13 +1,28 @@
 import json
+import os
+import shutil
+import uuid
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Callable, Optional, Dict, Tuple
 
 from core.models.project import Project
+from core.utils.perf import Perf
+from core.utils.project_journal import ProjectJournal
+from core.utils.project_stream_reader import ProjectStreamReader
+from core.utils.sharded_storage import ShardedProjectStorage
+from core.utils.sqlite_storage import SQLiteProjectStorage
+
+
+class ProjectLoadCancelled(Exception):
+    pass
 
 
 class ProjectFileHandler:
     
+    READ_CHUNK_BYTES = 1 << 20
+    
     @staticmethod
+    @Perf.timed("file.save_project")
     def save_project(project: Project, filepath: str, versions_data: Dict = None) -> bool:
         try:
             filepath = Path(filepath)
@@ -18,24 +33,92 @@ class ProjectFileHandler:
                 "versions": versions_data if versions_data else {}
             }
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(project_data, f, indent=4, ensure_ascii=False)
+            if SQLiteProjectStorage.is_storage_path(filepath):
+                storage = SQLiteProjectStorage(filepath)
+                try:
+                    storage.save_project_data(project_data)
+                finally:
+                    storage.close()
+                ProjectJournal(filepath).discard()
+                return True
+            
+            if ShardedProjectStorage.is_storage_path(filepath):
+                storage = ShardedProjectStorage(filepath)
+                storage.save_project_data(project_data)
+                ProjectJournal(storage.filepath).discard()
+                return True
+            
+            ProjectFileHandler.write_project_file(filepath, project_data)
+            ProjectJournal(filepath).discard()
             return True
         except Exception as e:
             print(f"Error saving project: {e}")
             return False
     
     @staticmethod
+    @Perf.timed("file.write_project_file")
+    def write_project_file(filepath: str, project_data: Dict):
+        filepath = Path(filepath)
+        fd, temp_path = ProjectFileHandler._create_temp_file(filepath)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(project_data, f, indent=4, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+                Perf.add_bytes("file.write_project_file", f.tell())
+            if filepath.exists():
+                shutil.copymode(filepath, temp_path)
+            os.replace(temp_path, filepath)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+        ProjectFileHandler._fsync_directory(filepath.parent)
+    
+    @staticmethod
+    def _create_temp_file(filepath: Path) -> Tuple[int, str]:
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+        while True:
+            temp_path = str(filepath.parent / f".{filepath.name}.{uuid.uuid4().hex[:12]}.tmp")
+            try:
+                return os.open(temp_path, flags, 0o666), temp_path
+            except FileExistsError:
+                continue
+    
+    @staticmethod
+    def _fsync_directory(directory: Path):
+        try:
+            fd = os.open(str(directory), os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+    
+    @staticmethod
+    @Perf.timed("file.load_project")
     def load_project(filepath: str) -> Optional[Project]:
         try:
             filepath = Path(filepath)
             if not filepath.exists():
                 return None
-                
-            with open(filepath, 'r', encoding='utf-8') as f:
-                project_data = json.load(f)
-                
-            meta_data = project_data.get("meta", {})
+            
+            storage = ProjectFileHandler._open_storage(str(filepath))
+            try:
+                if storage is not None:
+                    meta_data = storage.load_meta()
+                    journal_path = storage.filepath
+                else:
+                    with Perf.span("file.json_parse"):
+                        meta_data = ProjectStreamReader(filepath).read_meta()
+                    journal_path = str(filepath)
+            finally:
+                if storage is not None:
+                    storage.close()
+            meta_data = ProjectJournal.read_meta(journal_path) or meta_data or {}
 
             if 'github_url' not in meta_data:
                 meta_data['github_url'] = ''
@@ -46,18 +129,96 @@ class ProjectFileHandler:
             return None
     
     @staticmethod
-    def load_project_full(filepath: str) -> Optional[Dict]:
+    def read_project_bytes(filepath, progress: Callable[[str, int, int], None]) -> bytearray:
+        total = os.path.getsize(filepath)
+        data = bytearray(total)
+        view = memoryview(data)
+        done = 0
+        
+        with open(filepath, 'rb') as f:
+            while done < total:
+                read = f.readinto(view[done:done + ProjectFileHandler.READ_CHUNK_BYTES])
+                if not read:
+                    break
+                done += read
+                progress("read", done, total)
+        
+        view.release()
+        del data[done:]
+        return data
+    
+    @staticmethod
+    @Perf.timed("file.load_project_full")
+    def load_project_full(filepath: str, lazy_versions: bool = False,
+                          progress: Optional[Callable[[str, int, int], None]] = None,
+                          journal: Optional[ProjectJournal] = None) -> Optional[Dict]:
         try:
             filepath = Path(filepath)
             if not filepath.exists():
                 return None
-                
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            
+            owns_journal = journal is None
+            if owns_journal:
+                journal = ProjectFileHandler.open_journal(str(filepath))
+            try:
+                entries = journal.open_tail()
+                project_data = ProjectFileHandler._load_base(filepath, journal.storage, lazy_versions, progress)
+                if not project_data:
+                    return None
+                lazy = lazy_versions and isinstance(journal.storage, ShardedProjectStorage)
+                return journal.replay(project_data, entries, lazy)
+            finally:
+                if owns_journal:
+                    journal.close()
+        except ProjectLoadCancelled:
+            raise
         except Exception as e:
             print(f"Error loading full project: {e}")
             return None
     
+    @staticmethod
+    def _load_base(filepath: Path, storage, lazy_versions: bool,
+                   progress: Optional[Callable[[str, int, int], None]]) -> Optional[Dict]:
+        if isinstance(storage, ShardedProjectStorage):
+            return storage.load_project_data(lazy_versions)
+        if storage is not None:
+            return storage.load_project_data()
+        
+        if progress:
+            data = ProjectFileHandler.read_project_bytes(filepath, progress)
+            with Perf.span("file.json_parse"):
+                project_data = json.loads(data)
+            del data
+            return project_data
+        
+        with open(filepath, 'r', encoding='utf-8') as f, Perf.span("file.json_parse"):
+            return json.load(f)
+    
+    @staticmethod
+    def _open_storage(filepath: str):
+        if SQLiteProjectStorage.is_storage_path(filepath):
+            return SQLiteProjectStorage(filepath)
+        if ShardedProjectStorage.is_storage_path(filepath):
+            return ShardedProjectStorage(filepath)
+        return None
+    
+    @staticmethod
+    def open_journal(filepath: str, writer=None) -> ProjectJournal:
+        storage = ProjectFileHandler._open_storage(filepath)
+        if storage is None:
+            return ProjectJournal(filepath, writer)
+        return ProjectJournal(storage.filepath, writer, storage)
+    
+    @staticmethod
+    @Perf.timed("file.convert_project")
+    def convert_project(source_path: str, target_path: str) -> bool:
+        project_data = ProjectFileHandler.load_project_full(source_path)
+        if not project_data or "meta" not in project_data:
+            return False
+        
+        project = Project.from_dict(project_data["meta"])
+        return ProjectFileHandler.save_project(project, target_path, project_data.get("versions", {}))
+    
     @staticmethod
     def is_valid_project_file(filepath: str) -> bool:
         try:
@@ -0,0 +1,426 @@
+import json
+import os
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from core.utils.perf import Perf
+from core.utils.project_lock import ProjectLock
+
+
+class ProjectJournal:
+
+    SUFFIX = ".journal"
+    COMPACTING_SUFFIX = ".journal.compacting"
+    COMPACT_THRESHOLD = 500
+    RECORD_KINDS = ("tasks", "bugs")
+    META_PREFIX = b'{"k":"meta",'
+
+    def __init__(self, filepath: str, writer=None, storage=None):
+        self.filepath = str(filepath)
+        self.writer = writer
+        self.storage = storage
+        self.journal_path = ProjectJournal.path_for(filepath)
+        self.compacting_path = Path(f"{filepath}{self.COMPACTING_SUFFIX}")
+        self.writer_id = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.owner = True
+        self.on_entries: Optional[Callable[[List[Dict]], None]] = None
+        self.entry_count = self._count_entries()
+        self._last_meta: Optional[Dict] = None
+        self._tail = None
+        self._tail_position = 0
+        self._in_flight: Dict[Tuple, int] = {}
+        self._batch: Optional[List[Tuple[Tuple, str]]] = None
+        self._lazy = False
+        self._pending: Dict[str, List[Dict]] = {}
+
+    @staticmethod
+    def path_for(filepath: str) -> Path:
+        return Path(f"{filepath}{ProjectJournal.SUFFIX}")
+
+    @property
+    def needs_compaction(self) -> bool:
+        if not self.owner:
+            return False
+        if self.storage is not None:
+            ready = self.entry_count > 0
+        else:
+            ready = self.entry_count >= self.COMPACT_THRESHOLD
+        return ready and not ProjectLock.has_followers(self.filepath)
+
+    def _count_entries(self) -> int:
+        count = 0
+        for path in (self.compacting_path, self.journal_path):
+            if path.exists():
+                with open(path, 'rb') as f:
+                    count += sum(1 for _ in f)
+        return count
+
+    @contextmanager
+    def _locked(self):
+        while True:
+            f = open(self.journal_path, 'ab+')
+            try:
+                ProjectLock._lock(f, blocking=True)
+            except BaseException:
+                f.close()
+                raise
+
+            if ProjectLock._same_file(f, self.journal_path):
+                break
+            ProjectLock._unlock(f)
+            f.close()
+
+        try:
+            yield f
+        finally:
+            ProjectLock._unlock(f)
+            f.close()
+
+    @Perf.timed("journal.write")
+    def _write_line(self, line: str):
+        data = line.encode('utf-8')
+        with self._locked() as f:
+            self._repair_tail(f)
+            f.write(data)
+            f.flush()
+        if Perf.enabled:
+            Perf.add_bytes("journal.write", len(data))
+
+    @staticmethod
+    def _repair_tail(f):
+        end = f.seek(0, os.SEEK_END)
+        if not end:
+            return
+        f.seek(end - 1)
+        if f.read(1) == b"\n":
+            return
+
+        position = end
+        keep = 0
+        while position > 0:
+            size = min(position, 64 * 1024)
+            position -= size
+            f.seek(position)
+            index = f.read(size).rfind(b"\n")
+            if index >= 0:
+                keep = position + index + 1
+                break
+
+        f.truncate(keep)
+        print(f"Dropped truncated journal entry at byte {keep} of {f.name}")
+
+    @staticmethod
+    def _key(entry: Dict) -> Tuple:
+        if entry.get("k") == "meta":
+            return ("meta",)
+        return entry.get("v"), entry.get("k"), entry.get("id")
+
+    def _append(self, entry: Dict):
+        entry["w"] = self.writer_id
+        line = json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + "\n"
+        key = self._key(entry)
+
+        if self._batch is not None:
+            self._batch.append((key, line))
+            return
+
+        if self.writer:
+            self.writer.submit(lambda: self._write_line(line), notify=False)
+        else:
+            self._write_line(line)
+        self._in_flight[key] = self._in_flight.get(key, 0) + 1
+        self.entry_count += 1
+
+    @Perf.timed("journal.record_change")
+    def record_change(self, version: str, kind: str, record_id: str, data: Optional[Dict]) -> bool:
+        try:
+            self._append({"v": version, "k": kind, "id": record_id, "d": data})
+            return True
+        except Exception as e:
+            print(f"Error writing project journal: {e}")
+            return False
+
+    def record_meta(self, meta: Dict) -> bool:
+        if meta == self._last_meta:
+            return True
+
+        try:
+            self._append({"k": "meta", "d": meta})
+            self._last_meta = meta
+            return True
+        except Exception as e:
+            print(f"Error writing project journal: {e}")
+            return False
+
+    def checkpoint(self, project, project_data: Dict) -> bool:
+        return self.record_meta(project.to_dict())
+
+    def begin_batch(self):
+        self._batch = []
+
+    def cancel_batch(self):
+        self._batch = None
+
+    @Perf.timed("journal.commit_batch")
+    def commit_batch(self) -> bool:
+        batch, self._batch = self._batch or [], None
+        if not batch:
+            return True
+
+        try:
+            if self.writer:
+                self.writer.wait_idle()
+            self._write_line("".join(line for _, line in batch))
+        except Exception as e:
+            print(f"Error writing project journal: {e}")
+            return False
+
+        for key, _ in batch:
+            self._in_flight[key] = self._in_flight.get(key, 0) + 1
+        self.entry_count += len(batch)
+        return True
+
+    def open_tail(self) -> List[Dict]:
+        self.close_tail()
+        self._in_flight.clear()
+        if not self.journal_path.exists():
+            return list(self._read_entries(self.compacting_path))
+
+        try:
+            with self._locked():
+                return self._read_from_start()
+        except PermissionError:
+            return self._read_from_start()
+
+    def _read_from_start(self) -> List[Dict]:
+        entries = list(self._read_entries(self.compacting_path))
+        self._tail = open(self.journal_path, 'rb')
+        self._tail_position = 0
+        entries.extend(self._read_tail_lines())
+        return entries
+
+    def _read_tail_lines(self) -> List[Dict]:
+        self._tail.seek(self._tail_position)
+        data = self._tail.read()
+        end = data.rfind(b"\n") + 1
+        self._tail_position += end
+        return list(self._parse(data[:end].splitlines(), self.journal_path))
+
+    def close_tail(self):
+        if self._tail is not None:
+            self._tail.close()
+            self._tail = None
+
+    @Perf.timed("journal.poll")
+    def poll(self) -> List[Dict]:
+        entries = []
+        while True:
+            if self._tail is None:
+                if not self.journal_path.exists():
+                    break
+                self._tail = open(self.journal_path, 'rb')
+                self._tail_position = 0
+
+            replaced = not ProjectLock._same_file(self._tail, self.journal_path)
+            entries.extend(self._read_tail_lines())
+            if not replaced:
+                break
+            self.close_tail()
+
+        foreign = self._foreign(entries)
+        if foreign and self.on_entries:
+            self.on_entries(foreign)
+        return foreign
+
+    def _foreign(self, entries: List[Dict]) -> List[Dict]:
+        foreign = []
+        for entry in entries:
+            key = self._key(entry)
+            if entry.get("w") == self.writer_id:
+                count = self._in_flight.pop(key, 0) - 1
+                if count > 0:
+                    self._in_flight[key] = count
+                continue
+
+            self.entry_count += 1
+            if key in self._in_flight:
+                continue
+            if key == ("meta",):
+                self._last_meta = entry.get("d")
+            foreign.append(entry)
+        return foreign
+
+    @Perf.timed("journal.begin_save")
+    def begin_save(self, project, project_data: Dict) -> Optional[Callable]:
+        if self.writer:
+            self.writer.wait_idle()
+        if not self._move_to_compacting():
+            return None
+
+        if self.storage is not None:
+            return self._apply_to_storage
+
+        snapshot = self._snapshot(project, project_data)
+        return lambda: self._write_snapshot(snapshot)
+
+    @Perf.timed("journal.compact")
+    def compact(self, project, project_data: Dict) -> bool:
+        if self.writer:
+            self.writer.wait_idle()
+
+        try:
+            if not self._move_to_compacting():
+                return True
+            if self.storage is not None:
+                self._apply_to_storage()
+            else:
+                self._write_snapshot(self._snapshot(project, project_data))
+            return True
+        except Exception as e:
+            print(f"Error compacting project journal: {e}")
+            return False
+
+    def _snapshot(self, project, project_data: Dict) -> Dict:
+        snapshot = {
+            "meta": project.to_dict(),
+            "versions": {
+                version: {kind: dict(records) for kind, records in version_data.items()}
+                for version, version_data in project_data.get("versions", {}).items()
+            }
+        }
+        self._last_meta = snapshot["meta"]
+        return snapshot
+
+    def _write_snapshot(self, snapshot: Dict):
+        from core.utils.project_file_handler import ProjectFileHandler
+
+        ProjectFileHandler.write_project_file(self.filepath, snapshot)
+        if self.compacting_path.exists():
+            self.compacting_path.unlink()
+
+    @Perf.timed("journal.apply_to_storage")
+    def _apply_to_storage(self):
+        if self.compacting_path.exists():
+            self.storage.apply_entries(self._read_entries(self.compacting_path))
+            self.compacting_path.unlink()
+
+    def _move_to_compacting(self) -> bool:
+        if not self.owner:
+            return False
+
+        with self._locked() as f:
+            if ProjectLock.has_followers(self.filepath):
+                return False
+            self.poll()
+
+            self._repair_tail(f)
+            f.seek(0)
+            data = f.read()
+            if data:
+                with open(self.compacting_path, 'ab+') as dst:
+                    self._repair_tail(dst)
+                    dst.write(data)
+                    dst.flush()
+                    os.fsync(dst.fileno())
+                f.truncate(0)
+
+            self.close_tail()
+            try:
+                os.unlink(self.journal_path)
+            except OSError:
+                pass
+
+        self.entry_count = 0
+        return True
+
+    def apply_entry(self, project_data: Dict, entry: Dict):
+        kind = entry.get("k")
+        if kind == "meta":
+            project_data["meta"] = entry.get("d")
+            return
+        if kind not in self.RECORD_KINDS:
+            return
+
+        versions = project_data.setdefault("versions", {})
+        version = entry.get("v")
+        if self._lazy and version not in versions:
+            self._pending.setdefault(version, []).append(entry)
+            return
+
+        records = versions.setdefault(version, {"tasks": {}, "bugs": {}}).setdefault(kind, {})
+        if entry.get("d") is None:
+            records.pop(entry.get("id"), None)
+        else:
+            records[entry.get("id")] = entry["d"]
+
+    def ensure_version(self, project_data: Dict, version: str) -> Dict:
+        versions = project_data.setdefault("versions", {})
+        if self._lazy and version not in versions:
+            versions[version] = self.storage.load_version(version)
+            for entry in self._pending.pop(version, []):
+                self.apply_entry(project_data, entry)
+        return project_data
+
+    def ensure_all_versions(self, project_data: Dict) -> Dict:
+        if self._lazy:
+            for version in [*self.storage.version_names(), *self._pending]:
+                self.ensure_version(project_data, version)
+        return project_data
+
+    @staticmethod
+    def _parse(lines: Iterable[bytes], path: Path) -> Iterator[Dict]:
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                print(f"Skipped unreadable journal entry in {path}")
+                continue
+            if isinstance(entry, dict):
+                yield entry
+
+    @staticmethod
+    def _read_entries(path: Path) -> Iterator[Dict]:
+        try:
+            f = open(path, 'rb')
+        except FileNotFoundError:
+            return
+        with f:
+            yield from ProjectJournal._parse(f, path)
+
+    @staticmethod
+    @Perf.timed("journal.read_meta")
+    def read_meta(filepath: str) -> Optional[Dict]:
+        meta = None
+        for path in (Path(f"{filepath}{ProjectJournal.COMPACTING_SUFFIX}"), ProjectJournal.path_for(filepath)):
+            try:
+                f = open(path, 'rb')
+            except FileNotFoundError:
+                continue
+            with f:
+                lines = (line for line in f if line.startswith(ProjectJournal.META_PREFIX))
+                for entry in ProjectJournal._parse(lines, path):
+                    meta = entry.get("d")
+        return meta
+
+    @Perf.timed("journal.replay")
+    def replay(self, project_data: Dict, entries: Iterable[Dict], lazy: bool = False) -> Dict:
+        self._lazy = lazy
+        self._pending = {}
+        project_data.setdefault("versions", {})
+        for entry in entries:
+            self.apply_entry(project_data, entry)
+        return project_data
+
+    def discard(self):
+        self.close_tail()
+        for path in (self.journal_path, self.compacting_path):
+            if path.exists():
+                path.unlink()
+        self.entry_count = 0
+
+    def close(self):
+        self.close_tail()
+        if self.storage is not None:
+            self.storage.close()
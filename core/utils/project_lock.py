@@ -0,0 +1,135 @@
+import glob
+import os
+import uuid
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+
+class ProjectLockedError(Exception):
+
+    def __init__(self, filepath: str, owner: str = ""):
+        self.filepath = str(filepath)
+        self.owner = owner
+        holder = f"process {owner}" if owner else "another process"
+        super().__init__(f"Project {self.filepath} is already open in {holder}")
+
+
+class ProjectLock:
+
+    SUFFIX = ".lock"
+    SESSION_SUFFIX = ".session"
+
+    def __init__(self, filepath: str, lock_path: Path = None):
+        self.filepath = str(filepath)
+        self.lock_path = lock_path or ProjectLock.path_for(filepath)
+        self._file = None
+
+    @staticmethod
+    def path_for(filepath: str) -> Path:
+        return Path(f"{filepath}{ProjectLock.SUFFIX}")
+
+    @staticmethod
+    def register(filepath: str) -> 'ProjectLock':
+        session_path = Path(f"{filepath}.{uuid.uuid4().hex[:12]}{ProjectLock.SESSION_SUFFIX}")
+        lock = ProjectLock(filepath, session_path)
+        lock.acquire()
+        return lock
+
+    @staticmethod
+    def session_paths(filepath: str):
+        pattern = f"{glob.escape(str(filepath))}.*{ProjectLock.SESSION_SUFFIX}"
+        return [Path(path) for path in glob.glob(pattern)]
+
+    @staticmethod
+    def has_followers(filepath: str) -> bool:
+        for path in ProjectLock.session_paths(filepath):
+            lock = ProjectLock(filepath, path)
+            try:
+                lock.acquire()
+            except ProjectLockedError:
+                return True
+            except OSError:
+                continue
+            lock.release()
+        return False
+
+    @property
+    def locked(self) -> bool:
+        return self._file is not None
+
+    def acquire(self):
+        if self._file is not None:
+            return
+
+        while True:
+            f = open(self.lock_path, 'a+', encoding='utf-8')
+            try:
+                self._lock(f)
+            except OSError:
+                owner = self._read_owner(f)
+                f.close()
+                raise ProjectLockedError(self.filepath, owner)
+
+            if self._same_file(f, self.lock_path):
+                break
+            self._unlock(f)
+            f.close()
+
+        f.seek(0)
+        f.truncate()
+        f.write(str(os.getpid()))
+        f.flush()
+        self._file = f
+
+    def release(self):
+        if self._file is None:
+            return
+
+        f, self._file = self._file, None
+        try:
+            os.unlink(self.lock_path)
+        except OSError:
+            pass
+        self._unlock(f)
+        f.close()
+
+    @staticmethod
+    def _lock(f, blocking: bool = False):
+        if fcntl:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1)
+
+    @staticmethod
+    def _unlock(f):
+        try:
+            if fcntl:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _same_file(f, path: Path) -> bool:
+        if not fcntl:
+            return True
+        try:
+            return os.path.samestat(os.fstat(f.fileno()), os.stat(path))
+        except OSError:
+            return False
+
+    @staticmethod
+    def _read_owner(f) -> str:
+        try:
+            f.seek(0)
+            return f.read().strip()
+        except OSError:
+            return ""
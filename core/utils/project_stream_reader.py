@@ -0,0 +1,113 @@
+import codecs
+import json
+import re
+from json.scanner import make_scanner
+from typing import Any, Dict, Iterator, Optional
+
+
+class ProjectStreamReader:
+
+    CHUNK_BYTES = 64 * 1024
+    WHITESPACE = re.compile(r'[ \t\n\r]*')
+    COLON = re.compile(r'[ \t\n\r]*(:)')
+    SEPARATOR = re.compile(r'[ \t\n\r]*([,}])')
+    NUMBER_TAIL = re.compile(r'[0-9.eE+\-]*\Z')
+
+    def __init__(self, filepath, chunk_bytes: int = CHUNK_BYTES):
+        self.filepath = filepath
+        self.chunk_bytes = chunk_bytes
+        self.read_bytes = 0
+
+        self._file = None
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._scan = make_scanner(json.JSONDecoder())
+        self._buffer = ""
+        self._base = 0
+        self._pos = 0
+        self._eof = False
+
+    def read_meta(self) -> Optional[Dict]:
+        with open(self.filepath, 'rb') as f:
+            self._file = f
+            for key in self._object_keys():
+                value = self._value()
+                if key == "meta":
+                    return value
+        return None
+
+    def _object_keys(self) -> Iterator[str]:
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+
+        while True:
+            key = self._value()
+            if not isinstance(key, str):
+                raise ValueError(f"Expected object key at char {self._consumed()}")
+            self._token(self.COLON, "':'")
+            yield key
+
+            if self._token(self.SEPARATOR, "',' or '}'") == "}":
+                return
+
+    def _value(self) -> Any:
+        while True:
+            start = self.WHITESPACE.match(self._buffer, self._pos).end()
+            try:
+                value, end = self._scan(self._buffer, start)
+            except StopIteration:
+                if self._eof:
+                    raise ValueError(f"Expected value at char {self._base + start}")
+                self._fill()
+                continue
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+                self._fill()
+                continue
+
+            if not self._eof and self.NUMBER_TAIL.match(self._buffer, end):
+                self._fill()
+                continue
+
+            self._pos = end
+            return value
+
+    def _token(self, pattern, expected: str) -> str:
+        match = pattern.match(self._buffer, self._pos)
+        if not match:
+            self._peek()
+            match = pattern.match(self._buffer, self._pos)
+            if not match:
+                raise ValueError(f"Expected {expected} at char {self._consumed()}")
+        self._pos = match.end()
+        return match.group(1)
+
+    def _expect(self, char: str):
+        if self._peek() != char:
+            raise ValueError(f"Expected '{char}' at char {self._consumed()}")
+        self._pos += 1
+
+    def _peek(self) -> str:
+        while True:
+            self._pos = self.WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if self._eof:
+                raise ValueError("Unexpected end of project file")
+            self._fill()
+
+    def _fill(self):
+        size = max(self.chunk_bytes, len(self._buffer) - self._pos)
+        chunk = self._file.read(size)
+        self.read_bytes += len(chunk)
+
+        text = self._decoder.decode(chunk, final=not chunk)
+        self._base = self._consumed()
+        self._buffer = self._buffer[self._pos:] + text
+        self._pos = 0
+        self._eof = not chunk
+
+    def _consumed(self) -> int:
+        return self._base + self._pos
@@ -0,0 +1,45 @@
+import queue
+import threading
+from typing import Callable, Optional
+
+from core.utils.perf import Perf
+
+
+class SaveWriter:
+
+    def __init__(self, on_done: Optional[Callable[[bool], None]] = None):
+        self.on_done = on_done
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="SaveWriter", daemon=True)
+        self._thread.start()
+
+    def submit(self, job: Callable, notify: bool = True):
+        self._queue.put((job, notify))
+
+    def wait_idle(self):
+        self._queue.join()
+
+    def stop(self):
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+
+            job, notify = item
+            try:
+                with Perf.span("save.background_job"):
+                    ok = job() is not False
+            except Exception as e:
+                print(f"Error in background save: {e}")
+                ok = False
+            finally:
+                self._queue.task_done()
+
+            if self.on_done and (notify or not ok):
+                self.on_done(ok)
@@ -0,0 +1,147 @@
+import json
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from core.utils.perf import Perf
+
+
+class ShardedProjectStorage:
+
+    SUFFIX = ".bugtracker"
+    MANIFEST = "manifest.json"
+    META = "meta.json"
+    VERSIONS_DIR = "versions"
+    FORMAT_VERSION = 1
+    RECORD_KINDS = ("tasks", "bugs")
+
+    def __init__(self, filepath: str):
+        self.root = ShardedProjectStorage.root_for(filepath)
+        self.filepath = str(self.root)
+
+    @staticmethod
+    def root_for(filepath) -> Path:
+        path = Path(filepath)
+        if path.name == ShardedProjectStorage.MANIFEST:
+            return path.parent
+        return path
+
+    @staticmethod
+    def is_storage_path(filepath) -> bool:
+        path = Path(filepath)
+        if path.name == ShardedProjectStorage.MANIFEST:
+            return True
+        return path.is_dir() or str(path).endswith(ShardedProjectStorage.SUFFIX)
+
+    def _read_manifest(self) -> Dict:
+        manifest_path = self.root / self.MANIFEST
+        if manifest_path.exists():
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return {"format_version": self.FORMAT_VERSION, "versions": {}}
+
+    def _shard_name(self, manifest: Dict, version: str) -> str:
+        shards = manifest["versions"]
+        if version in shards:
+            return shards[version]
+
+        base = re.sub(r'[^A-Za-z0-9._-]', '_', version).strip('.') or "version"
+        taken = set(shards.values())
+        name = f"{self.VERSIONS_DIR}/{base}.json"
+        index = 2
+        while name in taken:
+            name = f"{self.VERSIONS_DIR}/{base}_{index}.json"
+            index += 1
+
+        shards[version] = name
+        return name
+
+    def load_meta(self) -> Optional[Dict]:
+        meta_path = self.root / self.META
+        if not meta_path.exists():
+            return None
+
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def version_names(self) -> List[str]:
+        return list(self._read_manifest()["versions"])
+
+    def _load_shard(self, manifest: Dict, version: str) -> Dict:
+        version_data = {"tasks": {}, "bugs": {}}
+        shard = manifest["versions"].get(version)
+        if shard and (self.root / shard).exists():
+            with open(self.root / shard, 'r', encoding='utf-8') as f:
+                version_data.update(json.load(f))
+        return version_data
+
+    @Perf.timed("sharded.load_version")
+    def load_version(self, version: str) -> Dict:
+        return self._load_shard(self._read_manifest(), version)
+
+    @Perf.timed("sharded.load_project_data")
+    def load_project_data(self, lazy: bool = False) -> Optional[Dict]:
+        meta = self.load_meta()
+        if meta is None:
+            return None
+
+        project_data = {"meta": meta, "versions": {}}
+        if not lazy:
+            manifest = self._read_manifest()
+            for version in manifest["versions"]:
+                project_data["versions"][version] = self._load_shard(manifest, version)
+        return project_data
+
+    @Perf.timed("sharded.save_project_data")
+    def save_project_data(self, project_data: Dict):
+        from core.utils.project_file_handler import ProjectFileHandler
+
+        (self.root / self.VERSIONS_DIR).mkdir(parents=True, exist_ok=True)
+
+        manifest = {"format_version": self.FORMAT_VERSION, "versions": {}}
+        for version, version_data in project_data.get("versions", {}).items():
+            ProjectFileHandler.write_project_file(self.root / self._shard_name(manifest, version), version_data)
+
+        ProjectFileHandler.write_project_file(self.root / self.MANIFEST, manifest)
+        ProjectFileHandler.write_project_file(self.root / self.META, project_data.get("meta", {}))
+
+        shards = {self.root / shard for shard in manifest["versions"].values()}
+        for path in (self.root / self.VERSIONS_DIR).glob("*.json"):
+            if path not in shards:
+                path.unlink()
+
+    @Perf.timed("sharded.apply_entries")
+    def apply_entries(self, entries: Iterable[Dict]):
+        from core.utils.project_file_handler import ProjectFileHandler
+
+        manifest = self._read_manifest()
+        versions: Dict[str, Dict] = {}
+        meta = None
+        for entry in entries:
+            kind = entry.get("k")
+            if kind == "meta":
+                meta = entry.get("d")
+                continue
+            if kind not in self.RECORD_KINDS:
+                continue
+
+            version = entry["v"]
+            if version not in versions:
+                versions[version] = self._load_shard(manifest, version)
+            records = versions[version].setdefault(kind, {})
+            if entry.get("d") is None:
+                records.pop(entry["id"], None)
+            else:
+                records[entry["id"]] = entry["d"]
+
+        manifest_changed = any(version not in manifest["versions"] for version in versions)
+        (self.root / self.VERSIONS_DIR).mkdir(parents=True, exist_ok=True)
+        for version, version_data in versions.items():
+            ProjectFileHandler.write_project_file(self.root / self._shard_name(manifest, version), version_data)
+        if manifest_changed:
+            ProjectFileHandler.write_project_file(self.root / self.MANIFEST, manifest)
+        if meta is not None:
+            ProjectFileHandler.write_project_file(self.root / self.META, meta)
+
+    def close(self):
+        pass
@@ -0,0 +1,191 @@
+import json
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from core.utils.perf import Perf
+
+
+class SQLiteProjectStorage:
+
+    SUFFIX = ".bugtracker.db"
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS meta (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            data TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS versions (
+            name TEXT PRIMARY KEY
+        );
+        CREATE TABLE IF NOT EXISTS tasks (
+            version TEXT NOT NULL,
+            id TEXT NOT NULL,
+            status TEXT,
+            priority TEXT,
+            data TEXT NOT NULL,
+            PRIMARY KEY (version, id)
+        );
+        CREATE TABLE IF NOT EXISTS bugs (
+            version TEXT NOT NULL,
+            id TEXT NOT NULL,
+            task_id TEXT,
+            status TEXT,
+            priority TEXT,
+            data TEXT NOT NULL,
+            PRIMARY KEY (version, id)
+        );
+        CREATE INDEX IF NOT EXISTS idx_tasks_version_status ON tasks (version, status);
+        CREATE INDEX IF NOT EXISTS idx_tasks_version_priority ON tasks (version, priority);
+        CREATE INDEX IF NOT EXISTS idx_bugs_version_status ON bugs (version, status);
+        CREATE INDEX IF NOT EXISTS idx_bugs_version_priority ON bugs (version, priority);
+        CREATE INDEX IF NOT EXISTS idx_bugs_version_task ON bugs (version, task_id);
+    """
+
+    INDEXED_COLUMNS = {
+        "tasks": ("status", "priority"),
+        "bugs": ("task_id", "status", "priority"),
+    }
+
+    HEADER = b"SQLite format 3\x00"
+    TABLES = ("meta", "versions", "tasks", "bugs")
+
+    def __init__(self, filepath: str):
+        self.filepath = str(filepath)
+        self._connection: Optional[sqlite3.Connection] = None
+        self._schema_ready = False
+
+    @staticmethod
+    def is_storage_path(filepath) -> bool:
+        path = Path(filepath)
+        if path.suffix != ".db":
+            return False
+        if not path.is_file():
+            return not path.exists()
+
+        try:
+            with open(path, 'rb') as f:
+                header = f.read(len(SQLiteProjectStorage.HEADER))
+        except OSError:
+            return False
+        return header in (b"", SQLiteProjectStorage.HEADER)
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            Path(self.filepath).parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.filepath, check_same_thread=False)
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+        return self._connection
+
+    def _create_schema(self):
+        if not self._schema_ready:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.executescript(self.SCHEMA)
+            self._schema_ready = True
+
+    def has_schema(self) -> bool:
+        names = ", ".join("?" for _ in self.TABLES)
+        (count,) = self.connection.execute(
+            f"SELECT count(*) FROM sqlite_master WHERE type = 'table' AND name IN ({names})", self.TABLES
+        ).fetchone()
+        return count == len(self.TABLES)
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _upsert(self, kind: str, version: str, record_id: str, data: Dict):
+        columns = self.INDEXED_COLUMNS[kind]
+        names = ", ".join(columns)
+        placeholders = ", ".join("?" for _ in columns)
+        updates = ", ".join(f"{column} = excluded.{column}" for column in columns)
+
+        self.connection.execute(
+            f"INSERT INTO {kind} (version, id, {names}, data) VALUES (?, ?, {placeholders}, ?) "
+            f"ON CONFLICT (version, id) DO UPDATE SET {updates}, data = excluded.data",
+            (version, record_id, *(data.get(column) for column in columns),
+             json.dumps(data, ensure_ascii=False, separators=(',', ':')))
+        )
+
+    def load_meta(self) -> Optional[Dict]:
+        if not self.has_schema():
+            return None
+        row = self.connection.execute("SELECT data FROM meta WHERE id = 1").fetchone()
+        return json.loads(row[0]) if row else None
+
+    @Perf.timed("sqlite.load_version")
+    def load_version(self, version: str) -> Dict:
+        version_data = {}
+        for kind in self.INDEXED_COLUMNS:
+            rows = self.connection.execute(
+                f"SELECT id, data FROM {kind} WHERE version = ? ORDER BY rowid", (version,)
+            )
+            version_data[kind] = {record_id: json.loads(data) for record_id, data in rows}
+        return version_data
+
+    @Perf.timed("sqlite.load_project_data")
+    def load_project_data(self) -> Optional[Dict]:
+        meta = self.load_meta()
+        if meta is None:
+            return None
+
+        versions = {}
+        for (name,) in self.connection.execute("SELECT name FROM versions ORDER BY rowid"):
+            versions[name] = {"tasks": {}, "bugs": {}}
+
+        for kind in self.INDEXED_COLUMNS:
+            rows = self.connection.execute(f"SELECT version, id, data FROM {kind} ORDER BY rowid")
+            for version, record_id, data in rows:
+                version_data = versions.setdefault(version, {"tasks": {}, "bugs": {}})
+                version_data[kind][record_id] = json.loads(data)
+
+        return {"meta": meta, "versions": versions}
+
+    @Perf.timed("sqlite.save_project_data")
+    def save_project_data(self, project_data: Dict):
+        self._create_schema()
+        connection = self.connection
+        with connection:
+            for table in ("meta", "versions", *self.INDEXED_COLUMNS):
+                connection.execute(f"DELETE FROM {table}")
+
+            meta = project_data.get("meta", {})
+            connection.execute(
+                "INSERT INTO meta (id, data) VALUES (1, ?)",
+                (json.dumps(meta, ensure_ascii=False),)
+            )
+
+            for version, version_data in project_data.get("versions", {}).items():
+                connection.execute("INSERT INTO versions (name) VALUES (?)", (version,))
+                for kind in self.INDEXED_COLUMNS:
+                    for record_id, data in version_data.get(kind, {}).items():
+                        self._upsert(kind, version, record_id, data)
+
+    @Perf.timed("sqlite.apply_entries")
+    def apply_entries(self, entries: Iterable[Dict]):
+        self._create_schema()
+        connection = self.connection
+        with connection:
+            for entry in entries:
+                kind = entry.get("k")
+                data = entry.get("d")
+
+                if kind == "meta":
+                    connection.execute(
+                        "INSERT INTO meta (id, data) VALUES (1, ?) "
+                        "ON CONFLICT (id) DO UPDATE SET data = excluded.data",
+                        (json.dumps(data, ensure_ascii=False),)
+                    )
+                    continue
+                if kind not in self.INDEXED_COLUMNS:
+                    continue
+
+                connection.execute("INSERT OR IGNORE INTO versions (name) VALUES (?)", (entry["v"],))
+                if data is None:
+                    connection.execute(
+                        f"DELETE FROM {kind} WHERE version = ? AND id = ?", (entry["v"], entry["id"])
+                    )
+                else:
+                    self._upsert(kind, entry["v"], entry["id"], data)
@@ -1,12 +1,23 @@
+from core.utils.perf import Perf
+
+
 class StatisticsGenerator:
     
     @staticmethod
+    @Perf.timed("statistics.generate_project_stats")
     def generate_project_stats(project, task_manager, bug_manager):
         if not task_manager or not bug_manager:
             return {}
         
-        task_stats = task_manager.get_task_statistics()
-        bug_stats = bug_manager.get_bug_statistics()
+        return StatisticsGenerator.build_project_stats(
+            project, task_manager.get_task_statistics(), bug_manager.get_bug_statistics()
+        )
+    
+    @staticmethod
+    @Perf.timed("statistics.build_project_stats")
+    def build_project_stats(project, task_stats, bug_stats):
+        task_by_priority = task_stats.get('by_priority', {})
+        bug_by_priority = bug_stats.get('by_priority', {})
         
         stats = {
             "project_info": {
@@ -18,10 +29,10 @@ class StatisticsGenerator:
             "tasks": {
                 "total": task_stats.get('total', 0),
                 "by_priority": {
-                    "critical": task_stats.get('critical', 0),
-                    "high": task_stats.get('high', 0),
-                    "medium": task_stats.get('medium', 0),
-                    "low": task_stats.get('low', 0)
+                    "critical": task_by_priority.get('critical', 0),
+                    "high": task_by_priority.get('high', 0),
+                    "medium": task_by_priority.get('medium', 0),
+                    "low": task_by_priority.get('low', 0)
                 },
                 "by_status": task_stats.get('by_status', {}),
                 "status_summary": {
@@ -35,10 +46,10 @@ class StatisticsGenerator:
                 "open": bug_stats.get('open', 0),
                 "fixed": bug_stats.get('fixed', 0),
                 "by_priority": {
-                    "critical": bug_stats.get('critical', 0),
-                    "high": bug_stats.get('high', 0),
-                    "medium": bug_stats.get('medium', 0),
-                    "low": bug_stats.get('low', 0)
+                    "critical": bug_by_priority.get('critical', 0),
+                    "high": bug_by_priority.get('high', 0),
+                    "medium": bug_by_priority.get('medium', 0),
+                    "low": bug_by_priority.get('low', 0)
                 },
                 "by_status": bug_stats.get('by_status', {})
             },
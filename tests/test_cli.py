@@ -0,0 +1,102 @@
+import json
+
+import pytest
+
+from benchmarks.project_generator import ProjectGenerator
+from core.cli import main
+from core.managers.project_session import ProjectSession
+from core.models.bug import BugPriority
+from core.utils.project_file_handler import ProjectFileHandler
+from core.utils.project_lock import ProjectLock
+
+
+@pytest.fixture
+def project(tmp_path):
+    filepath = str(tmp_path / "project.bugtracker.json")
+    project = ProjectGenerator.for_records(20, 1, seed=8).write(filepath)
+    version = project.versions[0]
+    return filepath, version, ProjectFileHandler.load_project_full(filepath)["versions"][version]
+
+
+def run_batch(tmp_path, filepath, operations, *options):
+    batch_path = tmp_path / "batch.jsonl"
+    batch_path.write_text("\n".join(
+        operation if isinstance(operation, str) else json.dumps(operation) for operation in operations
+    ), encoding='utf-8')
+    return main([filepath, *options, "batch", str(batch_path)])
+
+
+@pytest.mark.parametrize("operations, message", [
+    ([{"op": "add_bug", "title": "x", "priority": 1}], "Line 1: Invalid BugPriority 1"),
+    ([{"op": "add_task", "title": "x", "status": {"value": "done"}}], "Line 1: Invalid TaskStatus"),
+    ([{"op": "add_bug", "title": "x", "task_id": "TASK-MISSING"}], "Line 1: Unknown task: TASK-MISSING"),
+    ([{"op": "add_bug", "title": "x"}, "[1, 2]"], "Line 2: Expected a JSON object"),
+    ([{"op": "add_bug", "title": "x"}, "{broken"], "Line 2: "),
+    ([{"op": "drop_bug", "id": "BUG-1"}], "Line 1: Unknown operation: drop_bug"),
+    ([{"op": "delete_bug", "id": "BUG-MISSING"}], "Line 1: delete_bug failed for BUG-MISSING"),
+    ([{"op": "update_bug"}], "Line 1: 'id'"),
+    ([{"op": "add_bug", "title": "x", "version": "v9.9.9"}], "Line 1: Unknown version: v9.9.9"),
+    ([{"op": "add_bug", "title": 5}], "Line 1: title must be a string"),
+    ([{"op": "add_task", "title": "x", "description": None}], "Line 1: description must be a string"),
+    ([{"op": "add_comment", "id": "BUG-1", "text": ["x"]}], "Line 1: text must be a string"),
+])
+def test_batch_rejects_invalid_lines_without_saving(tmp_path, capsys, project, operations, message):
+    filepath, _, _ = project
+    with open(filepath, encoding='utf-8') as f:
+        before = f.read()
+
+    assert run_batch(tmp_path, filepath, operations) == 1
+
+    assert f"Error: {message}" in capsys.readouterr().err
+    with open(filepath, encoding='utf-8') as f:
+        assert f.read() == before
+    assert not ProjectLock.path_for(filepath).exists()
+
+
+def test_batch_update_validates_task_id(tmp_path, capsys, project):
+    filepath, _, version_data = project
+    bug_id = next(iter(version_data["bugs"]))
+
+    assert run_batch(tmp_path, filepath, [{"op": "update_bug", "id": bug_id, "task_id": "TASK-MISSING"}]) == 1
+
+    assert "Line 1: Unknown task: TASK-MISSING" in capsys.readouterr().err
+
+
+def test_batch_applies_operations_and_saves_once(tmp_path, capsys, project):
+    filepath, version, version_data = project
+    bug_id = next(iter(version_data["bugs"]))
+    task_id = next(iter(version_data["tasks"]))
+
+    assert run_batch(tmp_path, filepath, [
+        {"op": "add_bug", "title": "From batch", "priority": "CRITICAL", "task_id": task_id},
+        {"op": "update_bug", "id": bug_id, "status": "fixed"},
+        "",
+        {"op": "add_comment", "id": bug_id, "author": "ci", "text": "checked"},
+    ], "--json") == 0
+
+    results = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [result["op"] for result in results] == ["add_bug", "update_bug", "add_comment"]
+
+    bugs = ProjectFileHandler.load_project_full(filepath)["versions"][version]["bugs"]
+    added = bugs[results[0]["id"]]
+    assert added["priority"] == BugPriority.CRITICAL.value
+    assert added["task_id"] == task_id
+    assert bugs[bug_id]["status"] == "fixed"
+    assert bugs[bug_id]["comments"][-1]["text"] == "checked"
+    assert not ProjectLock.path_for(filepath).exists()
+
+
+def test_batch_reaches_a_session_that_has_the_project_open(tmp_path, project):
+    filepath, version, _ = project
+    session = ProjectSession.open(filepath)
+    task_manager, _ = session.managers(version)
+    added = []
+    task_manager.subscribe(lambda event: added.append(event.record.title))
+
+    assert run_batch(tmp_path, filepath, [{"op": "add_task", "title": "From CI"}]) == 0
+    session.sync()
+    session.close()
+
+    assert added == ["From CI"]
+    tasks = ProjectFileHandler.load_project_full(filepath)["versions"][version]["tasks"]
+    assert [task["title"] for task in tasks.values()].count("From CI") == 1
@@ -0,0 +1,140 @@
+import random
+
+import pytest
+
+from benchmarks.project_generator import ProjectGenerator
+from core.managers.bug_manager import BugManager
+from core.managers.record_index import RecordIndex
+from core.managers.search_index import SearchIndex
+from core.managers.task_manager import TaskManager
+from core.models.bug import BugPriority, BugStatus
+from core.models.task import TaskPriority, TaskStatus
+
+QUERIES = ["", "re", "report", "REPORT", "port war", "bug-", "task-", "x", "zzz", "warning export", "a b", "!"]
+
+
+@pytest.fixture
+def managers():
+    generator = ProjectGenerator.for_records(300, 1, seed=21, comments=2)
+    version = generator.version_names[0]
+    project_data = {"meta": generator.generate_project().to_dict(), "versions": {version: generator.generate_version(version)}}
+    return TaskManager(project_data, version), BugManager(project_data, version)
+
+
+def linear_bugs(bug_manager, priority=None, status=None, task_id="", search=""):
+    bugs = bug_manager.get_all_bugs()
+    if priority:
+        bugs = [bug for bug in bugs if bug.priority == priority]
+    if status:
+        bugs = [bug for bug in bugs if bug.status == status]
+    if task_id.startswith("TASK-"):
+        bugs = [bug for bug in bugs if bug.task_id == task_id]
+    elif task_id:
+        bugs = [bug for bug in bugs if task_id.lower() in bug.task_id.lower()]
+    if search:
+        bugs = [
+            bug for bug in bugs
+            if any(search.lower() in field.lower() for field in BugManager._search_fields(bug) if field)
+        ]
+    return [bug.id for bug in bugs]
+
+
+def linear_tasks(task_manager, priority=None, status=None, search=""):
+    tasks = task_manager.get_all_tasks()
+    if priority:
+        tasks = [task for task in tasks if task.priority == priority]
+    if status:
+        tasks = [task for task in tasks if task.status == status]
+    if search:
+        tasks = [
+            task for task in tasks
+            if any(search.lower() in field.lower() for field in TaskManager._search_fields(task) if field)
+        ]
+    return [task.id for task in tasks]
+
+
+def check_bug_filters(bug_manager, task_ids):
+    for priority in (None, *BugPriority):
+        for status in (None, *BugStatus):
+            for task_id in ("", task_ids[0], "task-", "TASK-MISSING"):
+                assert [bug.id for bug in bug_manager.filter_bugs(priority, status, task_id)] == \
+                    linear_bugs(bug_manager, priority, status, task_id)
+    for query in QUERIES + [bug.title.split()[0] for bug in bug_manager.get_all_bugs()[:5]]:
+        assert [bug.id for bug in bug_manager.filter_bugs(search_text=query)] == \
+            linear_bugs(bug_manager, search=query)
+
+
+def test_bug_filters_match_linear_scan(managers):
+    task_manager, bug_manager = managers
+    check_bug_filters(bug_manager, list(task_manager.tasks))
+
+
+def test_bug_filters_match_linear_scan_after_edits(managers):
+    task_manager, bug_manager = managers
+    rng = random.Random(4)
+    task_ids = list(task_manager.tasks)
+    bug_manager.filter_bugs(search_text="warm up")
+
+    for bug_id in rng.sample(list(bug_manager.bugs), 60):
+        bug_manager.update_bug(
+            bug_id,
+            status=rng.choice(list(BugStatus)),
+            priority=rng.choice(list(BugPriority)),
+            task_id=rng.choice(task_ids),
+            title=f"renamed {rng.random():.6f} reload"
+        )
+    for bug_id in rng.sample(list(bug_manager.bugs), 20):
+        bug_manager.delete_bug(bug_id)
+    for bug_id in rng.sample(list(bug_manager.bugs), 10):
+        bug_manager.add_comment(bug_id, "dev", "commented zebra")
+    bug_manager.add_bug("fresh zebra", task_id=task_ids[0], priority=BugPriority.CRITICAL)
+
+    check_bug_filters(bug_manager, task_ids)
+    assert linear_bugs(bug_manager, search="zebra")
+
+
+def test_task_filters_match_linear_scan_after_edits(managers):
+    task_manager, _ = managers
+    for task_id in list(task_manager.tasks)[:5]:
+        task_manager.update_task(task_id, status=TaskStatus.DONE, priority=TaskPriority.LOW, title="finished report")
+    task_manager.delete_task(list(task_manager.tasks)[-1])
+
+    for priority in (None, *TaskPriority):
+        for status in (None, *TaskStatus):
+            assert [task.id for task in task_manager.filter_tasks(priority, status)] == \
+                linear_tasks(task_manager, priority, status)
+    for query in QUERIES + ["finished"]:
+        assert [task.id for task in task_manager.filter_tasks(search_text=query)] == \
+            linear_tasks(task_manager, search=query)
+
+
+def test_record_index_tracks_updates_and_order():
+    class Record:
+        def __init__(self, status):
+            self.status = status
+
+    index = RecordIndex(("status",))
+    index.add("a", Record("open"))
+    index.add("b", Record("open"))
+    index.add("c", Record("fixed"))
+    index.update("a", Record("fixed"))
+    index.remove("b")
+
+    assert index.ids("status", "open") == set()
+    assert index.ordered(index.ids("status", "fixed")) == ["a", "c"]
+    assert index.count("status", "fixed") == 2
+
+
+def test_search_index_matches_substrings_within_one_field():
+    index = SearchIndex()
+    index.add("1", ["Crash on save", "Stack trace attached"])
+    index.add("2", ["Slow search", ""])
+    index.update("2", ["Slow startup", "cold cache"])
+
+    assert index.search("rash") == {"1"}
+    assert index.search("save stack") == set()
+    assert index.search("on sa") == {"1"}
+    assert index.search("search") == set()
+    assert index.search("st") == {"1", "2"}
+    index.remove("1")
+    assert index.search("crash") == set()
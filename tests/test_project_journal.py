@@ -0,0 +1,145 @@
+import json
+
+from benchmarks.project_generator import ProjectGenerator
+from core.cli import main
+from core.utils.project_file_handler import ProjectFileHandler
+from core.utils.project_journal import ProjectJournal
+
+
+def write_project(tmp_path, records=20):
+    filepath = str(tmp_path / "project.bugtracker.json")
+    project = ProjectGenerator.for_records(records, 1, seed=3).write(filepath)
+    return filepath, project, project.versions[0]
+
+
+def bug(bug_id, title):
+    return {
+        "id": bug_id, "title": title, "description": "", "priority": "medium", "status": "open",
+        "created_at": "2024-01-01T00:00:00", "task_id": "", "comments": []
+    }
+
+
+def test_replay_applies_entries_in_order(tmp_path):
+    filepath, project, version = write_project(tmp_path)
+    existing = next(iter(ProjectFileHandler.load_project_full(filepath)["versions"][version]["bugs"]))
+
+    journal = ProjectJournal(filepath)
+    journal.record_change(version, "bugs", "BUG-NEW", bug("BUG-NEW", "first"))
+    journal.record_change(version, "bugs", "BUG-NEW", bug("BUG-NEW", "second"))
+    journal.record_change(version, "bugs", existing, None)
+    journal.record_change("v9.0.0", "tasks", "TASK-X", {"id": "TASK-X"})
+    journal.record_meta(dict(project.to_dict(), name="Renamed"))
+
+    data = ProjectFileHandler.load_project_full(filepath)
+
+    assert data["versions"][version]["bugs"]["BUG-NEW"]["title"] == "second"
+    assert existing not in data["versions"][version]["bugs"]
+    assert data["versions"]["v9.0.0"] == {"tasks": {"TASK-X": {"id": "TASK-X"}}, "bugs": {}}
+    assert data["meta"]["name"] == "Renamed"
+    assert journal.entry_count == 5
+
+
+def test_replay_stops_at_truncated_entry(tmp_path):
+    filepath, _, version = write_project(tmp_path)
+    journal = ProjectJournal(filepath)
+    journal.record_change(version, "bugs", "BUG-A", bug("BUG-A", "kept"))
+    with open(journal.journal_path, 'a', encoding='utf-8') as f:
+        line = json.dumps({"v": version, "k": "bugs", "id": "BUG-B", "d": bug("BUG-B", "lost")})
+        f.write(line[:len(line) // 2])
+
+    data = ProjectFileHandler.load_project_full(filepath)
+
+    assert data["versions"][version]["bugs"]["BUG-A"]["title"] == "kept"
+    assert "BUG-B" not in data["versions"][version]["bugs"]
+
+
+def test_compact_writes_snapshot_and_removes_journal(tmp_path):
+    filepath, project, version = write_project(tmp_path)
+    journal = ProjectJournal(filepath)
+    journal.record_change(version, "bugs", "BUG-A", bug("BUG-A", "compacted"))
+    project_data = ProjectFileHandler.load_project_full(filepath)
+
+    assert journal.compact(project, project_data)
+
+    assert not journal.journal_path.exists()
+    assert not journal.compacting_path.exists()
+    assert journal.entry_count == 0
+    with open(filepath, encoding='utf-8') as f:
+        assert json.load(f)["versions"][version]["bugs"]["BUG-A"]["title"] == "compacted"
+
+
+def test_replay_includes_interrupted_compaction(tmp_path):
+    filepath, _, version = write_project(tmp_path)
+    journal = ProjectJournal(filepath)
+    journal.record_change(version, "bugs", "BUG-A", bug("BUG-A", "old"))
+    journal._move_to_compacting()
+    journal.record_change(version, "bugs", "BUG-A", bug("BUG-A", "new"))
+
+    data = ProjectFileHandler.load_project_full(filepath)
+
+    assert journal.compacting_path.exists()
+    assert data["versions"][version]["bugs"]["BUG-A"]["title"] == "new"
+    assert ProjectJournal(filepath).entry_count == 2
+
+
+def append_partial_entry(journal, version, bug_id):
+    with open(journal.journal_path, 'a', encoding='utf-8') as f:
+        line = json.dumps({"v": version, "k": "bugs", "id": bug_id, "d": bug(bug_id, "torn")})
+        f.write(line[:len(line) // 2])
+
+
+def test_append_after_truncated_entry_is_replayed(tmp_path):
+    filepath, _, version = write_project(tmp_path)
+    ProjectJournal(filepath).record_change(version, "bugs", "BUG-A", bug("BUG-A", "first"))
+    append_partial_entry(ProjectJournal(filepath), version, "BUG-T")
+
+    journal = ProjectJournal(filepath)
+    journal.record_change(version, "bugs", "BUG-A", bug("BUG-A", "second"))
+    journal.record_change(version, "bugs", "BUG-B", bug("BUG-B", "later"))
+
+    bugs = ProjectFileHandler.load_project_full(filepath)["versions"][version]["bugs"]
+    assert bugs["BUG-A"]["title"] == "second"
+    assert bugs["BUG-B"]["title"] == "later"
+    assert "BUG-T" not in bugs
+    with open(journal.journal_path, encoding='utf-8') as f:
+        assert all(json.loads(line) for line in f)
+
+
+def test_replay_skips_unreadable_entry_and_continues(tmp_path):
+    filepath, _, version = write_project(tmp_path)
+    journal = ProjectJournal(filepath)
+    with open(journal.journal_path, 'w', encoding='utf-8') as f:
+        f.write('{"v": "' + version + '", "k": "bugs", "id": "BUG-T", "d": {\n')
+    journal.record_change(version, "bugs", "BUG-A", bug("BUG-A", "kept"))
+
+    bugs = ProjectFileHandler.load_project_full(filepath)["versions"][version]["bugs"]
+    assert bugs["BUG-A"]["title"] == "kept"
+    assert "BUG-T" not in bugs
+
+
+def test_cli_edit_after_crash_survives_reopen(tmp_path):
+    filepath, _, version = write_project(tmp_path)
+    bug_id = next(iter(ProjectFileHandler.load_project_full(filepath)["versions"][version]["bugs"]))
+
+    assert main([filepath, "bugs", "update", bug_id, "--title", "first"]) == 0
+    append_partial_entry(ProjectJournal(filepath), version, bug_id)
+    assert main([filepath, "bugs", "update", bug_id, "--title", "second"]) == 0
+
+    bugs = ProjectFileHandler.load_project_full(filepath)["versions"][version]["bugs"]
+    assert bugs[bug_id]["title"] == "second"
+
+
+def test_own_pending_change_wins_over_earlier_foreign_entry(tmp_path):
+    filepath, _, version = write_project(tmp_path)
+    first = ProjectJournal(filepath)
+    second = ProjectJournal(filepath)
+    first.open_tail()
+    second.open_tail()
+
+    first.record_change(version, "bugs", "BUG-A", bug("BUG-A", "foreign"))
+    second.record_change(version, "bugs", "BUG-A", bug("BUG-A", "own"))
+
+    assert second.poll() == []
+    assert [entry["d"]["title"] for entry in first.poll()] == ["own"]
+    bugs = ProjectFileHandler.load_project_full(filepath)["versions"][version]["bugs"]
+    assert bugs["BUG-A"]["title"] == "own"
@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+from benchmarks.project_generator import ProjectGenerator
+from core.utils.project_file_handler import ProjectFileHandler
+from core.utils.project_journal import ProjectJournal
+from core.utils.project_stream_reader import ProjectStreamReader
+
+DOCUMENTS = [
+    '{}',
+    '{"meta": {"name": "a"}, "versions": {}}',
+    '{"schema":12345.678,"meta":{"name":"a"},"versions":{}}',
+    '{"a": 1.5e+10, "b": -0.25, "c": true, "d": null, "meta": {"n": 12345.678}}',
+    '{"versions": {"v1": {"bugs": {"b": {"x": "\\u00e9 é 中"}}}}, "meta": {"n": "é"}, "z": [1, 2]}',
+    '{"versions": 3, "meta": 12345}',
+    ' \n{ "meta" : { "name" : "spaced" } , "versions" : { } } \n',
+]
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_matches_json_load_for_every_chunk_size(tmp_path, document):
+    filepath = tmp_path / "project.bugtracker.json"
+    filepath.write_text(document, encoding="utf-8")
+
+    for chunk_bytes in range(1, len(document.encode("utf-8")) + 2):
+        assert ProjectStreamReader(filepath, chunk_bytes).read_meta() == json.loads(document).get("meta"), chunk_bytes
+
+
+def test_stops_reading_after_meta(tmp_path):
+    filepath = tmp_path / "project.bugtracker.json"
+    ProjectGenerator.for_records(200, 2, seed=7).write(str(filepath))
+    with open(filepath, encoding="utf-8") as f:
+        meta = json.load(f)["meta"]
+
+    reader = ProjectStreamReader(filepath, chunk_bytes=1024)
+
+    assert reader.read_meta() == meta
+    assert reader.read_bytes < filepath.stat().st_size // 10
+
+
+@pytest.mark.parametrize("document", ['', '{"a": 1', '{"a" 1}', '{"a": 1,}', '[1, 2]', '{"a": 12.}'])
+def test_rejects_invalid_documents(tmp_path, document):
+    filepath = tmp_path / "project.bugtracker.json"
+    filepath.write_text(document, encoding="utf-8")
+
+    for chunk_bytes in (1, 3, 1024):
+        with pytest.raises(ValueError):
+            ProjectStreamReader(filepath, chunk_bytes).read_meta()
+
+
+def test_load_project_reads_meta(tmp_path):
+    filepath = tmp_path / "project.bugtracker.json"
+    ProjectGenerator.for_records(20, 2).write(str(filepath))
+
+    project = ProjectFileHandler.load_project(str(filepath))
+
+    assert project.name == "Benchmark Project"
+    assert len(project.versions) == 2
+
+
+def test_load_project_takes_meta_from_the_journal(tmp_path):
+    filepath = tmp_path / "project.bugtracker.json"
+    project = ProjectGenerator.for_records(20, 1).write(str(filepath))
+    journal = ProjectJournal(str(filepath))
+    journal.record_change(project.versions[0], "bugs", "BUG-A", None)
+    project.add_version("v9.9.9")
+    journal.record_meta(project.to_dict())
+    journal.record_change(project.versions[0], "bugs", "BUG-B", None)
+
+    assert ProjectFileHandler.load_project(str(filepath)).versions == project.versions
+
+
+def test_full_load_reports_read_progress(tmp_path):
+    filepath = tmp_path / "project.bugtracker.json"
+    ProjectGenerator.for_records(20, 1).write(str(filepath))
+    calls = []
+
+    data = ProjectFileHandler.load_project_full(str(filepath), progress=lambda *args: calls.append(args))
+
+    size = filepath.stat().st_size
+    assert calls[-1] == ("read", size, size)
+    assert data == json.loads(filepath.read_text(encoding="utf-8"))
@@ -0,0 +1,67 @@
+import os
+import stat
+
+import pytest
+
+from benchmarks.project_generator import ProjectGenerator
+from core.managers.bug_manager import BugManager
+from core.utils.project_file_handler import ProjectFileHandler
+from core.utils.project_journal import ProjectJournal
+
+
+def write_project(tmp_path, records=20):
+    filepath = str(tmp_path / "project.bugtracker.json")
+    project = ProjectGenerator.for_records(records, 1, seed=3).write(filepath)
+    return filepath, project, project.versions[0]
+
+
+def test_snapshot_does_not_share_lists_with_live_records(tmp_path):
+    filepath, project, version = write_project(tmp_path)
+    project_data = ProjectFileHandler.load_project_full(filepath)
+    journal = ProjectJournal(filepath)
+    manager = BugManager(project_data, version, journal)
+    bug_id = next(iter(manager.bugs))
+    manager.add_comment(bug_id, "dev", "before")
+
+    snapshot = journal._snapshot(project, project_data)
+    comments = len(snapshot["versions"][version]["bugs"][bug_id]["comments"])
+    manager.add_comment(bug_id, "dev", "after")
+    project.add_version("v9.9.9")
+
+    assert len(snapshot["versions"][version]["bugs"][bug_id]["comments"]) == comments
+    assert "v9.9.9" not in snapshot["meta"]["versions"]
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+@pytest.mark.parametrize("mode", [0o644, 0o664, 0o600])
+def test_saves_keep_the_project_file_mode(tmp_path, mode):
+    filepath, project, version = write_project(tmp_path)
+    os.chmod(filepath, mode)
+    journal = ProjectJournal(filepath)
+    journal.record_change(version, "bugs", "BUG-A", None)
+
+    assert journal.compact(project, ProjectFileHandler.load_project_full(filepath))
+    assert stat.S_IMODE(os.stat(filepath).st_mode) == mode
+    assert ProjectFileHandler.save_project(project, filepath, {})
+    assert stat.S_IMODE(os.stat(filepath).st_mode) == mode
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+def test_new_project_files_follow_the_umask(tmp_path):
+    umask = os.umask(0o022)
+    try:
+        filepath, _, _ = write_project(tmp_path)
+    finally:
+        os.umask(umask)
+
+    assert stat.S_IMODE(os.stat(filepath).st_mode) == 0o644
+    assert [path.name for path in tmp_path.iterdir()] == ["project.bugtracker.json"]
+
+
+def test_replace_is_followed_by_a_directory_fsync(tmp_path, monkeypatch):
+    synced = []
+    monkeypatch.setattr(ProjectFileHandler, "_fsync_directory", staticmethod(synced.append))
+
+    write_project(tmp_path)
+
+    assert synced == [tmp_path]
@@ -0,0 +1,114 @@
+import asyncio
+import json
+
+import pytest
+
+from benchmarks.project_generator import ProjectGenerator
+from core.managers.project_session import ProjectSession
+from core.server import TrackerServer
+
+
+@pytest.fixture
+def project(tmp_path):
+    filepath = str(tmp_path / "project.bugtracker.json")
+    project = ProjectGenerator.for_records(20, 1, seed=9).write(filepath)
+    return filepath, project.versions[0]
+
+
+async def request(port, method, path, body=None):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    payload = b"" if body is None else json.dumps(body).encode("utf-8")
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n"
+        f"Content-Length: {len(payload)}\r\n\r\n".encode("latin-1") + payload
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+
+    head, _, data = response.partition(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    return status, json.loads(data) if data else None
+
+
+def run_requests(filepath, requests):
+    async def scenario():
+        server = TrackerServer(ProjectSession.open(filepath), port=0)
+        await server.start()
+        try:
+            return [await request(server.port, *args) for args in requests]
+        finally:
+            await server.close()
+
+    return asyncio.run(scenario())
+
+
+def test_get_and_patch_round_trip(project):
+    filepath, version = project
+    status, page = run_requests(filepath, [("GET", f"/versions/{version}/bugs?limit=1")])[0]
+    assert status == 200
+    bug_id = page["items"][0]["id"]
+
+    results = run_requests(filepath, [
+        ("PATCH", f"/versions/{version}/bugs/{bug_id}", {"title": "Patched", "status": "fixed"}),
+        ("GET", f"/versions/{version}/bugs?search=patched"),
+    ])
+
+    assert results[0][0] == 200
+    assert results[0][1]["status"] == "fixed"
+    assert [bug["id"] for bug in results[1][1]["items"]] == [bug_id]
+
+
+@pytest.mark.parametrize("method, path, body, message", [
+    ("PATCH", "bugs/{bug_id}", {"title": 5}, "title must be a string"),
+    ("PATCH", "bugs/{bug_id}", {"description": None}, "description must be a string"),
+    ("POST", "bugs", {"title": ["crash"]}, "title must be a string"),
+    ("POST", "bugs", {"title": "x", "task_id": 7}, "task_id must be a string"),
+    ("POST", "bugs/{bug_id}/comments", {"text": 3}, "text must be a string"),
+    ("PATCH", "tasks/{task_id}", {"test_instructions": {}}, "test_instructions must be a string"),
+    ("POST", "tasks", {"title": True}, "title must be a string"),
+])
+def test_non_string_text_fields_are_rejected(project, method, path, body, message):
+    filepath, version = project
+    bugs, tasks = run_requests(filepath, [
+        ("GET", f"/versions/{version}/bugs?limit=1"),
+        ("GET", f"/versions/{version}/tasks?limit=1"),
+    ])
+    path = path.format(bug_id=bugs[1]["items"][0]["id"], task_id=tasks[1]["items"][0]["id"])
+
+    results = run_requests(filepath, [
+        (method, f"/versions/{version}/{path}", body),
+        ("GET", f"/versions/{version}/bugs?search=a"),
+        ("GET", f"/versions/{version}/bugs?limit=0"),
+    ])
+
+    assert results[0] == (400, {"error": message})
+    assert results[1][0] == 200
+    assert results[2][1]["total"] == bugs[1]["total"]
+
+
+def test_server_and_a_second_session_see_each_other(project):
+    filepath, version = project
+
+    async def scenario():
+        server = TrackerServer(ProjectSession.open(filepath), port=0)
+        await server.start()
+        follower = ProjectSession.open(filepath)
+        try:
+            _, page = await request(server.port, "GET", f"/versions/{version}/bugs?limit=2")
+            first_id, second_id = [bug["id"] for bug in page["items"]]
+            await request(server.port, "PATCH", f"/versions/{version}/bugs/{first_id}", {"title": "From server"})
+            server.session.writer.wait_idle()
+            follower.sync()
+            _, bug_manager = follower.managers(version)
+            seen = bug_manager.get_bug(first_id).title
+
+            assert bug_manager.update_bug(second_id, title="From follower")
+            follower.writer.wait_idle()
+            _, bug = await request(server.port, "GET", f"/versions/{version}/bugs/{second_id}")
+            return seen, bug["title"]
+        finally:
+            follower.close()
+            await server.close()
+
+    assert asyncio.run(scenario()) == ("From server", "From follower")
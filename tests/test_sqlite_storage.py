@@ -0,0 +1,97 @@
+import json
+import sqlite3
+import threading
+
+from benchmarks.project_generator import ProjectGenerator
+from core.managers.project_session import ProjectSession
+from core.utils.project_file_handler import ProjectFileHandler
+from core.utils.project_journal import ProjectJournal
+from core.utils.sqlite_storage import SQLiteProjectStorage
+
+
+def write_project(tmp_path):
+    filepath = str(tmp_path / "project.bugtracker.db")
+    project = ProjectGenerator.for_records(30, 1, seed=4).write(filepath)
+    return filepath, project.versions[0]
+
+
+def stored_title(filepath, bug_id):
+    connection = sqlite3.connect(filepath)
+    try:
+        (data,) = connection.execute("SELECT data FROM bugs WHERE id = ?", (bug_id,)).fetchone()
+    finally:
+        connection.close()
+    return json.loads(data)["title"]
+
+
+def test_mutations_reach_the_database_on_the_writer_thread(tmp_path, monkeypatch):
+    filepath, version = write_project(tmp_path)
+    threads = []
+    apply_entries = SQLiteProjectStorage.apply_entries
+
+    def record_thread(storage, entries):
+        threads.append(threading.current_thread().name)
+        apply_entries(storage, entries)
+
+    monkeypatch.setattr(SQLiteProjectStorage, "apply_entries", record_thread)
+
+    session = ProjectSession.open(filepath)
+    _, bug_manager = session.managers(version)
+    bug_id = next(iter(bug_manager.bugs))
+    original = stored_title(filepath, bug_id)
+    assert bug_manager.update_bug(bug_id, title="Edited")
+    session.writer.wait_idle()
+
+    assert stored_title(filepath, bug_id) == original
+    assert session.journal.needs_compaction
+
+    job = session.journal.begin_save(session.project, session.project_data)
+    session.writer.submit(job)
+    session.writer.wait_idle()
+
+    assert threads == ["SaveWriter"]
+    assert stored_title(filepath, bug_id) == "Edited"
+    assert not ProjectJournal.path_for(filepath).exists()
+    session.close()
+
+
+def test_uncompacted_edits_are_replayed_on_open(tmp_path):
+    filepath, version = write_project(tmp_path)
+    session = ProjectSession.open(filepath)
+    _, bug_manager = session.managers(version)
+    bug_id = next(iter(bug_manager.bugs))
+    assert bug_manager.update_bug(bug_id, title="Journaled")
+    assert bug_manager.delete_bug(list(bug_manager.bugs)[1])
+    session.writer.wait_idle()
+    session.close()
+
+    data = ProjectFileHandler.load_project_full(filepath)
+
+    assert data["versions"][version]["bugs"][bug_id]["title"] == "Journaled"
+    assert len(data["versions"][version]["bugs"]) == len(bug_manager.bugs)
+
+
+def test_only_sqlite_files_are_treated_as_databases(tmp_path):
+    text_file = tmp_path / "notes.db"
+    text_file.write_text('{"meta": {}}', encoding='utf-8')
+    empty_file = tmp_path / "empty.db"
+    empty_file.touch()
+
+    assert SQLiteProjectStorage.is_storage_path(tmp_path / "new.bugtracker.db")
+    assert SQLiteProjectStorage.is_storage_path(empty_file)
+    assert not SQLiteProjectStorage.is_storage_path(text_file)
+    assert not SQLiteProjectStorage.is_storage_path(tmp_path / "project.bugtracker.json")
+
+
+def test_foreign_database_is_not_loaded_or_modified(tmp_path):
+    filepath = str(tmp_path / "other.db")
+    connection = sqlite3.connect(filepath)
+    connection.execute("CREATE TABLE notes (text TEXT)")
+    connection.close()
+
+    assert ProjectFileHandler.load_project(filepath) is None
+    assert ProjectFileHandler.load_project_full(filepath) is None
+    connection = sqlite3.connect(filepath)
+    tables = [name for (name,) in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+    connection.close()
+    assert tables == ["notes"]
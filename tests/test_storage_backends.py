@@ -0,0 +1,157 @@
+import pytest
+
+from benchmarks.project_generator import ProjectGenerator
+from core.managers.project_session import ProjectSession
+from core.models.bug import BugStatus
+from core.utils.project_file_handler import ProjectFileHandler
+from core.utils.project_journal import ProjectJournal
+from core.utils.project_lock import ProjectLock
+
+FORMATS = ["project.bugtracker.json", "project.bugtracker.db", "project.bugtracker"]
+
+
+def write_project(tmp_path, name, versions=2):
+    filepath = str(tmp_path / name)
+    generator = ProjectGenerator.for_records(40, versions, seed=11)
+    project = generator.write(filepath)
+    return filepath, project
+
+
+@pytest.mark.parametrize("name", FORMATS)
+def test_save_and_load_round_trip(tmp_path, name):
+    generator = ProjectGenerator.for_records(40, 2, seed=5)
+    project = generator.generate_project()
+    versions = {version: generator.generate_version(version) for version in project.versions}
+    filepath = str(tmp_path / name)
+
+    assert ProjectFileHandler.save_project(project, filepath, versions)
+
+    data = ProjectFileHandler.load_project_full(filepath)
+    assert data["meta"] == project.to_dict()
+    assert data["versions"] == versions
+    assert ProjectFileHandler.load_project(filepath).name == project.name
+
+
+def flush_and_close(session):
+    session.writer.wait_idle()
+    if session.journal.entry_count:
+        assert session.journal.compact(session.project, session.project_data)
+    session.close()
+
+
+@pytest.mark.parametrize("name", FORMATS)
+def test_session_edits_survive_reopen(tmp_path, name):
+    filepath, project = write_project(tmp_path, name)
+    version = project.versions[0]
+
+    session = ProjectSession.open(filepath)
+    task_manager, bug_manager = session.managers(version)
+    bug_id = next(iter(bug_manager.bugs))
+    deleted_id = list(bug_manager.bugs)[1]
+    task = task_manager.add_task("Added task")
+    assert bug_manager.update_bug(bug_id, status=BugStatus.FIXED, title="Edited")
+    assert bug_manager.add_comment(bug_id, "dev", "note")
+    assert bug_manager.delete_bug(deleted_id)
+    flush_and_close(session)
+
+    session = ProjectSession.open(filepath)
+    task_manager, bug_manager = session.managers(version)
+    assert bug_manager.get_bug(bug_id).title == "Edited"
+    assert bug_manager.get_bug(bug_id).status == BugStatus.FIXED
+    assert bug_manager.get_bug(bug_id).comments[-1]["text"] == "note"
+    assert bug_manager.get_bug(deleted_id) is None
+    assert task_manager.get_task(task.id).title == "Added task"
+    session.close()
+
+
+def test_sharded_session_loads_only_selected_version(tmp_path):
+    filepath, project = write_project(tmp_path, "project.bugtracker", versions=3)
+
+    session = ProjectSession.open(filepath)
+    session.managers(project.versions[1])
+    loaded = set(session.project_data["versions"])
+    session.close()
+
+    assert loaded == {project.versions[1]}
+
+
+@pytest.mark.parametrize("name", FORMATS)
+def test_second_session_follows_the_first(tmp_path, name):
+    filepath, project = write_project(tmp_path, name)
+    version = project.versions[0]
+
+    owner = ProjectSession.open(filepath)
+    follower = ProjectSession.open(filepath)
+    assert owner.is_owner and not follower.is_owner
+
+    owner_tasks, owner_bugs = owner.managers(version)
+    bug_id, other_id = list(owner_bugs.bugs)[:2]
+    assert owner_bugs.update_bug(bug_id, title="From owner")
+    owner.writer.wait_idle()
+    follower.sync()
+
+    _, follower_bugs = follower.managers(version)
+    events = []
+    follower_bugs.subscribe(events.append)
+    assert follower_bugs.get_bug(bug_id).title == "From owner"
+    assert owner_bugs.delete_bug(other_id)
+    owner.writer.wait_idle()
+    follower.sync()
+    assert follower_bugs.get_bug(other_id) is None
+    assert [event.record_id for event in events] == [other_id]
+
+    task = follower.managers(version)[0].add_task("From follower")
+    follower.writer.wait_idle()
+    owner.sync()
+    assert owner_tasks.get_task(task.id).title == "From follower"
+
+    follower.close()
+    flush_and_close(owner)
+
+    data = ProjectFileHandler.load_project_full(filepath)["versions"][version]
+    assert data["bugs"][bug_id]["title"] == "From owner"
+    assert other_id not in data["bugs"]
+    assert data["tasks"][task.id]["title"] == "From follower"
+    assert not ProjectJournal.path_for(owner.journal.filepath).exists()
+
+
+@pytest.mark.parametrize("name", FORMATS)
+def test_owner_compacts_only_without_followers(tmp_path, name):
+    filepath, project = write_project(tmp_path, name)
+    version = project.versions[0]
+
+    owner = ProjectSession.open(filepath)
+    follower = ProjectSession.open(filepath)
+    _, bug_manager = owner.managers(version)
+    bug_id = next(iter(bug_manager.bugs))
+    assert bug_manager.update_bug(bug_id, title="Pending")
+    owner.writer.wait_idle()
+    owner.journal.entry_count = ProjectJournal.COMPACT_THRESHOLD
+
+    assert not owner.journal.needs_compaction
+    assert owner.journal.compact(owner.project, owner.project_data)
+    assert ProjectJournal.path_for(owner.journal.filepath).exists()
+
+    follower.close()
+    assert owner.journal.needs_compaction
+    flush_and_close(owner)
+    assert not ProjectJournal.path_for(owner.journal.filepath).exists()
+    assert ProjectFileHandler.load_project_full(filepath)["versions"][version]["bugs"][bug_id]["title"] == "Pending"
+
+
+def test_follower_takes_over_when_the_owner_closes(tmp_path):
+    filepath, project = write_project(tmp_path, "project.bugtracker.json")
+
+    owner = ProjectSession.open(filepath)
+    follower = ProjectSession.open(filepath)
+    assert ProjectLock.session_paths(filepath)
+    follower.sync()
+    assert not follower.is_owner
+
+    owner.close()
+    follower.sync()
+
+    assert follower.is_owner
+    assert not ProjectLock.session_paths(filepath)
+    follower.close()
+    assert not ProjectLock.path_for(filepath).exists()